@@ -1,9 +1,12 @@
 import logging
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ...core.cache import get_from_cache_or_fetch, invalidate_cache
+from ...core.bloom import is_known_missing
+from ...core.deadline import request_deadline
+from ...core.response_cache import cached_json_response
 from ...schemas.anime import AnimeDetail
+from ...services.scraper import BaseScraper
 from ...services.scraper_factory import ScraperFactory
 from ...utils.anime_detail_validator import validate_anime_detail
 
@@ -11,29 +14,10 @@ router = APIRouter()
 logger = logging.getLogger("app.api.endpoints.anime_detail")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def get_anime_detail(anime_slug: str = Query(..., description="Anime slug"), force_refresh: bool = False):
+def _build_anime_detail_response(raw_result: Any, anime_slug: str) -> Dict[str, Any]:
     """
-    Get anime details.
-    
-    Args:
-        anime_slug: Anime slug
-        force_refresh: Force refresh cache (optional, default: False)
+    Validate raw anime details into the response payload.
     """
-    scraper = ScraperFactory.get_default_scraper()
-    if not scraper:
-        raise HTTPException(status_code=503, detail="No active scraper available")
-    
-    cache_key = f"anime_detail_{anime_slug}"
-    
-    # Invalidate cache if force_refresh is True
-    if force_refresh:
-        logger.info(f"Force refresh cache untuk anime_detail_{anime_slug}")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.get_anime_details, anime_slug)
-    
     if not raw_result:
         raise HTTPException(status_code=404, detail=f"Anime with slug '{anime_slug}' not found")
     
@@ -50,4 +34,47 @@ async def get_anime_detail(anime_slug: str = Query(..., description="Anime slug"
         return validated_result
     else:
         logger.error("Data mentah bukan dictionary, tidak dapat divalidasi")
-        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
+
+
+async def _fetch_anime_detail(scraper: BaseScraper, anime_slug: str, force_refresh: bool) -> Dict[str, Any]:
+    """
+    Fetch raw anime details, skipping the upstream request for known 404s.
+    """
+    if not force_refresh and is_known_missing("anime", anime_slug):
+        logger.info(f"Anime slug diketahui tidak ada, scraping dilewati: {anime_slug}")
+        return {}
+    return await scraper.aget_anime_details(anime_slug)
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def get_anime_detail(request: Request, anime_slug: str = Query(..., description="Anime slug"), force_refresh: bool = False):
+    """
+    Get anime details.
+    
+    Args:
+        anime_slug: Anime slug
+        force_refresh: Force refresh cache (optional, default: False)
+    """
+    scraper = ScraperFactory.get_default_scraper()
+    if not scraper:
+        raise HTTPException(status_code=503, detail="No active scraper available")
+    
+    cache_key = f"anime_detail_{anime_slug}"
+    
+    # Invalidate cache if force_refresh is True
+    if force_refresh:
+        logger.info(f"Force refresh cache untuk anime_detail_{anime_slug}")
+    
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("anime_detail"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            lambda raw_result: _build_anime_detail_response(raw_result, anime_slug),
+            _fetch_anime_detail,
+            scraper,
+            anime_slug,
+            force_refresh,
+            force_refresh=force_refresh,
+        )
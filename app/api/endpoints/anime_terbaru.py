@@ -1,8 +1,9 @@
 import logging
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ...core.cache import get_from_cache_or_fetch, invalidate_cache
+from ...core.deadline import request_deadline
+from ...core.response_cache import cached_json_response
 from ...schemas.anime import AnimeTerbaru
 from ...services.scraper_factory import ScraperFactory
 from ...utils.anime_terbaru_validator import validate_anime_terbaru_data
@@ -11,29 +12,10 @@ router = APIRouter()
 logger = logging.getLogger("app.api.endpoints.anime_terbaru")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def get_anime_terbaru(page: int = Query(1, ge=1, description="Page number"), force_refresh: bool = False):
+def _build_anime_terbaru_response(raw_result: Any) -> Dict[str, Any]:
     """
-    Get latest anime episodes.
-    
-    Args:
-        page: Page number (default: 1)
-        force_refresh: Force refresh cache (optional, default: False)
+    Validate a raw latest anime list into the response payload.
     """
-    scraper = ScraperFactory.get_default_scraper()
-    if not scraper:
-        raise HTTPException(status_code=503, detail="No active scraper available")
-    
-    cache_key = f"anime_terbaru_page_{page}"
-    
-    # Invalidate cache if force_refresh is True
-    if force_refresh:
-        logger.info(f"Force refresh cache untuk anime_terbaru_page_{page}")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.get_anime_terbaru, page)
-    
     if not raw_result:
         raise HTTPException(status_code=500, detail="Failed to get latest anime data")
     
@@ -53,4 +35,35 @@ async def get_anime_terbaru(page: int = Query(1, ge=1, description="Page number"
         return validated_result
     else:
         logger.error("Data mentah bukan list, tidak dapat divalidasi")
-        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def get_anime_terbaru(request: Request, page: int = Query(1, ge=1, description="Page number"), force_refresh: bool = False):
+    """
+    Get latest anime episodes.
+    
+    Args:
+        page: Page number (default: 1)
+        force_refresh: Force refresh cache (optional, default: False)
+    """
+    scraper = ScraperFactory.get_default_scraper()
+    if not scraper:
+        raise HTTPException(status_code=503, detail="No active scraper available")
+    
+    cache_key = f"anime_terbaru_page_{page}"
+    
+    # Invalidate cache if force_refresh is True
+    if force_refresh:
+        logger.info(f"Force refresh cache untuk anime_terbaru_page_{page}")
+    
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("anime_terbaru"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            _build_anime_terbaru_response,
+            scraper.aget_anime_terbaru,
+            page,
+            force_refresh=force_refresh,
+        )
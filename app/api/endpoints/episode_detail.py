@@ -1,9 +1,12 @@
 import logging
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ...core.cache import get_from_cache_or_fetch, invalidate_cache
+from ...core.bloom import is_known_missing
+from ...core.deadline import request_deadline
+from ...core.response_cache import cached_json_response
 from ...schemas.anime import EpisodeDetail
+from ...services.scraper import BaseScraper
 from ...services.scraper_factory import ScraperFactory
 from ...utils.episode_detail_validator import validate_episode_detail
 
@@ -11,29 +14,10 @@ router = APIRouter()
 logger = logging.getLogger("app.api.endpoints.episode_detail")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def get_episode_detail(episode_url: str = Query(..., description="Episode URL"), force_refresh: bool = False):
+def _build_episode_detail_response(raw_result: Any, episode_url: str) -> Dict[str, Any]:
     """
-    Get episode details.
-    
-    Args:
-        episode_url: Episode URL
-        force_refresh: Force refresh cache (optional, default: False)
+    Validate raw episode details into the response payload.
     """
-    scraper = ScraperFactory.get_default_scraper()
-    if not scraper:
-        raise HTTPException(status_code=503, detail="No active scraper available")
-    
-    cache_key = f"episode_detail_{episode_url}"
-    
-    # Invalidate cache if force_refresh is True
-    if force_refresh:
-        logger.info(f"Force refresh cache untuk episode_detail_{episode_url}")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.get_episode_details, episode_url)
-    
     if not raw_result:
         raise HTTPException(status_code=404, detail=f"Episode with URL '{episode_url}' not found")
     
@@ -50,4 +34,47 @@ async def get_episode_detail(episode_url: str = Query(..., description="Episode
         return validated_result
     else:
         logger.error("Data mentah bukan dictionary, tidak dapat divalidasi")
-        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
+
+
+async def _fetch_episode_detail(scraper: BaseScraper, episode_url: str, force_refresh: bool) -> Dict[str, Any]:
+    """
+    Fetch raw episode details, skipping the upstream request for known 404s.
+    """
+    if not force_refresh and is_known_missing("episode", episode_url):
+        logger.info(f"Episode URL diketahui tidak ada, scraping dilewati: {episode_url}")
+        return {}
+    return await scraper.aget_episode_details(episode_url)
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def get_episode_detail(request: Request, episode_url: str = Query(..., description="Episode URL"), force_refresh: bool = False):
+    """
+    Get episode details.
+    
+    Args:
+        episode_url: Episode URL
+        force_refresh: Force refresh cache (optional, default: False)
+    """
+    scraper = ScraperFactory.get_default_scraper()
+    if not scraper:
+        raise HTTPException(status_code=503, detail="No active scraper available")
+    
+    cache_key = f"episode_detail_{episode_url}"
+    
+    # Invalidate cache if force_refresh is True
+    if force_refresh:
+        logger.info(f"Force refresh cache untuk episode_detail_{episode_url}")
+    
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("episode_detail"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            lambda raw_result: _build_episode_detail_response(raw_result, episode_url),
+            _fetch_episode_detail,
+            scraper,
+            episode_url,
+            force_refresh,
+            force_refresh=force_refresh,
+        )
@@ -1,8 +1,9 @@
 import logging
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ...core.cache import get_from_cache_or_fetch, invalidate_cache
+from ...core.deadline import request_deadline
+from ...core.response_cache import cached_json_response
 from ...schemas.anime import HomeData
 from ...services.scraper_factory import ScraperFactory
 from ...utils.validator import validate_home_data
@@ -11,28 +12,10 @@ router = APIRouter()
 logger = logging.getLogger("app.api.endpoints.home")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def get_home_data(force_refresh: bool = False):
+def _build_home_response(raw_result: Any) -> Dict[str, Any]:
     """
-    Get home page data.
-    
-    Args:
-        force_refresh: Force refresh cache (optional, default: False)
+    Validate raw home data into the response payload.
     """
-    scraper = ScraperFactory.get_default_scraper()
-    if not scraper:
-        raise HTTPException(status_code=503, detail="No active scraper available")
-    
-    cache_key = "home_data"
-    
-    # Invalidate cache if force_refresh is True
-    if force_refresh:
-        logger.info("Force refresh cache untuk home_data")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.get_home_data)
-    
     if not raw_result:
         raise HTTPException(status_code=500, detail="Failed to get home page data")
     
@@ -71,4 +54,33 @@ async def get_home_data(force_refresh: bool = False):
     logger.info(f"Jumlah item valid - movies: {len(validated_result['movies'])}")
     logger.info(f"Jumlah hari valid - jadwal_rilis: {len(validated_result['jadwal_rilis'])}")
     
-    return validated_result
\ No newline at end of file
+    return validated_result
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def get_home_data(request: Request, force_refresh: bool = False):
+    """
+    Get home page data.
+    
+    Args:
+        force_refresh: Force refresh cache (optional, default: False)
+    """
+    scraper = ScraperFactory.get_default_scraper()
+    if not scraper:
+        raise HTTPException(status_code=503, detail="No active scraper available")
+    
+    cache_key = "home_data"
+    
+    # Invalidate cache if force_refresh is True
+    if force_refresh:
+        logger.info("Force refresh cache untuk home_data")
+    
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("home"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            _build_home_response,
+            scraper.aget_home_data,
+            force_refresh=force_refresh,
+        )
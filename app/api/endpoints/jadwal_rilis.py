@@ -1,8 +1,9 @@
 import logging
 from typing import Dict, List, Optional, Union, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ...core.cache import get_from_cache_or_fetch, invalidate_cache
+from ...core.deadline import request_deadline
+from ...core.response_cache import cached_json_response
 from ...schemas.anime import AnimeSchedule, AnimeScheduleItem
 from ...services.scraper_factory import ScraperFactory
 from ...utils.jadwal_validator import validate_jadwal_all_data, validate_jadwal_data
@@ -11,28 +12,10 @@ router = APIRouter()
 logger = logging.getLogger("app.api.endpoints.jadwal_rilis")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def get_jadwal_rilis_all(force_refresh: bool = False):
+def _build_jadwal_all_response(raw_result: Any) -> Dict[str, Any]:
     """
-    Get release schedule for all days.
-    
-    Args:
-        force_refresh: Force refresh cache (optional, default: False)
+    Validate the raw schedule for all days into the response payload.
     """
-    scraper = ScraperFactory.get_default_scraper()
-    if not scraper:
-        raise HTTPException(status_code=503, detail="No active scraper available")
-    
-    cache_key = "jadwal_rilis_all"
-    
-    # Invalidate cache if force_refresh is True
-    if force_refresh:
-        logger.info("Force refresh cache untuk jadwal_rilis_all")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.get_jadwal_rilis)
-    
     if not raw_result:
         raise HTTPException(status_code=500, detail="Failed to get release schedule data")
     
@@ -63,8 +46,64 @@ async def get_jadwal_rilis_all(force_refresh: bool = False):
     return validated_result
 
 
+def _build_jadwal_day_response(raw_result: Any) -> Dict[str, Any]:
+    """
+    Validate the raw schedule for one day into the response payload.
+    """
+    if not raw_result:
+        raise HTTPException(status_code=500, detail="Failed to get release schedule data")
+    
+    # Log data mentah untuk debugging
+    if isinstance(raw_result, list):
+        logger.info(f"Data mentah dari scraper: {len(raw_result)} item")
+        if raw_result:
+            logger.info(f"Contoh item jadwal: {raw_result[0]}")
+        
+        # Validasi data sebelum mengembalikan respons
+        validated_result = validate_jadwal_data(raw_result)
+    else:
+        logger.error("Data mentah bukan list, tidak dapat divalidasi")
+        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
+    
+    # Log hasil validasi
+    logger.info(f"Confidence score: {validated_result['confidence_score']}")
+    logger.info(f"Jumlah item valid: {len(validated_result['data'])}")
+    
+    return validated_result
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def get_jadwal_rilis_all(request: Request, force_refresh: bool = False):
+    """
+    Get release schedule for all days.
+    
+    Args:
+        force_refresh: Force refresh cache (optional, default: False)
+    """
+    scraper = ScraperFactory.get_default_scraper()
+    if not scraper:
+        raise HTTPException(status_code=503, detail="No active scraper available")
+    
+    cache_key = "jadwal_rilis_all"
+    
+    # Invalidate cache if force_refresh is True
+    if force_refresh:
+        logger.info("Force refresh cache untuk jadwal_rilis_all")
+    
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("jadwal_rilis"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            _build_jadwal_all_response,
+            scraper.aget_jadwal_rilis,
+            force_refresh=force_refresh,
+        )
+
+
+
 @router.get("/{day}", response_model=Dict[str, Any])
-async def get_jadwal_rilis_by_day(day: str, force_refresh: bool = False):
+async def get_jadwal_rilis_by_day(request: Request, day: str, force_refresh: bool = False):
     """
     Get release schedule for a specific day.
     
@@ -86,28 +125,15 @@ async def get_jadwal_rilis_by_day(day: str, force_refresh: bool = False):
     # Invalidate cache if force_refresh is True
     if force_refresh:
         logger.info(f"Force refresh cache untuk jadwal_rilis_{day.lower()}")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.get_jadwal_rilis, day.lower())
-    
-    if not raw_result:
-        raise HTTPException(status_code=500, detail="Failed to get release schedule data")
-    
-    # Log data mentah untuk debugging
-    if isinstance(raw_result, list):
-        logger.info(f"Data mentah dari scraper: {len(raw_result)} item")
-        if raw_result:
-            logger.info(f"Contoh item jadwal: {raw_result[0]}")
-        
-        # Validasi data sebelum mengembalikan respons
-        validated_result = validate_jadwal_data(raw_result)
-    else:
-        logger.error("Data mentah bukan list, tidak dapat divalidasi")
-        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
-    
-    # Log hasil validasi
-    logger.info(f"Confidence score: {validated_result['confidence_score']}")
-    logger.info(f"Jumlah item valid: {len(validated_result['data'])}")
     
-    return validated_result
\ No newline at end of file
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("jadwal_rilis"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            _build_jadwal_day_response,
+            scraper.aget_jadwal_rilis,
+            day.lower(),
+            force_refresh=force_refresh,
+        )
+    
\ No newline at end of file
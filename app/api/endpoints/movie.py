@@ -1,8 +1,9 @@
 import logging
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ...core.cache import get_from_cache_or_fetch, invalidate_cache
+from ...core.deadline import request_deadline
+from ...core.response_cache import cached_json_response
 from ...schemas.anime import AnimeMovie
 from ...services.scraper_factory import ScraperFactory
 from ...utils.movie_validator import validate_movie_data
@@ -11,29 +12,10 @@ router = APIRouter()
 logger = logging.getLogger("app.api.endpoints.movie")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def get_movie_list(page: int = Query(1, ge=1, description="Page number"), force_refresh: bool = False):
+def _build_movie_response(raw_result: Any) -> Dict[str, Any]:
     """
-    Get anime movie list.
-    
-    Args:
-        page: Page number (default: 1)
-        force_refresh: Force refresh cache (optional, default: False)
+    Validate a raw movie list into the response payload.
     """
-    scraper = ScraperFactory.get_default_scraper()
-    if not scraper:
-        raise HTTPException(status_code=503, detail="No active scraper available")
-    
-    cache_key = f"movie_list_page_{page}"
-    
-    # Invalidate cache if force_refresh is True
-    if force_refresh:
-        logger.info(f"Force refresh cache untuk movie_list_page_{page}")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.get_movie_list, page)
-    
     if not raw_result:
         raise HTTPException(status_code=500, detail="Failed to get movie list data")
     
@@ -53,4 +35,35 @@ async def get_movie_list(page: int = Query(1, ge=1, description="Page number"),
         return validated_result
     else:
         logger.error("Data mentah bukan list, tidak dapat divalidasi")
-        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def get_movie_list(request: Request, page: int = Query(1, ge=1, description="Page number"), force_refresh: bool = False):
+    """
+    Get anime movie list.
+    
+    Args:
+        page: Page number (default: 1)
+        force_refresh: Force refresh cache (optional, default: False)
+    """
+    scraper = ScraperFactory.get_default_scraper()
+    if not scraper:
+        raise HTTPException(status_code=503, detail="No active scraper available")
+    
+    cache_key = f"movie_list_page_{page}"
+    
+    # Invalidate cache if force_refresh is True
+    if force_refresh:
+        logger.info(f"Force refresh cache untuk movie_list_page_{page}")
+    
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("movie"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            _build_movie_response,
+            scraper.aget_movie_list,
+            page,
+            force_refresh=force_refresh,
+        )
@@ -1,8 +1,9 @@
 import logging
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ...core.cache import get_from_cache_or_fetch, invalidate_cache
+from ...core.deadline import request_deadline
+from ...core.response_cache import cached_json_response
 from ...schemas.anime import AnimeSearch
 from ...services.scraper_factory import ScraperFactory
 from ...utils.search_validator import validate_search_data
@@ -11,32 +12,10 @@ router = APIRouter()
 logger = logging.getLogger("app.api.endpoints.search")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def search_anime(query: str = Query(..., description="Search query"), force_refresh: bool = False):
+def _build_search_response(raw_result: Any) -> Dict[str, Any]:
     """
-    Search for anime.
-    
-    Args:
-        query: Search query
-        force_refresh: Force refresh cache (optional, default: False)
+    Validate raw search results into the response payload.
     """
-    if not query:
-        raise HTTPException(status_code=400, detail="Query parameter cannot be empty")
-    
-    scraper = ScraperFactory.get_default_scraper()
-    if not scraper:
-        raise HTTPException(status_code=503, detail="No active scraper available")
-    
-    cache_key = f"search_{query}"
-    
-    # Invalidate cache if force_refresh is True
-    if force_refresh:
-        logger.info(f"Force refresh cache untuk search_{query}")
-        invalidate_cache(cache_key)
-    
-    # Ambil data dari cache atau fetch baru
-    raw_result = get_from_cache_or_fetch(cache_key, scraper.search, query)
-    
     if not raw_result:
         raise HTTPException(status_code=500, detail="Failed to get search data")
     
@@ -56,4 +35,38 @@ async def search_anime(query: str = Query(..., description="Search query"), forc
         return validated_result
     else:
         logger.error("Data mentah bukan list, tidak dapat divalidasi")
-        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Invalid data format from scraper")
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def search_anime(request: Request, query: str = Query(..., description="Search query"), force_refresh: bool = False):
+    """
+    Search for anime.
+    
+    Args:
+        query: Search query
+        force_refresh: Force refresh cache (optional, default: False)
+    """
+    if not query:
+        raise HTTPException(status_code=400, detail="Query parameter cannot be empty")
+    
+    scraper = ScraperFactory.get_default_scraper()
+    if not scraper:
+        raise HTTPException(status_code=503, detail="No active scraper available")
+    
+    cache_key = f"search_{query}"
+    
+    # Invalidate cache if force_refresh is True
+    if force_refresh:
+        logger.info(f"Force refresh cache untuk search_{query}")
+    
+    # Ambil response dari cache atau fetch dan validasi baru, dalam budget waktu endpoint
+    with request_deadline("search"):
+        return await cached_json_response(
+            request,
+            cache_key,
+            _build_search_response,
+            scraper.asearch,
+            query,
+            force_refresh=force_refresh,
+        )
@@ -0,0 +1,123 @@
+import hashlib
+import math
+import threading
+import time
+from typing import Iterator
+
+from .config import settings
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+    
+    Membership tests can return false positives at roughly error_rate once
+    capacity items were added, but never false negatives.
+    """
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: posisi ke-i = h1 + i * h2
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+    
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RotatingBloomFilter:
+    """
+    Bloom filter whose items expire by rotating between two generations.
+    
+    New items go into the current generation and lookups check both. The
+    previous generation is dropped every rotate_seconds, or when the current
+    one reaches capacity, so an item is remembered for one to two periods.
+    """
+    def __init__(self, capacity: int, error_rate: float, rotate_seconds: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rotate_seconds = rotate_seconds
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _maybe_rotate(self) -> None:
+        if time.monotonic() - self._rotated_at >= self.rotate_seconds or self._current.count >= self.capacity:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = time.monotonic()
+    
+    def add(self, item: str) -> None:
+        with self._lock:
+            self._maybe_rotate()
+            self._current.add(item)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._previous = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = time.monotonic()
+    
+    def __contains__(self, item: str) -> bool:
+        with self._lock:
+            self._maybe_rotate()
+            return item in self._current or item in self._previous
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "items": self._current.count + self._previous.count,
+                "capacity": self.capacity,
+                "error_rate": self.error_rate,
+                "bits": self._current.size,
+                "hashes": self._current.hash_count,
+            }
+
+
+# Resource upstream yang diketahui tidak ada (404), per proses
+known_missing = RotatingBloomFilter(
+    capacity=settings.NEGATIVE_BLOOM_CAPACITY,
+    error_rate=settings.NEGATIVE_BLOOM_ERROR_RATE,
+    rotate_seconds=settings.NEGATIVE_BLOOM_ROTATE_SECONDS,
+)
+
+
+def mark_missing(kind: str, value: str) -> None:
+    """
+    Remember that an upstream resource does not exist.
+    
+    Args:
+        kind: Resource kind, e.g. "anime" or "episode"
+        value: Resource identifier (slug or URL)
+    """
+    known_missing.add(f"{kind}:{value}")
+
+
+def is_known_missing(kind: str, value: str) -> bool:
+    """
+    Check whether an upstream resource is known not to exist.
+    
+    May return a false positive at about settings.NEGATIVE_BLOOM_ERROR_RATE.
+    
+    Args:
+        kind: Resource kind, e.g. "anime" or "episode"
+        value: Resource identifier (slug or URL)
+    
+    Returns:
+        True if the resource was recently marked missing
+    """
+    return f"{kind}:{value}" in known_missing
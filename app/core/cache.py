@@ -1,12 +1,217 @@
+import asyncio
+import contextvars
+import threading
 import time
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, TypeVar, Union
 
+from .cache_backends import CacheBackend, CacheEntry, MemoryBackend, RedisBackend, TieredBackend
+from .cache_policy import describe_policies, get_cache_policy
+from .circuit_breaker import CircuitOpenError
 from .config import settings
+from .deadline import DeadlineExceeded, partial_scope, remaining
+from .executors import get_blocking_executor, run_blocking
+from .lru import BoundedCache, estimate_size
+from .revalidation import NotModified, Validators, collecting_validators, revalidating
+from .singleflight import SingleFlight
 
 T = TypeVar("T")
 
-# Simple in-memory cache
-cache: Dict[str, Dict[str, Any]] = {}
+# In-memory cache, dibatasi jumlah entry dan perkiraan ukuran (LRU)
+cache = BoundedCache(max_entries=settings.CACHE_MAX_ENTRIES, max_bytes=settings.CACHE_MAX_BYTES)
+
+# Backend yang dipakai oleh API async, dipilih lewat settings.CACHE_BACKEND
+_backend: Optional[CacheBackend] = None
+
+# Statistik stale-while-revalidate
+_swr_stats: Dict[str, int] = {"stale_hits": 0, "refreshes": 0, "refresh_errors": 0, "last_good_hits": 0, "not_modified": 0}
+# Jumlah hasil fetch yang tidak disimpan karena melebihi max_size policy
+_oversized_skips = 0
+# Statistik cache negatif (hasil kosong disimpan dengan TTL pendek)
+_negative_stats: Dict[str, int] = {"negative_hits": 0, "negative_stores": 0}
+# Key yang sedang di-refresh di background, maksimal satu refresh per key
+_refreshing: Set[str] = set()
+_refreshing_lock = threading.Lock()
+# Simpan referensi task refresh agar tidak di-garbage-collect
+_refresh_tasks: Set[asyncio.Task] = set()
+
+# Fetch yang sedang berjalan per key, dibagi oleh thread dan task asyncio
+_flights = SingleFlight()
+
+
+def get_cache_backend() -> CacheBackend:
+    """
+    Get the configured cache backend, creating it on first use.
+    
+    Returns:
+        TieredBackend (L1 memory + L2 Redis) or RedisBackend if
+        settings.CACHE_BACKEND is "redis", otherwise a MemoryBackend over
+        the module-level cache dict
+    """
+    global _backend
+    if _backend is None:
+        if settings.CACHE_BACKEND == "redis" and settings.CACHE_L1_ENABLED:
+            l1 = MemoryBackend(BoundedCache(max_entries=settings.CACHE_L1_MAX_ENTRIES, max_bytes=settings.CACHE_L1_MAX_BYTES))
+            _backend = TieredBackend(l1, RedisBackend())
+        elif settings.CACHE_BACKEND == "redis":
+            _backend = RedisBackend()
+        else:
+            _backend = MemoryBackend(cache)
+        print(f"Cache backend: {_backend.name}")
+    return _backend
+
+
+def set_cache_backend(backend: Optional[CacheBackend]) -> None:
+    """
+    Replace the cache backend (None resets to the configured default).
+    
+    Args:
+        backend: Cache backend instance
+    """
+    global _backend
+    _backend = backend
+
+
+async def start_cache_backend() -> None:
+    """
+    Start the cache backend's background tasks. Called from the application lifespan.
+    """
+    await get_cache_backend().start()
+
+
+async def close_cache_backend() -> None:
+    """
+    Close the cache backend. Called from the application lifespan.
+    """
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+def _record(stats: Dict[str, int], stat: str) -> None:
+    with _refreshing_lock:
+        stats[stat] += 1
+
+
+def _is_empty(data: Any) -> bool:
+    # Hasil gagal/kosong: falsy, atau dict yang semua isinya kosong (mis. jadwal tanpa item di semua hari)
+    if isinstance(data, dict):
+        return all(_is_empty(value) for value in data.values())
+    return not data
+
+
+def _negative_ttl(key: str, cache_ttl: int) -> int:
+    return min(get_cache_policy(key).negative_ttl, cache_ttl)
+
+
+def _is_fresh(key: str, entry: CacheEntry, cache_ttl: int, now: float) -> bool:
+    # Hasil kosong hanya dianggap segar selama negative_ttl
+    fresh_for = _negative_ttl(key, cache_ttl) if _is_empty(entry["data"]) else cache_ttl
+    return (now - entry["timestamp"]) < fresh_for
+
+
+def _lifetime(key: str, data: Any, cache_ttl: int, grace: int) -> int:
+    if not _is_empty(data):
+        return cache_ttl + grace
+    _record(_negative_stats, "negative_stores")
+    return _negative_ttl(key, cache_ttl)
+
+
+def _last_good_key(key: str) -> str:
+    # Salinan terakhir yang tidak kosong, disajikan saat circuit breaker terbuka
+    return f"last_good:{key}"
+
+
+def _claim_refresh(key: str) -> bool:
+    with _refreshing_lock:
+        if key in _refreshing:
+            return False
+        _refreshing.add(key)
+        return True
+
+
+def _release_refresh(key: str) -> None:
+    with _refreshing_lock:
+        _refreshing.discard(key)
+
+
+def _revalidation_base(key: str, stale: Optional[CacheEntry]) -> Optional[CacheEntry]:
+    # Hanya refresh data yang tidak kosong dari family satu halaman yang boleh berakhir 304,
+    # dengan validators dari response yang menghasilkan data tersebut
+    if stale is None or _is_empty(stale["data"]) or not stale.get("validators") or not get_cache_policy(key).revalidate:
+        return None
+    return stale
+
+
+def _fetched_entry(key: str, fetch_time: float, data: Any, validators: Validators) -> CacheEntry:
+    entry = {"timestamp": fetch_time, "data": data}
+    if validators and not _is_empty(data) and get_cache_policy(key).revalidate:
+        entry["validators"] = dict(validators)
+    return entry
+
+
+def _not_modified(key: str, stale: CacheEntry) -> Any:
+    print(f"NOT MODIFIED: Halaman upstream tidak berubah, TTL diperpanjang untuk key: {key}")
+    _record(_swr_stats, "not_modified")
+    return stale["data"]
+
+
+def _partial(key: str, entry: CacheEntry) -> CacheEntry:
+    # Hasil yang terpotong deadline request disajikan tapi tidak disimpan
+    print(f"PARTIAL: Deadline request habis, hasil untuk key {key} tidak disimpan")
+    return {**entry, "partial": True}
+
+
+def _fill(key: str, fetch_func: Callable[..., T], args: tuple, kwargs: dict, cache_ttl: int, grace: int, keep_stale: bool = False) -> CacheEntry:
+    # Mengembalikan entry seperti _afill karena keduanya berbagi _flights per key
+    fetch_time = time.time()
+    stale = _revalidation_base(key, cache.get(key)) if keep_stale else None
+    with partial_scope() as scope, collecting_validators() as validators:
+        if stale is None:
+            data = fetch_func(*args, **kwargs)
+        else:
+            try:
+                with revalidating(stale["validators"]):
+                    data = fetch_func(*args, **kwargs)
+            except NotModified:
+                data = _not_modified(key, stale)
+                validators = stale["validators"]
+    entry = _fetched_entry(key, fetch_time, data, validators)
+    if scope is not None and scope.partial:
+        return _partial(key, entry)
+    # Refresh yang gagal (hasil kosong) tidak menimpa data stale yang masih valid
+    if keep_stale and _is_empty(data):
+        return entry
+    if _should_store(key, data):
+        cache[key] = {**entry, "expires_at": fetch_time + _lifetime(key, data, cache_ttl, grace)}
+        if not _is_empty(data) and settings.CACHE_LAST_GOOD_TTL > 0:
+            cache[_last_good_key(key)] = {"timestamp": fetch_time, "data": data, "expires_at": fetch_time + settings.CACHE_LAST_GOOD_TTL}
+    return entry
+
+
+def _should_store(key: str, data: Any) -> bool:
+    global _oversized_skips
+    if data is None:
+        return False
+    max_size = get_cache_policy(key).max_size
+    if max_size is not None and estimate_size(data) > max_size:
+        with _refreshing_lock:
+            _oversized_skips += 1
+        print(f"Data untuk {key} melebihi max_size policy ({max_size} bytes), tidak disimpan")
+        return False
+    return True
+
+
+def _refresh_in_background(key: str, fetch_func: Callable[..., T], args: tuple, kwargs: dict, cache_ttl: int, grace: int) -> None:
+    try:
+        entry = _flights.do(key, _fill, key, fetch_func, args, kwargs, cache_ttl, grace, keep_stale=True)
+        _record(_swr_stats, "refresh_errors" if _is_empty(entry["data"]) else "refreshes")
+    except Exception as e:
+        # Data stale tetap disajikan sampai grace window habis
+        _record(_swr_stats, "refresh_errors")
+        print(f"Refresh background gagal untuk {key}, tetap menyajikan data stale: {e}")
+    finally:
+        _release_refresh(key)
 
 
 def get_from_cache_or_fetch(
@@ -14,33 +219,291 @@ def get_from_cache_or_fetch(
     fetch_func: Callable[..., T], 
     *args, 
     ttl: Optional[int] = None, 
+    grace: Optional[int] = None, 
     **kwargs
 ) -> T:
     """
     Get data from cache or fetch it using the provided function.
     
+    Data older than ttl but still inside the grace window is returned
+    immediately while a single background refresh repopulates the key.
+    Empty results are cached for the policy's short negative_ttl only.
+    Concurrent misses for the same key share a single fetch. If the fetch
+    fails because the upstream circuit breaker is open or the request
+    deadline ran out, the last non-empty result (kept for
+    settings.CACHE_LAST_GOOD_TTL) is returned instead. Results cut short
+    by the request deadline are returned but not cached.
+    Families whose policy sets revalidate keep the upstream ETag and
+    Last-Modified in the cached entry and refresh with a conditional GET;
+    a 304 keeps the cached result for another ttl without re-parsing.
+    
     Args:
         key: Cache key
         fetch_func: Function to fetch data if not in cache
-        ttl: Time to live in seconds (optional, defaults to settings.CACHE_TTL)
+        ttl: Time to live in seconds (optional, defaults to the key's cache policy)
+        grace: Stale grace window in seconds (optional, defaults to the key's cache policy)
         *args, **kwargs: Arguments to pass to fetch_func
         
     Returns:
         Data from cache or from fetch_func
     """
     current_time = time.time()
-    cache_ttl = ttl if ttl is not None else settings.CACHE_TTL
+    policy = get_cache_policy(key)
+    cache_ttl = ttl if ttl is not None else policy.ttl
+    stale_grace = grace if grace is not None else policy.grace
+    
+    entry = cache.get(key)
+    if entry is not None:
+        age = current_time - entry["timestamp"]
+        if _is_empty(entry["data"]):
+            if _is_fresh(key, entry, cache_ttl, current_time):
+                print(f"CACHE HIT: Hasil kosong dari cache negatif untuk key: {key}")
+                _record(_negative_stats, "negative_hits")
+                return entry["data"]
+        elif age < cache_ttl:
+            print(f"CACHE HIT: Mengambil data dari cache untuk key: {key}")
+            return entry["data"]
+        elif age < cache_ttl + stale_grace:
+            print(f"CACHE STALE: Menyajikan data lama untuk key: {key}, refresh di background")
+            _record(_swr_stats, "stale_hits")
+            if _claim_refresh(key):
+                ctx = contextvars.copy_context()
+                get_blocking_executor().submit(ctx.run, _refresh_in_background, key, fetch_func, args, kwargs, cache_ttl, stale_grace)
+            return entry["data"]
+    
+    print(f"CACHE MISS: Melakukan fetch baru untuk key: {key}")
+    try:
+        return _flights.do(key, _fill, key, fetch_func, args, kwargs, cache_ttl, stale_grace)["data"]
+    except (CircuitOpenError, DeadlineExceeded) as e:
+        last_good = cache.get(_last_good_key(key))
+        if last_good is None:
+            print(f"Error saat fetching {key}: {e}")
+            raise
+        print(f"UPSTREAM TIDAK TERSEDIA: Menyajikan data terakhir yang valid untuk key: {key} ({e})")
+        _record(_swr_stats, "last_good_hits")
+        return last_good["data"]
+    except Exception as e:
+        print(f"Error saat fetching {key}: {e}")
+        raise
+
+
+async def _call_fetch(fetch_func: Callable[..., Union[T, Awaitable[T]]], *args, **kwargs) -> T:
+    if asyncio.iscoroutinefunction(fetch_func):
+        return await fetch_func(*args, **kwargs)
+    return await run_blocking(fetch_func, *args, **kwargs)
+
+
+async def _await_peer_fill(backend: CacheBackend, key: str, cache_ttl: int) -> Optional[CacheEntry]:
+    left = remaining()
+    deadline = time.monotonic() + (settings.CACHE_LEASE_TTL if left is None else min(settings.CACHE_LEASE_TTL, left))
+    while time.monotonic() < deadline:
+        await asyncio.sleep(settings.CACHE_LEASE_POLL_INTERVAL)
+        try:
+            entry = await backend.get(key)
+        except Exception:
+            return None
+        if entry is not None and _is_fresh(key, entry, cache_ttl, time.time()):
+            return entry
+    return None
+
+
+async def _afill(
+    backend: CacheBackend, 
+    key: str, 
+    fetch_func: Callable[..., Union[T, Awaitable[T]]], 
+    args: tuple, 
+    kwargs: dict, 
+    cache_ttl: int, 
+    grace: int, 
+    keep_stale: bool = False
+) -> CacheEntry:
+    try:
+        token = await backend.acquire_lease(key, settings.CACHE_LEASE_TTL)
+    except Exception as e:
+        print(f"Gagal mengambil lease untuk {key}: {e}")
+        token = ""
+    
+    if token is None:
+        # Worker lain sedang mengisi key ini, tunggu hasilnya
+        entry = await _await_peer_fill(backend, key, cache_ttl)
+        if entry is not None:
+            return entry
+    
+    try:
+        fetch_time = time.time()
+        stale = None
+        if keep_stale:
+            try:
+                stale = _revalidation_base(key, await backend.get(key))
+            except Exception:
+                stale = None
+        with partial_scope() as scope, collecting_validators() as validators:
+            if stale is None:
+                data = await _call_fetch(fetch_func, *args, **kwargs)
+            else:
+                try:
+                    with revalidating(stale["validators"]):
+                        data = await _call_fetch(fetch_func, *args, **kwargs)
+                except NotModified:
+                    data = _not_modified(key, stale)
+                    validators = stale["validators"]
+        entry = _fetched_entry(key, fetch_time, data, validators)
+        if scope is not None and scope.partial:
+            return _partial(key, entry)
+        # Refresh yang gagal (hasil kosong) tidak menimpa data stale yang masih valid
+        if keep_stale and _is_empty(data):
+            return entry
+        if _should_store(key, data):
+            try:
+                # Simpan selama ttl + grace agar data lama masih bisa disajikan
+                await backend.set(key, entry, _lifetime(key, data, cache_ttl, grace))
+                if not _is_empty(data) and settings.CACHE_LAST_GOOD_TTL > 0:
+                    await backend.set(_last_good_key(key), entry, settings.CACHE_LAST_GOOD_TTL)
+            except Exception as e:
+                print(f"Error menyimpan cache {key} ke backend {backend.name}: {e}")
+        return entry
+    finally:
+        if token:
+            try:
+                await backend.release_lease(key, token)
+            except Exception as e:
+                print(f"Gagal melepas lease untuk {key}: {e}")
+
+
+async def _arefresh_in_background(
+    backend: CacheBackend, 
+    key: str, 
+    fetch_func: Callable[..., Union[T, Awaitable[T]]], 
+    args: tuple, 
+    kwargs: dict, 
+    cache_ttl: int, 
+    grace: int
+) -> None:
+    try:
+        entry = await _flights.ado(key, _afill, backend, key, fetch_func, args, kwargs, cache_ttl, grace, keep_stale=True)
+        _record(_swr_stats, "refresh_errors" if _is_empty(entry["data"]) else "refreshes")
+    except Exception as e:
+        # Data stale tetap disajikan sampai grace window habis
+        _record(_swr_stats, "refresh_errors")
+        print(f"Refresh background gagal untuk {key}, tetap menyajikan data stale: {e}")
+    finally:
+        _release_refresh(key)
+
+
+async def aget_from_cache_or_fetch(
+    key: str, 
+    fetch_func: Callable[..., Union[T, Awaitable[T]]], 
+    *args, 
+    ttl: Optional[int] = None, 
+    grace: Optional[int] = None, 
+    **kwargs
+) -> T:
+    """
+    Get data from cache or fetch it without blocking the event loop.
+    
+    See aget_entry_from_cache_or_fetch for the caching behaviour.
+    
+    Args:
+        key: Cache key
+        fetch_func: Function or coroutine function to fetch data if not in cache
+        ttl: Time to live in seconds (optional, defaults to the key's cache policy)
+        grace: Stale grace window in seconds (optional, defaults to the key's cache policy)
+        *args, **kwargs: Arguments to pass to fetch_func
+    
+    Returns:
+        Data from cache or from fetch_func
+    """
+    entry = await aget_entry_from_cache_or_fetch(key, fetch_func, *args, ttl=ttl, grace=grace, **kwargs)
+    return entry["data"]
+
+
+async def aget_entry_from_cache_or_fetch(
+    key: str, 
+    fetch_func: Callable[..., Union[T, Awaitable[T]]], 
+    *args, 
+    ttl: Optional[int] = None, 
+    grace: Optional[int] = None, 
+    **kwargs
+) -> CacheEntry:
+    """
+    Get a cache entry or fetch fresh data without blocking the event loop.
+    
+    Cache hits are served directly. Data older than ttl but still inside
+    the grace window is served immediately while a single background task
+    refreshes the key. Empty results are cached for the policy's short
+    negative_ttl only, without a grace window. On a miss, coroutine functions are awaited and
+    blocking functions are dispatched to the bounded executor.
+    
+    Concurrent misses for the same key share a single fetch. With a shared
+    backend, a short lease lets one worker refill the key while the others
+    wait for its result. Families whose policy sets revalidate keep the
+    upstream ETag and Last-Modified in the cached entry and refresh with
+    a conditional GET; a 304 keeps the cached result for another ttl
+    without re-parsing.
+    
+    If the fetch fails because the upstream circuit breaker is open or the
+    request deadline ran out, the last non-empty result (kept for
+    settings.CACHE_LAST_GOOD_TTL) is returned with "stale": True instead.
+    Results cut short by the request deadline are returned with
+    "partial": True and not cached.
+    
+    Args:
+        key: Cache key
+        fetch_func: Function or coroutine function to fetch data if not in cache
+        ttl: Time to live in seconds (optional, defaults to the key's cache policy)
+        grace: Stale grace window in seconds (optional, defaults to the key's cache policy)
+        *args, **kwargs: Arguments to pass to fetch_func
+    
+    Returns:
+        Cache entry ({"timestamp", "data"}) from cache or from fetch_func,
+        with "stale": True when it is the last known good copy and
+        "partial": True when it is incomplete
+    """
+    current_time = time.time()
+    policy = get_cache_policy(key)
+    cache_ttl = ttl if ttl is not None else policy.ttl
+    stale_grace = grace if grace is not None else policy.grace
+    backend = get_cache_backend()
     
-    if key in cache and (current_time - cache[key]["timestamp"]) < cache_ttl:
-        print(f"CACHE HIT: Mengambil data dari cache untuk key: {key}")
-        return cache[key]["data"]
+    try:
+        entry = await backend.get(key)
+    except Exception as e:
+        print(f"Error membaca cache {key} dari backend {backend.name}: {e}")
+        entry = None
+    
+    if entry is not None:
+        age = current_time - entry["timestamp"]
+        if _is_empty(entry["data"]):
+            if _is_fresh(key, entry, cache_ttl, current_time):
+                print(f"CACHE HIT: Hasil kosong dari cache negatif untuk key: {key}")
+                _record(_negative_stats, "negative_hits")
+                return entry
+        elif age < cache_ttl:
+            print(f"CACHE HIT: Mengambil data dari cache untuk key: {key}")
+            return entry
+        elif age < cache_ttl + stale_grace:
+            print(f"CACHE STALE: Menyajikan data lama untuk key: {key}, refresh di background")
+            _record(_swr_stats, "stale_hits")
+            if _claim_refresh(key):
+                task = asyncio.create_task(_arefresh_in_background(backend, key, fetch_func, args, kwargs, cache_ttl, stale_grace))
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_tasks.discard)
+            return entry
     
     print(f"CACHE MISS: Melakukan fetch baru untuk key: {key}")
     try:
-        data = fetch_func(*args, **kwargs)
-        if data is not None:
-            cache[key] = {"timestamp": current_time, "data": data}
-        return data
+        return await _flights.ado(key, _afill, backend, key, fetch_func, args, kwargs, cache_ttl, stale_grace)
+    except (CircuitOpenError, DeadlineExceeded) as e:
+        try:
+            last_good = await backend.get(_last_good_key(key))
+        except Exception:
+            last_good = None
+        if last_good is None:
+            print(f"Error saat fetching {key}: {e}")
+            raise
+        print(f"UPSTREAM TIDAK TERSEDIA: Menyajikan data terakhir yang valid untuk key: {key} ({e})")
+        _record(_swr_stats, "last_good_hits")
+        return {**last_good, "stale": True}
     except Exception as e:
         print(f"Error saat fetching {key}: {e}")
         raise
@@ -50,12 +513,13 @@ def invalidate_cache(key: Optional[str] = None) -> None:
     """
     Invalidate cache for a specific key or all cache.
     
+    Invalidating a single key keeps its last known good copy for outages.
+    
     Args:
         key: Cache key to invalidate (optional, if None, invalidate all cache)
     """
-    global cache
     if key is None:
-        cache = {}
+        cache.clear()
         print("Semua cache telah diinvalidasi")
     elif key in cache:
         del cache[key]
@@ -84,6 +548,12 @@ def get_cache_stats() -> Dict[str, Any]:
     stats = {
         "total_keys": len(cache),
         "keys": [],
+        "memory": cache.stats(),
+        "stale_while_revalidate": dict(_swr_stats),
+        "single_flight": _flights.stats(),
+        "oversized_skips": _oversized_skips,
+        "negative": dict(_negative_stats),
+        "policies": describe_policies(),
     }
     
     current_time = time.time()
@@ -92,7 +562,58 @@ def get_cache_stats() -> Dict[str, Any]:
         stats["keys"].append({
             "key": key,
             "age": age,
-            "size": len(str(value["data"])),
+            "size": cache.size_of(key),
         })
     
-    return stats
\ No newline at end of file
+    return stats
+
+
+async def ainvalidate_cache(key: Optional[str] = None) -> None:
+    """
+    Invalidate cache for a specific key or all cache in the configured backend.
+    
+    Invalidating a single key keeps its last known good copy for outages.
+    
+    Args:
+        key: Cache key to invalidate (optional, if None, invalidate all cache)
+    """
+    backend = get_cache_backend()
+    if key is None:
+        await backend.clear()
+        print("Semua cache telah diinvalidasi")
+    elif await backend.delete(key):
+        print(f"Cache untuk key {key} telah diinvalidasi")
+    else:
+        print(f"Cache untuk key {key} tidak ditemukan")
+
+
+async def aget_cache_keys() -> list:
+    """
+    Get all cache keys from the configured backend.
+    
+    Returns:
+        List of cache keys
+    """
+    return await get_cache_backend().keys()
+
+
+async def aget_cache_stats() -> Dict[str, Any]:
+    """
+    Get cache statistics from the configured backend.
+    
+    Returns:
+        Dictionary with cache statistics
+    """
+    backend = get_cache_backend()
+    keys = await backend.keys()
+    return {
+        "backend": backend.name,
+        "total_keys": len(keys),
+        "keys": keys,
+        "stale_while_revalidate": dict(_swr_stats),
+        "single_flight": _flights.stats(),
+        "oversized_skips": _oversized_skips,
+        "negative": dict(_negative_stats),
+        "policies": describe_policies(),
+        **backend.stats(),
+    }
\ No newline at end of file
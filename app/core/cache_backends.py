@@ -0,0 +1,412 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import settings
+from .lru import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+# Entry format shared by all backends: {"timestamp": float, "data": Any}
+CacheEntry = Dict[str, Any]
+
+# Dipanggil dengan key ("*" untuk semua) saat worker lain mengubah atau menginvalidasi cache
+_invalidation_listeners: List[Callable[[str], None]] = []
+
+
+def add_invalidation_listener(callback: Callable[[str], None]) -> None:
+    """
+    Call callback with the key ("*" for all keys) whenever another worker
+    writes or invalidates it, so per-process caches derived from the
+    entry can drop their copy.
+    """
+    if callback not in _invalidation_listeners:
+        _invalidation_listeners.append(callback)
+
+
+def _notify_invalidation(key: str) -> None:
+    for callback in list(_invalidation_listeners):
+        try:
+            callback(key)
+        except Exception as e:
+            logger.warning(f"Listener invalidasi gagal untuk {key}: {e}")
+
+
+class CacheBackend(ABC):
+    """
+    Interface for cache storage backends.
+    """
+    name: str = "base"
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cache entry, or None if it is missing or expired.
+        """
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry, ttl: int) -> None:
+        """
+        Store a cache entry that expires after ttl seconds.
+        """
+        pass
+    
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """
+        Delete a cache entry. Returns True if the key existed.
+        """
+        pass
+    
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Delete all cache entries owned by this backend.
+        """
+        pass
+    
+    @abstractmethod
+    async def keys(self) -> List[str]:
+        """
+        List all cache keys.
+        """
+        pass
+    
+    async def start(self) -> None:
+        """
+        Start background tasks needed by the backend.
+        """
+        pass
+    
+    async def close(self) -> None:
+        """
+        Release backend resources.
+        """
+        pass
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Backend-specific statistics.
+        """
+        return {}
+
+    async def acquire_lease(self, key: str, ttl: float) -> Optional[str]:
+        """
+        Try to take a short lease for refilling a key across workers.
+        
+        Backends without shared state always grant the lease, since
+        in-process callers are already deduplicated by the single-flight
+        layer.
+        
+        Returns:
+            Lease token, or None if another worker holds the lease
+        """
+        return "local"
+    
+    async def release_lease(self, key: str, token: str) -> None:
+        """
+        Release a lease taken with acquire_lease.
+        """
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Per-process in-memory backend over a bounded LRU store.
+    """
+    name = "memory"
+    
+    def __init__(self, store: Optional[BoundedCache] = None):
+        if store is None:
+            store = BoundedCache(max_entries=settings.CACHE_MAX_ENTRIES, max_bytes=settings.CACHE_MAX_BYTES)
+        self.store = store
+    
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        # Entry kedaluwarsa sudah dibuang oleh BoundedCache
+        return self.store.get(key)
+    
+    async def set(self, key: str, entry: CacheEntry, ttl: int) -> None:
+        self.store[key] = {**entry, "expires_at": time.time() + ttl}
+    
+    async def delete(self, key: str) -> bool:
+        return self.store.pop(key, None) is not None
+    
+    async def clear(self) -> None:
+        self.store.clear()
+    
+    async def keys(self) -> List[str]:
+        return self.store.keys()
+    
+    def stats(self) -> Dict[str, Any]:
+        return self.store.stats()
+
+
+def serialize_entry(entry: CacheEntry) -> bytes:
+    """
+    Serialize a cache entry to compact JSON, zlib-compressed above a size threshold.
+    
+    Args:
+        entry: Cache entry
+    
+    Returns:
+        Bytes prefixed with b"j" (plain JSON) or b"z" (compressed JSON)
+    """
+    payload = {"t": entry["timestamp"], "d": entry["data"]}
+    if entry.get("validators"):
+        payload["v"] = entry["validators"]
+    raw = json.dumps(
+        payload,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+    if len(raw) >= settings.CACHE_COMPRESS_MIN_BYTES:
+        return b"z" + zlib.compress(raw, 6)
+    return b"j" + raw
+
+
+def deserialize_entry(payload: bytes) -> CacheEntry:
+    """
+    Deserialize bytes produced by serialize_entry.
+    
+    Args:
+        payload: Serialized entry
+    
+    Returns:
+        Cache entry
+    """
+    marker, body = payload[:1], payload[1:]
+    if marker == b"z":
+        body = zlib.decompress(body)
+    decoded = json.loads(body)
+    entry = {"timestamp": decoded["t"], "data": decoded["d"]}
+    if "v" in decoded:
+        entry["validators"] = decoded["v"]
+    return entry
+
+
+class RedisBackend(CacheBackend):
+    """
+    Shared Redis backend. TTLs are enforced by Redis itself.
+    """
+    name = "redis"
+    
+    # Hapus lease hanya jika token masih milik pemanggil
+    _RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+    def __init__(self, client: Any = None, prefix: Optional[str] = None):
+        if client is None:
+            import redis.asyncio as redis
+            
+            pool = redis.ConnectionPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+            )
+            client = redis.Redis(connection_pool=pool)
+        self.client = client
+        self.prefix = prefix if prefix is not None else settings.CACHE_KEY_PREFIX
+        self._release_lease = client.register_script(self._RELEASE_LEASE_SCRIPT)
+    
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+    
+    def _lease_key(self, key: str) -> str:
+        # Di luar prefix cache agar tidak ikut keys() dan clear()
+        return f"lease:{self.prefix}{key}"
+    
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        payload = await self.client.get(self._key(key))
+        if payload is None:
+            return None
+        return deserialize_entry(payload)
+    
+    async def set(self, key: str, entry: CacheEntry, ttl: int) -> None:
+        await self.client.set(self._key(key), serialize_entry(entry), ex=max(1, int(ttl)))
+    
+    async def delete(self, key: str) -> bool:
+        return bool(await self.client.delete(self._key(key)))
+    
+    async def clear(self) -> None:
+        # Hanya hapus key milik aplikasi ini, bukan FLUSHDB
+        batch = []
+        async for redis_key in self.client.scan_iter(match=f"{self.prefix}*", count=500):
+            batch.append(redis_key)
+            if len(batch) >= 500:
+                await self.client.delete(*batch)
+                batch = []
+        if batch:
+            await self.client.delete(*batch)
+    
+    async def keys(self) -> List[str]:
+        keys = []
+        async for redis_key in self.client.scan_iter(match=f"{self.prefix}*", count=500):
+            if isinstance(redis_key, bytes):
+                redis_key = redis_key.decode("utf-8")
+            keys.append(redis_key[len(self.prefix):])
+        return keys
+    
+    async def acquire_lease(self, key: str, ttl: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        acquired = await self.client.set(self._lease_key(key), token, nx=True, px=max(1, int(ttl * 1000)))
+        return token if acquired else None
+    
+    async def release_lease(self, key: str, token: str) -> None:
+        await self._release_lease(keys=[self._lease_key(key)], args=[token])
+    
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class TieredBackend(CacheBackend):
+    """
+    Small in-process L1 in front of a shared Redis L2.
+    
+    Writes and invalidations are broadcast over Redis pub/sub so every
+    worker drops its L1 copy of the key.
+    """
+    name = "tiered"
+    
+    def __init__(self, l1: MemoryBackend, l2: RedisBackend, l1_ttl: Optional[int] = None):
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl if l1_ttl is not None else settings.CACHE_L1_TTL
+        self.channel = f"{l2.prefix}invalidate"
+        self.origin = uuid.uuid4().hex
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self._pubsub: Any = None
+        self._listener: Optional[asyncio.Task] = None
+        self._closing = False
+    
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = await self.l1.get(key)
+        if entry is not None:
+            self.l1_hits += 1
+            return entry
+        
+        entry = await self.l2.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self.l2_hits += 1
+        await self.l1.set(key, entry, self.l1_ttl)
+        return entry
+    
+    async def set(self, key: str, entry: CacheEntry, ttl: int) -> None:
+        await self.l2.set(key, entry, ttl)
+        await self.l1.set(key, entry, min(ttl, self.l1_ttl))
+        await self._publish(key)
+    
+    async def delete(self, key: str) -> bool:
+        await self.l1.delete(key)
+        existed = await self.l2.delete(key)
+        await self._publish(key)
+        return existed
+    
+    async def clear(self) -> None:
+        await self.l1.clear()
+        await self.l2.clear()
+        await self._publish("*")
+    
+    async def keys(self) -> List[str]:
+        return await self.l2.keys()
+    
+    async def acquire_lease(self, key: str, ttl: float) -> Optional[str]:
+        return await self.l2.acquire_lease(key, ttl)
+    
+    async def release_lease(self, key: str, token: str) -> None:
+        await self.l2.release_lease(key, token)
+    
+    async def _publish(self, key: str) -> None:
+        try:
+            await self.l2.client.publish(self.channel, f"{self.origin}|{key}")
+        except Exception as e:
+            logger.warning(f"Gagal broadcast invalidasi {key}: {e}")
+    
+    async def _handle_message(self, payload: Any) -> None:
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        origin, _, key = payload.partition("|")
+        if origin == self.origin:
+            return
+        if key == "*":
+            await self.l1.clear()
+        else:
+            await self.l1.delete(key)
+        _notify_invalidation(key)
+    
+    async def _subscribe(self) -> None:
+        self._pubsub = self.l2.client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+    
+    async def _listen(self) -> None:
+        while not self._closing:
+            try:
+                if self._pubsub is None:
+                    await self._subscribe()
+                    # Pesan mungkin terlewat selama terputus
+                    await self.l1.clear()
+                    _notify_invalidation("*")
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message.get("type") == "message":
+                    await self._handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Listener invalidasi cache terputus: {e}")
+                await self._close_pubsub()
+                await asyncio.sleep(1.0)
+    
+    async def _close_pubsub(self) -> None:
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+    
+    async def start(self) -> None:
+        if self._listener is None:
+            try:
+                await self._subscribe()
+            except Exception as e:
+                # Listener akan mencoba lagi di background
+                logger.warning(f"Gagal subscribe ke {self.channel}: {e}")
+                await self._close_pubsub()
+            self._listener = asyncio.create_task(self._listen())
+    
+    async def close(self) -> None:
+        if self._listener is not None:
+            # Flag juga diperiksa karena cancel bisa tertelan oleh timeout get_message
+            self._closing = True
+            self._listener.cancel()
+            await asyncio.wait({self._listener}, timeout=2.0)
+            self._listener = None
+        await self._close_pubsub()
+        await self.l2.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        l2_lookups = self.l2_hits + self.misses
+        return {
+            "l1": self.l1.stats(),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "l1_hit_ratio": self.l1_hits / lookups if lookups else 0.0,
+            "l2_hit_ratio": self.l2_hits / l2_lookups if l2_lookups else 0.0,
+        }
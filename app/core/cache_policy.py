@@ -0,0 +1,107 @@
+import fnmatch
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, Optional
+
+from .config import settings
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Caching rules for a family of cache keys.
+    
+    Attributes:
+        ttl: Seconds an entry is considered fresh
+        grace: Seconds an expired entry may still be served while it is refreshed
+        max_size: Largest entry (estimated bytes) worth caching, None for no limit
+        negative_ttl: Seconds an empty result (not found, no hits, failed scrape) is cached
+        revalidate: Refresh with a conditional GET and keep the result if the
+            upstream page is unchanged; only for results scraped from one page
+    """
+    ttl: int
+    grace: int
+    max_size: Optional[int] = None
+    negative_ttl: int = settings.CACHE_NEGATIVE_TTL
+    revalidate: bool = False
+
+
+def _default_policies() -> Dict[str, CachePolicy]:
+    # Pola dicocokkan dengan fnmatch terhadap cache key
+    return {
+        "home_data": CachePolicy(ttl=settings.CACHE_TTL, grace=600, max_size=2 * 1024 * 1024),
+        "jadwal_rilis_*": CachePolicy(ttl=settings.CACHE_LONG_TTL, grace=1800, max_size=1024 * 1024),
+        # Halaman pertama berubah setiap ada episode baru, halaman dalam jarang berubah
+        "anime_terbaru_page_1": CachePolicy(ttl=settings.CACHE_TTL, grace=300, max_size=512 * 1024, revalidate=True),
+        "anime_terbaru_page_*": CachePolicy(ttl=settings.CACHE_LONG_TTL, grace=1800, max_size=512 * 1024, revalidate=True),
+        "movie_list_page_1": CachePolicy(ttl=settings.CACHE_LONG_TTL, grace=1800, max_size=512 * 1024, revalidate=True),
+        "movie_list_page_*": CachePolicy(ttl=settings.CACHE_VERY_LONG_TTL, grace=3600, max_size=512 * 1024, revalidate=True),
+        "anime_detail_*": CachePolicy(ttl=settings.CACHE_LONG_TTL, grace=3600, max_size=512 * 1024, revalidate=True),
+        "episode_detail_*": CachePolicy(ttl=settings.CACHE_LONG_TTL, grace=3600, max_size=256 * 1024),
+        "search_*": CachePolicy(ttl=settings.CACHE_TTL, grace=120, max_size=256 * 1024),
+        # Link embed player_ajax per (post, nume), sudah dengan rewrite Pixeldrain
+        "embed_*": CachePolicy(ttl=settings.EMBED_CACHE_TTL, grace=settings.CACHE_VERY_LONG_TTL, max_size=4 * 1024),
+    }
+
+
+def build_policies(overrides: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, CachePolicy]:
+    """
+    Build the policy table from the defaults and overrides.
+    
+    Args:
+        overrides: Mapping of key pattern to policy fields, e.g.
+            {"search_*": {"ttl": 300}}. Unknown patterns add new families.
+    
+    Returns:
+        Mapping of key pattern to CachePolicy
+    """
+    policies = _default_policies()
+    for pattern, fields in (overrides or {}).items():
+        base = policies.get(pattern, get_default_policy())
+        policies[pattern] = replace(base, **fields)
+    return policies
+
+
+def get_default_policy() -> CachePolicy:
+    """
+    Policy for keys that match no family.
+    """
+    return CachePolicy(ttl=settings.CACHE_TTL, grace=settings.CACHE_STALE_GRACE)
+
+
+# Tabel policy aktif, bisa diubah lewat env CACHE_POLICIES (JSON)
+POLICIES: Dict[str, CachePolicy] = build_policies(settings.CACHE_POLICIES)
+
+
+def get_cache_policy(key: str) -> CachePolicy:
+    """
+    Get the policy for a cache key.
+    
+    An exact pattern match wins, otherwise the longest matching pattern.
+    
+    Args:
+        key: Cache key
+    
+    Returns:
+        CachePolicy for the key's family
+    """
+    policy = POLICIES.get(key)
+    if policy is not None:
+        return policy
+    
+    best = None
+    for pattern in POLICIES:
+        if fnmatch.fnmatchcase(key, pattern) and (best is None or len(pattern) > len(best)):
+            best = pattern
+    return POLICIES[best] if best is not None else get_default_policy()
+
+
+def describe_policies() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the active policy table for the cache stats.
+    
+    Returns:
+        Mapping of key pattern to policy fields, including the default
+    """
+    table = {pattern: asdict(policy) for pattern, policy in POLICIES.items()}
+    table["*"] = asdict(get_default_policy())
+    return table
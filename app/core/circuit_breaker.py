@@ -0,0 +1,169 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+from urllib.parse import urlsplit
+
+from .config import settings
+from .deadline import DeadlineExceeded
+from .limiter import is_overload_error
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling an upstream whose circuit breaker is open.
+    """
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit breaker {name} terbuka, coba lagi dalam {retry_in:.1f} detik")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker.
+    
+    After failure_threshold consecutive overload failures the breaker opens
+    and calls fail fast with CircuitOpenError. Once reset_timeout has passed
+    a single probe call is let through (half-open): success closes the
+    breaker, failure opens it for another reset_timeout.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"opened": 0, "rejected": 0}
+    
+    def allow(self) -> None:
+        """
+        Reserve a call, raising CircuitOpenError if the breaker is open.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self._stats["rejected"] += 1
+        raise CircuitOpenError(self.name, max(remaining, 0.0))
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self._stats["opened"] += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+    
+    def _abandon(self) -> None:
+        # Probe dibatalkan tanpa hasil, izinkan probe berikutnya
+        with self._lock:
+            self._probing = False
+    
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run one upstream call through the breaker.
+        
+        429/5xx responses and transport errors count as failures; other
+        errors (e.g. 404) show the upstream is up and count as successes.
+        Calls cut off by the request deadline say nothing about the upstream.
+        """
+        self.allow()
+        try:
+            yield
+        except DeadlineExceeded:
+            self._abandon()
+            raise
+        except Exception as e:
+            if is_overload_error(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            self._abandon()
+            raise
+        else:
+            self.record_success()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "state": self.state, "failures": self.failures}
+
+
+def page_type(url: str) -> str:
+    """
+    Classify an upstream URL by page type for per-page-type breakers.
+    
+    "/" is "home" (or "search" with a query), multi-segment paths use their
+    first segment ("anime", "anime-terbaru", "wp-json", ...), and
+    single-segment posts are "episode" when the slug mentions one.
+    """
+    parts = urlsplit(url)
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if not segments:
+        return "search" if parts.query else "home"
+    if len(segments) == 1 and "episode" in segments[0]:
+        return "episode"
+    return segments[0]
+
+
+# Satu breaker per host dan jenis halaman
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for a URL's host and page type, creating it on first use.
+    
+    Args:
+        url: Upstream URL
+    
+    Returns:
+        CircuitBreaker configured from settings.CIRCUIT_BREAKER_*
+    """
+    name = f"{urlsplit(url).netloc.lower()} {page_type(url)}"
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=settings.CIRCUIT_BREAKER_RESET_TIMEOUT,
+            )
+            _breakers[name] = breaker
+        return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get per host and page type circuit breaker statistics.
+    
+    Returns:
+        Mapping of breaker name to state, consecutive failures and counters
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.stats() for name, breaker in breakers.items()}
@@ -36,6 +36,14 @@ class Settings(BaseSettings):
     SAMEHADAKU_BASE_URL: str = "https://v1.samehadaku.how"
     SAMEHADAKU_SEARCH_URL: str = "https://v1.samehadaku.how/"
     SAMEHADAKU_API_URL: str = "https://v1.samehadaku.how/wp-json/custom/v1"
+    SAMEHADAKU_MIRRORS: str = ""  # base URL domain alternatif, dipisah koma
+    # Route JSON per jenis halaman (anime_terbaru, movie, search), relatif ke SAMEHADAKU_API_URL
+    SAMEHADAKU_JSON_ROUTES: Dict[str, str] = {}
+    
+    @property
+    def samehadaku_mirrors(self) -> List[str]:
+        """Parse Samehadaku mirror base URLs from string"""
+        return [mirror.strip() for mirror in self.SAMEHADAKU_MIRRORS.split(",") if mirror.strip()]
     
     @property
     def ANIME_SOURCES(self) -> Dict[str, Dict[str, Any]]:
@@ -44,20 +52,123 @@ class Settings(BaseSettings):
                 "base_url": self.SAMEHADAKU_BASE_URL,
                 "search_url": self.SAMEHADAKU_SEARCH_URL,
                 "api_url": self.SAMEHADAKU_API_URL,
+                "mirrors": self.samehadaku_mirrors,
+                "json_routes": self.SAMEHADAKU_JSON_ROUTES,
                 "active": True,
             },
             # Tambahkan sumber anime lain di sini
         }
 
+    # Upstream HTTP Configuration
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT: float = 30.0  # batas per request upstream, sync dan async
+    
+    # Deadline per request API (detik), sisa budget menjadi timeout setiap request upstream
+    REQUEST_DEADLINE: float = 20.0
+    ENDPOINT_DEADLINES: Dict[str, float] = {
+        "home": 25.0,
+        "anime_terbaru": 15.0,
+        "movie": 15.0,
+        "anime_detail": 15.0,
+        "episode_detail": 20.0,
+        "jadwal_rilis": 20.0,
+        "search": 15.0,
+    }
+    
+    # Record/replay upstream untuk benchmark offline ("" = jaringan langsung, "record", "replay")
+    UPSTREAM_TRANSPORT_MODE: str = ""
+    UPSTREAM_FIXTURE_DIR: str = ""
+    UPSTREAM_REPLAY_LATENCY: float = 0.0  # detik per response, negatif = latensi saat direkam
+    
+    # Disk cache HTML mentah (kosong = nonaktif)
+    HTML_DISK_CACHE_DIR: str = ""
+    HTML_DISK_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    HTML_DISK_CACHE_MAX_AGE: int = 300  # detik, HTML lebih tua diambil ulang dari upstream
+    
+    # Executor Configuration
+    BLOCKING_EXECUTOR_WORKERS: int = 16
+    IO_EXECUTOR_WORKERS: int = 32  # fan-out request upstream (jadwal per hari, server player_ajax, hedge)
+    CPU_EXECUTOR_WORKERS: int = 4  # fan-out parsing (bagian halaman utama)
+    
+    # Upstream Concurrency Limiter (AIMD per host)
+    UPSTREAM_LIMIT_INITIAL: int = 8
+    UPSTREAM_LIMIT_MIN: int = 1
+    UPSTREAM_LIMIT_MAX: int = 32
+    UPSTREAM_LATENCY_TARGET: float = 3.0  # detik, request lebih lambat dianggap sinyal overload
+    UPSTREAM_LIMIT_BACKOFF: float = 0.5
+    UPSTREAM_LIMIT_DECREASE_INTERVAL: float = 1.0
+    
+    # Upstream Retry dan Circuit Breaker
+    UPSTREAM_RETRY_ATTEMPTS: int = 3
+    UPSTREAM_RETRY_BASE_DELAY: float = 0.5
+    UPSTREAM_RETRY_MAX_DELAY: float = 5.0
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_RESET_TIMEOUT: float = 30.0
+    
+    # player_ajax (link streaming episode)
+    PLAYER_AJAX_TIMEOUT: float = 10.0
+    PLAYER_AJAX_DEADLINE: float = 8.0  # batas total untuk semua server satu episode
+    EMBED_CACHE_TTL: int = 7 * 86400  # 1 minggu
+    
+    # Hedged requests (episode detail dan jadwal rilis)
+    HEDGING_ENABLED: bool = True
+    HEDGE_PERCENTILE: float = 0.9
+    HEDGE_BUDGET_RATIO: float = 0.05  # maksimal ~5% request mendapat hedge
+    HEDGE_MIN_SAMPLES: int = 20
+    
+    # Pemilihan mirror berdasarkan latency (SAMEHADAKU_MIRRORS)
+    MIRROR_EWMA_ALPHA: float = 0.3
+    MIRROR_ERROR_THRESHOLD: float = 0.5  # error rate EWMA di atas ini dianggap tidak sehat
+    MIRROR_COOLDOWN: float = 60.0  # detik sebelum mirror tidak sehat dicoba lagi sebagai pilihan utama
+    
+    # Parse HTML sambil download (halaman besar: home, detail anime)
+    STREAMING_PARSE_ENABLED: bool = True
+    STREAMING_CHUNK_SIZE: int = 16 * 1024
+    
+    # JSON dulu lewat REST API, HTML jika route gagal atau field kurang
+    JSON_ROUTES_ENABLED: bool = True
+    JSON_ROUTE_RETRY_AFTER: float = 3600.0
+    
     # Cache Configuration
     CACHE_TTL: int = 600  # 10 menit
     CACHE_LONG_TTL: int = 3600  # 1 jam
     CACHE_VERY_LONG_TTL: int = 86400  # 24 jam
+    CACHE_BACKEND: str = "memory"  # "memory" atau "redis"
+    CACHE_KEY_PREFIX: str = "kortekstream:"
+    CACHE_COMPRESS_MIN_BYTES: int = 1024
+    CACHE_MAX_ENTRIES: int = 5000
+    CACHE_MAX_BYTES: int = 128 * 1024 * 1024  # 128 MB per worker
+    CACHE_L1_ENABLED: bool = True  # L1 in-process di depan Redis
+    CACHE_L1_TTL: int = 60
+    CACHE_L1_MAX_ENTRIES: int = 256
+    CACHE_L1_MAX_BYTES: int = 32 * 1024 * 1024
+    # Lease antar worker saat mengisi ulang key yang sama (Redis)
+    CACHE_LEASE_TTL: float = 30.0
+    CACHE_LEASE_POLL_INTERVAL: float = 0.1
+    # Stale-while-revalidate: data kedaluwarsa tetap disajikan selama grace window
+    CACHE_STALE_GRACE: int = 300
+    # Hasil kosong (slug tidak ada, search tanpa hasil, scrape gagal) disimpan singkat
+    CACHE_NEGATIVE_TTL: int = 60
+    CACHE_LAST_GOOD_TTL: int = 86400  # 1 hari, disajikan saat circuit breaker terbuka
+    NEGATIVE_BLOOM_CAPACITY: int = 100000
+    NEGATIVE_BLOOM_ERROR_RATE: float = 0.001
+    NEGATIVE_BLOOM_ROTATE_SECONDS: int = 6 * 3600
+    # Override tabel policy per keluarga key, contoh: {"search_*": {"ttl": 300, "grace": 60}}
+    CACHE_POLICIES: Dict[str, Dict[str, Any]] = {}
 
+    # Response Cache Configuration (JSON siap kirim per proses)
+    RESPONSE_CACHE_TTL: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_GZIP_MIN_BYTES: int = 1024
+    
     # Redis Configuration
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
     
     # Docker Configuration
     NGINX_PORT: int = 80
@@ -0,0 +1,178 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from .config import settings
+
+# Sisa budget di bawah ini tidak cukup untuk memulai request upstream baru
+_MIN_REMAINING = 0.05
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when the request's time budget runs out before an upstream call.
+    """
+    def __init__(self, where: str):
+        super().__init__(f"Deadline request habis sebelum {where}")
+        self.where = where
+
+
+class Deadline:
+    """
+    Time budget of one API request, shared by everything it calls.
+    
+    partial is set once any nested call ran out of budget, so results put
+    together from the remaining calls are known to be incomplete. Marks
+    propagate to the enclosing deadlines.
+    """
+    def __init__(self, expires_at: float, parent: Optional["Deadline"] = None):
+        self.expires_at = expires_at
+        self.parent = parent
+        self.partial = False
+    
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+    
+    def mark_partial(self) -> None:
+        deadline = self
+        while deadline is not None:
+            deadline.partial = True
+            deadline = deadline.parent
+
+
+# Deadline request aktif, ikut tersalin ke thread lewat run_blocking/copy_context
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("deadline", default=None)
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {"requests": 0, "exceeded": 0, "partial": 0}
+
+
+@contextmanager
+def deadline(budget: float) -> Iterator[Optional[Deadline]]:
+    """
+    Give the code in this context at most budget seconds.
+    
+    Nested deadlines never extend an outer one. A budget of 0 or less
+    means no deadline.
+    """
+    outer = _current.get()
+    if budget <= 0 or (outer is not None and outer.remaining() <= budget):
+        yield outer
+        return
+    
+    current = Deadline(time.monotonic() + budget, parent=outer)
+    token = _current.set(current)
+    try:
+        yield current
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def partial_scope() -> Iterator[Optional[Deadline]]:
+    """
+    Track partial results of the code in this context on their own.
+    
+    The yielded scope (None without a deadline) has the same expiry as
+    the current deadline; its partial flag only reflects calls made inside
+    the context, while marks still reach the enclosing request.
+    """
+    outer = _current.get()
+    if outer is None:
+        yield None
+        return
+    
+    scope = Deadline(outer.expires_at, parent=outer)
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def request_deadline(endpoint: str) -> Iterator[Optional[Deadline]]:
+    """
+    Apply an API endpoint's budget from settings.ENDPOINT_DEADLINES.
+    
+    Endpoints without an entry get settings.REQUEST_DEADLINE.
+    """
+    with _stats_lock:
+        _stats["requests"] += 1
+    with deadline(settings.ENDPOINT_DEADLINES.get(endpoint, settings.REQUEST_DEADLINE)) as current:
+        try:
+            yield current
+        finally:
+            if current is not None and current.partial:
+                with _stats_lock:
+                    _stats["partial"] += 1
+
+
+def remaining() -> Optional[float]:
+    """
+    Seconds left in the current deadline, None without one.
+    """
+    current = _current.get()
+    return current.remaining() if current is not None else None
+
+
+def exceeded(where: str) -> DeadlineExceeded:
+    """
+    Record that the current deadline ran out and build the error to raise.
+    
+    Marks the request's result as partial.
+    """
+    current = _current.get()
+    if current is not None:
+        current.mark_partial()
+    with _stats_lock:
+        _stats["exceeded"] += 1
+    return DeadlineExceeded(where)
+
+
+def check_deadline(where: str) -> None:
+    """
+    Raise DeadlineExceeded if the current deadline has (almost) run out.
+    """
+    left = remaining()
+    if left is not None and left <= _MIN_REMAINING:
+        raise exceeded(where)
+
+
+def upstream_timeout(default: Optional[float] = None, where: str = "request upstream") -> float:
+    """
+    Timeout for one upstream call: the remaining budget, capped at default.
+    
+    Args:
+        default: Timeout without a deadline (optional, defaults to settings.HTTP_TIMEOUT)
+        where: Description of the call for DeadlineExceeded
+    
+    Returns:
+        Timeout in seconds
+    """
+    default = settings.HTTP_TIMEOUT if default is None else default
+    check_deadline(where)
+    left = remaining()
+    return default if left is None else min(default, left)
+
+
+def mark_partial() -> None:
+    """
+    Mark the current request's result as incomplete, e.g. after giving up on slow sub-requests.
+    """
+    current = _current.get()
+    if current is not None:
+        current.mark_partial()
+
+
+def get_deadline_stats() -> Dict[str, int]:
+    """
+    Get deadline statistics.
+    
+    Returns:
+        Dictionary with requests run under an endpoint budget, upstream
+        calls refused because the budget ran out, and partial responses
+    """
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,240 @@
+import collections
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Dict, NamedTuple, Optional
+
+from .config import settings
+
+
+class DiskEntry(NamedTuple):
+    """
+    A response body stored on disk with its metadata.
+    """
+    url: str
+    body: bytes
+    content_hash: str
+    fetched_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class DiskCache:
+    """
+    Compressed, content-addressed store of upstream response bodies.
+    
+    Bodies are zlib-compressed under objects/<sha256 of body>, so identical
+    pages fetched from different URLs are stored once. Each URL has a small
+    JSON ref under refs/ pointing at its current body, with fetched_at,
+    ETag and Last-Modified. Objects are read through mmap and evicted least
+    recently used first once their total size exceeds max_bytes; refs to
+    evicted objects are dropped lazily.
+    """
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._objects_dir = os.path.join(directory, "objects")
+        self._refs_dir = os.path.join(directory, "refs")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._refs_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # content_hash -> ukuran file terkompresi, urutan LRU (paling lama di depan)
+        self._objects: "collections.OrderedDict[str, int]" = collections.OrderedDict()
+        self.total_bytes = 0
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "dedup_writes": 0, "evictions": 0}
+        self._load_index()
+    
+    def _load_index(self) -> None:
+        found = []
+        for name in os.listdir(self._objects_dir):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self._objects_dir, name))
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(found):
+            self._objects[name] = size
+            self.total_bytes += size
+    
+    def _object_path(self, content_hash: str) -> str:
+        return os.path.join(self._objects_dir, content_hash)
+    
+    def _ref_path(self, url: str) -> str:
+        return os.path.join(self._refs_dir, f"{_digest(url.encode('utf-8'))}.json")
+    
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+    
+    def _read_ref(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._ref_path(url), "rb") as f:
+                return json.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+    
+    def _read_object(self, content_hash: str) -> Optional[bytes]:
+        try:
+            with open(self._object_path(content_hash), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return zlib.decompress(mapped)
+        except (FileNotFoundError, zlib.error):
+            return None
+    
+    def _evict_locked(self) -> None:
+        while self.total_bytes > self.max_bytes and self._objects:
+            content_hash, size = self._objects.popitem(last=False)
+            self.total_bytes -= size
+            self._stats["evictions"] += 1
+            try:
+                os.unlink(self._object_path(content_hash))
+            except FileNotFoundError:
+                pass
+    
+    def get(self, url: str) -> Optional[DiskEntry]:
+        """
+        Get the stored body and metadata for a URL.
+        
+        Args:
+            url: Upstream URL
+        
+        Returns:
+            DiskEntry, or None if the URL was never stored or its body was evicted
+        """
+        ref = self._read_ref(url)
+        body = self._read_object(ref["hash"]) if ref else None
+        with self._lock:
+            if body is None:
+                self._stats["misses"] += 1
+                if ref:
+                    self.total_bytes -= self._objects.pop(ref["hash"], 0)
+                return None
+            self._stats["hits"] += 1
+            if ref["hash"] in self._objects:
+                self._objects.move_to_end(ref["hash"])
+        try:
+            # mtime adalah jam LRU saat index dibangun ulang setelah restart
+            os.utime(self._object_path(ref["hash"]))
+        except FileNotFoundError:
+            pass
+        return DiskEntry(url, body, ref["hash"], ref["fetched_at"], ref.get("etag"), ref.get("last_modified"))
+    
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        fetched_at: Optional[float] = None,
+    ) -> str:
+        """
+        Store a response body for a URL.
+        
+        Args:
+            url: Upstream URL
+            body: Response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            fetched_at: Fetch time (optional, defaults to now)
+        
+        Returns:
+            Content hash of the body
+        """
+        content_hash = _digest(body)
+        path = self._object_path(content_hash)
+        with self._lock:
+            known = content_hash in self._objects and os.path.exists(path)
+        if known:
+            with self._lock:
+                self._stats["dedup_writes"] += 1
+                self._objects.move_to_end(content_hash)
+        else:
+            compressed = zlib.compress(body, 6)
+            self._write_atomic(path, compressed)
+            with self._lock:
+                self._stats["writes"] += 1
+                self.total_bytes -= self._objects.pop(content_hash, 0)
+                self._objects[content_hash] = len(compressed)
+                self.total_bytes += len(compressed)
+        
+        ref = {
+            "url": url,
+            "hash": content_hash,
+            "fetched_at": fetched_at if fetched_at is not None else time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._write_atomic(self._ref_path(url), json.dumps(ref).encode("utf-8"))
+        with self._lock:
+            self._evict_locked()
+        return content_hash
+    
+    def touch(self, url: str, fetched_at: Optional[float] = None) -> bool:
+        """
+        Mark a stored body as fetched again (e.g. after a 304) without rewriting it.
+        
+        Args:
+            url: Upstream URL
+            fetched_at: Fetch time (optional, defaults to now)
+        
+        Returns:
+            True if the URL was stored
+        """
+        ref = self._read_ref(url)
+        if ref is None:
+            return False
+        ref["fetched_at"] = fetched_at if fetched_at is not None else time.time()
+        self._write_atomic(self._ref_path(url), json.dumps(ref).encode("utf-8"))
+        return True
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "objects": len(self._objects),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Disk tier HTML, aktif jika settings.HTML_DISK_CACHE_DIR diisi
+_html_disk_cache: Optional[DiskCache] = None
+_html_disk_cache_lock = threading.Lock()
+
+
+def get_html_disk_cache() -> Optional[DiskCache]:
+    """
+    Get the on-disk HTML cache, creating it on first use.
+    
+    Returns:
+        DiskCache under settings.HTML_DISK_CACHE_DIR, or None if it is not configured
+    """
+    global _html_disk_cache
+    if not settings.HTML_DISK_CACHE_DIR:
+        return None
+    with _html_disk_cache_lock:
+        if _html_disk_cache is None or _html_disk_cache.directory != settings.HTML_DISK_CACHE_DIR:
+            _html_disk_cache = DiskCache(settings.HTML_DISK_CACHE_DIR, settings.HTML_DISK_CACHE_MAX_BYTES)
+        return _html_disk_cache
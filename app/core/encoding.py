@@ -0,0 +1,98 @@
+import codecs
+import re
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(rb"<meta[^>]+?charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+# Sama dengan prescan HTML: deklarasi <meta charset> harus ada di 1024 byte pertama
+_META_PRESCAN_BYTES = 1024
+
+# Encoding terakhir yang diketahui per host upstream
+_host_encodings: Dict[str, str] = {}
+_lock = threading.Lock()
+_stats: Dict[str, int] = {"header": 0, "host": 0, "meta": 0, "unknown": 0}
+
+
+def _codec_name(name: Any) -> Optional[str]:
+    try:
+        return codecs.lookup(name.decode("ascii") if isinstance(name, bytes) else name).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+
+def declared_charset(content_type: Optional[str]) -> Optional[str]:
+    """
+    Get the charset declared in a Content-Type header, None if absent or unknown.
+    """
+    match = _CHARSET.search(content_type or "")
+    return _codec_name(match.group(1)) if match else None
+
+
+def meta_charset(body: bytes) -> Optional[str]:
+    """
+    Get the charset declared by a <meta> tag at the start of an HTML body.
+    """
+    match = _META_CHARSET.search(body[:_META_PRESCAN_BYTES])
+    return _codec_name(match.group(1)) if match else None
+
+
+def _count(stat: str) -> None:
+    with _lock:
+        _stats[stat] += 1
+
+
+def page_encoding(url: str, content_type: Optional[str], body: bytes = b"") -> Optional[str]:
+    """
+    Get the encoding of an HTML response without decoding its body.
+    
+    Uses the Content-Type charset, then the encoding last seen for the
+    URL's host, then the <meta> charset at the start of the body. Found
+    encodings are remembered per host, since a site serves all its pages
+    in one encoding.
+    
+    Args:
+        url: Response URL
+        content_type: Content-Type response header
+        body: Response body, or its first chunk (optional)
+    
+    Returns:
+        Python codec name, or None to let the parser detect it
+    """
+    host = urlsplit(url).netloc.lower()
+    encoding = declared_charset(content_type)
+    if encoding is not None:
+        stat = "header"
+    else:
+        with _lock:
+            encoding = _host_encodings.get(host)
+        stat = "host"
+        if encoding is None:
+            encoding = meta_charset(body)
+            stat = "meta" if encoding is not None else "unknown"
+    _count(stat)
+    if encoding is not None and stat != "host":
+        with _lock:
+            _host_encodings[host] = encoding
+    return encoding
+
+
+def get_encoding_stats() -> Dict[str, Any]:
+    """
+    Get page encoding statistics.
+    
+    Returns:
+        Dictionary with how each page's encoding was found and the
+        encoding remembered per host
+    """
+    with _lock:
+        return {**_stats, "hosts": dict(_host_encodings)}
+
+
+def clear_host_encodings() -> None:
+    """
+    Forget the encodings remembered per host.
+    """
+    with _lock:
+        _host_encodings.clear()
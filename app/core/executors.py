@@ -0,0 +1,210 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Executor bernama: blocking (run_blocking dari event loop), io (fan-out request upstream), cpu (fan-out parsing)
+BLOCKING = "blocking"
+IO = "io"
+CPU = "cpu"
+
+
+class InstrumentedExecutor(concurrent.futures.ThreadPoolExecutor):
+    """
+    Shared thread pool with queue depth and active thread metrics.
+    
+    With caller_runs, at most max_workers tasks are admitted at a time and
+    further submits run in the submitting thread instead of queueing. Every
+    admitted task then has a worker, so a task that waits on tasks it
+    submitted to the same pool (nested fan-out) cannot deadlock it, and a
+    saturated pool slows down its callers instead of growing a backlog.
+    Never use caller_runs for pools the event loop submits to.
+    """
+    def __init__(self, name: str, max_workers: int, caller_runs: bool = False):
+        super().__init__(max_workers=max_workers, thread_name_prefix=name)
+        self.name = name
+        self.max_workers = max_workers
+        self.caller_runs = caller_runs
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._caller_runs = 0
+    
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "concurrent.futures.Future[T]":
+        with self._stats_lock:
+            admit = not self.caller_runs or self._queued + self._active < self.max_workers
+            if admit:
+                self._queued += 1
+            else:
+                self._caller_runs += 1
+        if admit:
+            try:
+                future = super().submit(self._run, fn, args, kwargs)
+            except BaseException:
+                with self._stats_lock:
+                    self._queued -= 1
+                raise
+            # Future yang dibatalkan sebelum jalan tidak pernah masuk _run, lepaskan slotnya di sini
+            future.add_done_callback(self._release_cancelled)
+            return future
+        
+        future: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+    
+    def _release_cancelled(self, future: "concurrent.futures.Future[Any]") -> None:
+        if future.cancelled():
+            with self._stats_lock:
+                self._queued -= 1
+    
+    def _run(self, fn: Callable[..., T], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> T:
+        with self._stats_lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+                self._completed += 1
+    
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {
+                "max_workers": self.max_workers,
+                "threads": len(self._threads),
+                "active": self._active,
+                "queued": self._queued,
+                "completed": self._completed,
+                "caller_runs": self._caller_runs,
+            }
+
+
+def _executor_config(name: str) -> Tuple[int, bool]:
+    if name == BLOCKING:
+        return settings.BLOCKING_EXECUTOR_WORKERS, False
+    if name == IO:
+        return settings.IO_EXECUTOR_WORKERS, True
+    if name == CPU:
+        return settings.CPU_EXECUTOR_WORKERS, True
+    raise ValueError(f"Executor tidak dikenal: {name}")
+
+
+_executors: Dict[str, InstrumentedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str) -> InstrumentedExecutor:
+    """
+    Get a named shared executor, creating it on first use.
+    
+    Args:
+        name: BLOCKING, IO or CPU
+    
+    Returns:
+        InstrumentedExecutor sized by settings.<NAME>_EXECUTOR_WORKERS
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            max_workers, caller_runs = _executor_config(name)
+            executor = InstrumentedExecutor(name, max_workers, caller_runs=caller_runs)
+            _executors[name] = executor
+        return executor
+
+
+def get_blocking_executor() -> InstrumentedExecutor:
+    """
+    Get the shared executor for blocking work, creating it on first use.
+    
+    Returns:
+        Executor with at most settings.BLOCKING_EXECUTOR_WORKERS threads
+    """
+    return get_executor(BLOCKING)
+
+
+def submit(name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> "concurrent.futures.Future[T]":
+    """
+    Run a function on a named executor with a copy of the caller's context.
+    
+    Context variables (request deadline, revalidation) are visible in the
+    worker thread, as with run_blocking.
+    
+    Args:
+        name: IO for upstream fan-out, CPU for parsing fan-out
+        func: Function to run
+        *args, **kwargs: Arguments to pass to func
+    
+    Returns:
+        Future of func's result
+    """
+    return get_executor(name).submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking function on the bounded executor without blocking the event loop.
+    
+    The caller's context variables are propagated into the worker thread.
+    
+    Args:
+        func: Blocking function to run
+        *args, **kwargs: Arguments to pass to func
+    
+    Returns:
+        Result of func
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_blocking_executor(), call)
+
+
+def start_executors() -> None:
+    """
+    Create the shared executors. Called from the application lifespan.
+    """
+    for name in (BLOCKING, IO, CPU):
+        executor = get_executor(name)
+        logger.info(f"Executor {name} siap ({executor.max_workers} thread)")
+
+
+def get_executor_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get per executor statistics.
+    
+    Returns:
+        Mapping of executor name to pool size, started threads, running
+        and queued tasks, completed tasks and tasks run by the caller
+        because the pool was saturated
+    """
+    with _executors_lock:
+        executors = dict(_executors)
+    return {name: executor.stats() for name, executor in executors.items()}
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """
+    Shut down the shared executors. Called from the application lifespan.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+    if executors:
+        logger.info("Executor ditutup")
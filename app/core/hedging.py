@@ -0,0 +1,210 @@
+import asyncio
+import collections
+import concurrent.futures
+import threading
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from .config import settings
+from .executors import IO, submit
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Hedged requests for one call site.
+    
+    A call that has not finished after the call site's observed latency
+    percentile gets a second, identical request; the first to succeed wins
+    and the other is cancelled. Each call earns budget_ratio of a hedge
+    token and each hedge spends one, so at most about budget_ratio of
+    calls are hedged. No hedging happens until min_samples latencies were
+    observed.
+    """
+    def __init__(
+        self,
+        name: str,
+        percentile: float,
+        budget_ratio: float,
+        min_samples: int,
+        window: int = 200,
+        max_tokens: float = 10.0,
+    ):
+        self.name = name
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.max_tokens = max_tokens
+        self._samples: Deque[float] = collections.deque(maxlen=window)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"calls": 0, "hedges": 0, "hedge_wins": 0, "budget_exhausted": 0}
+    
+    def delay(self) -> Optional[float]:
+        """
+        Seconds to wait before hedging, None while there are too few samples.
+        """
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[int(self.percentile * (len(ordered) - 1))]
+    
+    def observe(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+    
+    def _start_call(self) -> None:
+        with self._lock:
+            self._stats["calls"] += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget_ratio)
+    
+    def _try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                self._stats["budget_exhausted"] += 1
+                return False
+            self._tokens -= 1.0
+            self._stats["hedges"] += 1
+            return True
+    
+    def _won(self) -> None:
+        with self._lock:
+            self._stats["hedge_wins"] += 1
+    
+    def _timed(self, func: Callable[[], T]) -> T:
+        start = time.monotonic()
+        result = func()
+        self.observe(time.monotonic() - start)
+        return result
+    
+    async def _atimed(self, func: Callable[[], Awaitable[T]]) -> T:
+        start = time.monotonic()
+        result = await func()
+        self.observe(time.monotonic() - start)
+        return result
+    
+    def run(self, func: Callable[[], T]) -> T:
+        """
+        Call an idempotent blocking function, hedging it when it is slow.
+        
+        Args:
+            func: Function to call, possibly twice concurrently
+        
+        Returns:
+            Result of the first call to succeed
+        """
+        self._start_call()
+        delay = self.delay()
+        if delay is None:
+            return self._timed(func)
+        
+        # Setiap request membawa salinan context pemanggil (deadline, revalidasi)
+        primary = submit(IO, self._timed, func)
+        futures = [primary]
+        try:
+            done, _ = concurrent.futures.wait([primary], timeout=delay)
+            if done or not self._try_spend():
+                return primary.result()
+            
+            hedge = submit(IO, self._timed, func)
+            futures.append(hedge)
+            pending = {primary, hedge}
+            error = None
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is hedge:
+                            self._won()
+                        return future.result()
+                    error = future.exception()
+            raise error
+        finally:
+            # Request yang kalah tidak ditunggu, yang belum mulai dibatalkan
+            for future in futures:
+                future.cancel()
+    
+    async def arun(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await an idempotent coroutine function, hedging it when it is slow.
+        
+        Args:
+            func: Coroutine function to call, possibly twice concurrently
+        
+        Returns:
+            Result of the first call to succeed
+        """
+        self._start_call()
+        delay = self.delay()
+        if delay is None:
+            return await self._atimed(func)
+        
+        primary = asyncio.ensure_future(self._atimed(func))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self._try_spend():
+                return await primary
+            
+            hedge = asyncio.ensure_future(self._atimed(func))
+            pending.add(hedge)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._won()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def stats(self) -> Dict[str, Any]:
+        delay = self.delay()
+        with self._lock:
+            return {**self._stats, "samples": len(self._samples), "delay": delay, "tokens": round(self._tokens, 2)}
+
+
+# Satu policy per call site yang mengaktifkan hedging
+_policies: Dict[str, HedgePolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def get_hedge_policy(name: str) -> HedgePolicy:
+    """
+    Get the hedging policy for a call site, creating it on first use.
+    
+    Args:
+        name: Call site name, e.g. "episode" or "jadwal"
+    
+    Returns:
+        HedgePolicy configured from settings.HEDGE_*
+    """
+    with _policies_lock:
+        policy = _policies.get(name)
+        if policy is None:
+            policy = HedgePolicy(
+                name,
+                percentile=settings.HEDGE_PERCENTILE,
+                budget_ratio=settings.HEDGE_BUDGET_RATIO,
+                min_samples=settings.HEDGE_MIN_SAMPLES,
+            )
+            _policies[name] = policy
+        return policy
+
+
+def get_hedging_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get per call site hedging statistics.
+    
+    Returns:
+        Mapping of call site to call/hedge counters, current hedge delay and budget
+    """
+    with _policies_lock:
+        policies = dict(_policies)
+    return {name: policy.stats() for name, policy in policies.items()}
@@ -0,0 +1,124 @@
+import logging
+from typing import Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import settings
+from .transport import AsyncRecordReplayTransport, RecordReplayAdapter, get_fixture_store, transport_mode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
+}
+
+# Shared connection pools, satu per proses worker
+_async_client: Optional[httpx.AsyncClient] = None
+_sync_session: Optional[requests.Session] = None
+
+
+def _create_async_client() -> httpx.AsyncClient:
+    """
+    Create the shared async HTTP client.
+    
+    With settings.UPSTREAM_TRANSPORT_MODE set, requests are recorded to or
+    replayed from settings.UPSTREAM_FIXTURE_DIR.
+    """
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+    transport = None
+    mode = transport_mode()
+    if mode:
+        transport = AsyncRecordReplayTransport(
+            get_fixture_store(),
+            mode,
+            latency=settings.UPSTREAM_REPLAY_LATENCY,
+            inner=httpx.AsyncHTTPTransport(limits=limits),
+        )
+        logger.info(f"Async HTTP client memakai transport {mode} ({settings.UPSTREAM_FIXTURE_DIR})")
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        limits=limits,
+        timeout=settings.HTTP_TIMEOUT,
+        follow_redirects=True,
+        transport=transport,
+    )
+
+
+def _create_sync_session() -> requests.Session:
+    """
+    Create the shared synchronous HTTP session.
+    
+    With settings.UPSTREAM_TRANSPORT_MODE set, requests are recorded to or
+    replayed from settings.UPSTREAM_FIXTURE_DIR.
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    pool_kwargs = {
+        "pool_connections": settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        "pool_maxsize": settings.HTTP_MAX_CONNECTIONS,
+    }
+    mode = transport_mode()
+    if mode:
+        adapter = RecordReplayAdapter(get_fixture_store(), mode, latency=settings.UPSTREAM_REPLAY_LATENCY, **pool_kwargs)
+        logger.info(f"Sync HTTP session memakai transport {mode} ({settings.UPSTREAM_FIXTURE_DIR})")
+    else:
+        adapter = HTTPAdapter(**pool_kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use.
+    
+    Returns:
+        httpx.AsyncClient backed by the process-wide connection pool
+    """
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = _create_async_client()
+        logger.info("Async HTTP client dibuat")
+    return _async_client
+
+
+def get_sync_session() -> requests.Session:
+    """
+    Get the shared synchronous HTTP session, creating it on first use.
+    
+    Returns:
+        requests.Session backed by the process-wide connection pool
+    """
+    global _sync_session
+    if _sync_session is None:
+        _sync_session = _create_sync_session()
+        logger.info("Sync HTTP session dibuat")
+    return _sync_session
+
+
+async def startup_http_clients() -> None:
+    """
+    Open the shared HTTP clients. Called from the application lifespan.
+    """
+    get_async_client()
+    get_sync_session()
+
+
+async def shutdown_http_clients() -> None:
+    """
+    Close the shared HTTP clients. Called from the application lifespan.
+    """
+    global _async_client, _sync_session
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    if _sync_session is not None:
+        _sync_session.close()
+        _sync_session = None
+    logger.info("HTTP clients ditutup")
@@ -0,0 +1,64 @@
+import threading
+import time
+from typing import Dict
+
+from .config import settings
+
+# Route JSON yang gagal: nama -> waktu (monotonic) route boleh dicoba lagi
+_disabled_until: Dict[str, float] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+_lock = threading.Lock()
+
+
+def _route_stats(name: str) -> Dict[str, int]:
+    return _stats.setdefault(name, {"json": 0, "html": 0, "failures": 0})
+
+
+def json_route_enabled(name: str) -> bool:
+    """
+    Check whether a JSON route may be tried instead of scraping HTML.
+    
+    Routes that failed are skipped for settings.JSON_ROUTE_RETRY_AFTER seconds.
+    """
+    if not settings.JSON_ROUTES_ENABLED:
+        return False
+    with _lock:
+        return time.monotonic() >= _disabled_until.get(name, 0.0)
+
+
+def disable_json_route(name: str) -> None:
+    """
+    Stop using a JSON route that errored or lacks needed fields, until it is retried.
+    """
+    with _lock:
+        _disabled_until[name] = time.monotonic() + settings.JSON_ROUTE_RETRY_AFTER
+        _route_stats(name)["failures"] += 1
+
+
+def record_json_route(name: str, used_json: bool) -> None:
+    """
+    Count a page served from its JSON route or scraped from HTML.
+    """
+    with _lock:
+        _route_stats(name)["json" if used_json else "html"] += 1
+
+
+def get_json_route_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get JSON route statistics.
+    
+    Returns:
+        Mapping of route name to pages served from JSON, pages scraped
+        from HTML and route failures
+    """
+    with _lock:
+        return {name: dict(stats) for name, stats in _stats.items()}
+
+
+def reset_json_routes() -> None:
+    """
+    Re-enable all JSON routes and clear their statistics.
+    """
+    with _lock:
+        _disabled_until.clear()
+        _stats.clear()
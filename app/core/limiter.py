@@ -0,0 +1,299 @@
+import asyncio
+import collections
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from .config import settings
+from .deadline import DeadlineExceeded, exceeded, remaining
+
+
+class _Waiter:
+    """
+    A caller queued for a slot: a thread (event) or an asyncio task (future on its loop).
+    """
+    __slots__ = ("event", "loop", "future", "granted")
+    
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop
+        self.future = loop.create_future() if loop is not None else None
+        self.event = threading.Event() if loop is None else None
+        self.granted = False
+
+
+def _set_granted(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """
+    Check whether a failed upstream call signals overload.
+    
+    429 and 5xx responses and transport errors (timeouts, resets) count;
+    other HTTP statuses such as 404, cancellation and the caller's own
+    deadline running out do not.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(error, Exception)
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limiter whose window adapts AIMD-style.
+    
+    Every call that finishes under latency_target without an overload error
+    grows the window by 1/limit (about +1 per window of calls). A slow call
+    or an overload error multiplies it by backoff, at most once per
+    decrease_interval so one burst of failures counts as one signal.
+    Callers over the window queue in FIFO order; threads and asyncio tasks
+    on any event loop share the same window.
+    """
+    def __init__(
+        self,
+        initial: float,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        backoff: float = 0.5,
+        decrease_interval: float = 1.0,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.decrease_interval = decrease_interval
+        self.in_flight = 0
+        self._queue: Deque[_Waiter] = collections.deque()
+        self._lock = threading.Lock()
+        self._last_decrease = float("-inf")
+        self._latency_ewma: Optional[float] = None
+        self._stats: Dict[str, Any] = {
+            "acquired": 0,
+            "queued": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+            "successes": 0,
+            "errors": 0,
+            "slow": 0,
+            "decreases": 0,
+        }
+    
+    def _capacity(self) -> int:
+        return max(self.min_limit, int(self.limit))
+    
+    def _wake_locked(self) -> None:
+        while self._queue and self.in_flight < self._capacity():
+            waiter = self._queue.popleft()
+            waiter.granted = True
+            self.in_flight += 1
+            if waiter.event is not None:
+                waiter.event.set()
+                continue
+            try:
+                waiter.loop.call_soon_threadsafe(_set_granted, waiter.future)
+            except RuntimeError:
+                # Event loop waiter sudah ditutup, slot dikembalikan
+                waiter.granted = False
+                self.in_flight -= 1
+    
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self._stats["acquired"] += 1
+            if waited > 0:
+                self._stats["queued"] += 1
+                self._stats["wait_total"] += waited
+                self._stats["wait_max"] = max(self._stats["wait_max"], waited)
+    
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Block the calling thread until a slot is free.
+        
+        Args:
+            timeout: Seconds to wait at most (optional), DeadlineExceeded is raised after that
+        """
+        start = time.monotonic()
+        with self._lock:
+            if not self._queue and self.in_flight < self._capacity():
+                self.in_flight += 1
+                waiter = None
+            else:
+                waiter = _Waiter()
+                self._queue.append(waiter)
+        if waiter is not None and not waiter.event.wait(timeout):
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._queue.remove(waiter)
+            if not granted:
+                raise exceeded("slot limiter upstream")
+        self._record_wait(time.monotonic() - start if waiter is not None else 0.0)
+    
+    async def aacquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait without blocking the event loop until a slot is free.
+        
+        Args:
+            timeout: Seconds to wait at most (optional), DeadlineExceeded is raised after that
+        """
+        start = time.monotonic()
+        with self._lock:
+            if not self._queue and self.in_flight < self._capacity():
+                self.in_flight += 1
+                waiter = None
+            else:
+                waiter = _Waiter(asyncio.get_running_loop())
+                self._queue.append(waiter)
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(waiter.future, timeout)
+            except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+                with self._lock:
+                    granted = waiter.granted
+                    if not granted:
+                        self._queue.remove(waiter)
+                # Slot sudah diberikan saat dibatalkan, teruskan ke waiter berikutnya
+                if granted:
+                    self.release()
+                if isinstance(e, asyncio.TimeoutError):
+                    raise exceeded("slot limiter upstream") from None
+                raise
+        self._record_wait(time.monotonic() - start if waiter is not None else 0.0)
+    
+    def release(self) -> None:
+        """
+        Return a slot and hand it to the next queued caller.
+        """
+        with self._lock:
+            self.in_flight -= 1
+            self._wake_locked()
+    
+    def record(self, latency: float, failed: bool = False) -> None:
+        """
+        Feed the outcome of one call into the window.
+        
+        Args:
+            latency: Seconds the call took
+            failed: Whether the call failed with an overload error
+        """
+        with self._lock:
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            else:
+                self._latency_ewma += 0.2 * (latency - self._latency_ewma)
+            
+            slow = latency > self.latency_target
+            if failed or slow:
+                self._stats["errors" if failed else "slow"] += 1
+                now = time.monotonic()
+                if now - self._last_decrease >= self.decrease_interval:
+                    self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                    self._last_decrease = now
+                    self._stats["decreases"] += 1
+            else:
+                self._stats["successes"] += 1
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+                self._wake_locked()
+    
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Hold a slot for one blocking upstream call and record its outcome.
+        
+        Waiting for the slot is bounded by the request deadline.
+        """
+        self.acquire(remaining())
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.record(time.monotonic() - start, failed=is_overload_error(e))
+            raise
+        else:
+            self.record(time.monotonic() - start)
+        finally:
+            self.release()
+    
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """
+        Hold a slot for one async upstream call and record its outcome.
+        
+        Cancelled calls are not recorded. Waiting for the slot is bounded by
+        the request deadline.
+        """
+        await self.aacquire(remaining())
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.record(time.monotonic() - start, failed=is_overload_error(e))
+            raise
+        else:
+            self.record(time.monotonic() - start)
+        finally:
+            self.release()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            queued = self._stats["queued"]
+            return {
+                **self._stats,
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "waiting": len(self._queue),
+                "wait_avg": self._stats["wait_total"] / queued if queued else 0.0,
+                "latency_ewma": self._latency_ewma,
+            }
+
+
+# Satu limiter per host upstream, dibagi semua scraper dalam proses
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(url: str) -> AdaptiveLimiter:
+    """
+    Get the concurrency limiter for a URL's host, creating it on first use.
+    
+    Args:
+        url: Upstream URL
+    
+    Returns:
+        AdaptiveLimiter configured from settings.UPSTREAM_LIMIT_*
+    """
+    host = urlsplit(url).netloc.lower()
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveLimiter(
+                initial=settings.UPSTREAM_LIMIT_INITIAL,
+                min_limit=settings.UPSTREAM_LIMIT_MIN,
+                max_limit=settings.UPSTREAM_LIMIT_MAX,
+                latency_target=settings.UPSTREAM_LATENCY_TARGET,
+                backoff=settings.UPSTREAM_LIMIT_BACKOFF,
+                decrease_interval=settings.UPSTREAM_LIMIT_DECREASE_INTERVAL,
+            )
+            _limiters[host] = limiter
+        return limiter
+
+
+def get_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get per-host limiter statistics.
+    
+    Returns:
+        Mapping of host to window size, in-flight/queued calls, queue wait
+        times (seconds) and outcome counters
+    """
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {host: limiter.stats() for host, limiter in limiters.items()}
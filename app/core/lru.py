@@ -0,0 +1,183 @@
+import heapq
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Ukuran container kosong, dipakai sebagai overhead per entry
+_ENTRY_OVERHEAD = sys.getsizeof({}) + sys.getsizeof(())
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estimate the memory footprint of a JSON-like value in bytes.
+    
+    Walks dicts, lists, tuples and sets iteratively and sums sys.getsizeof of
+    every node. Shared sub-objects are counted once.
+    
+    Args:
+        obj: Value to measure
+    
+    Returns:
+        Approximate size in bytes
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+    return total
+
+
+class BoundedCache:
+    """
+    Thread-safe LRU mapping bounded by entry count and estimated bytes.
+    
+    Values are cache entries ({"timestamp", "data", optional "expires_at"}).
+    The size of an entry is estimated once when it is inserted. Entries whose
+    "expires_at" has passed are evicted eagerly on every read and write.
+    """
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._data: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str, int]] = []
+        self._versions: Dict[str, int] = {}
+        self._counter = 0
+        self._lock = threading.RLock()
+    
+    def _remove(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._data.pop(key, None)
+        if item is None:
+            return None
+        self._versions.pop(key, None)
+        self.total_bytes -= item[1]
+        return item[0]
+    
+    def _purge_expired(self, now: Optional[float] = None) -> None:
+        now = now if now is not None else time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, key, version = heapq.heappop(heap)
+            # Abaikan catatan basi dari entry yang sudah ditimpa/dihapus
+            if self._versions.get(key) == version:
+                self._remove(key)
+                self.expirations += 1
+        # Cegah heap membengkak oleh catatan basi
+        if len(heap) > 2 * len(self._data) + 64:
+            self._expiry_heap = [item for item in heap if self._versions.get(item[1]) == item[2]]
+            heapq.heapify(self._expiry_heap)
+    
+    def _evict_overflow(self) -> None:
+        while self._data and (len(self._data) > self.max_entries or self.total_bytes > self.max_bytes):
+            key = next(iter(self._data))
+            self._remove(key)
+            self.evictions += 1
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get an entry and mark it as most recently used.
+        """
+        with self._lock:
+            self._purge_expired()
+            item = self._data.get(key)
+            if item is None:
+                return default
+            self._data.move_to_end(key)
+            return item[0]
+    
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Insert or replace an entry, evicting expired and least recently used entries.
+        """
+        size = _ENTRY_OVERHEAD + len(key) + estimate_size(entry.get("data"))
+        expires_at = entry.get("expires_at")
+        with self._lock:
+            self._remove(key)
+            self._counter += 1
+            self._versions[key] = self._counter
+            self._data[key] = (entry, size)
+            self.total_bytes += size
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key, self._counter))
+            self._purge_expired()
+            self._evict_overflow()
+    
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._remove(key)
+            return default if entry is None else entry
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._versions.clear()
+            self._expiry_heap = []
+            self.total_bytes = 0
+    
+    def size_of(self, key: str) -> int:
+        """
+        Get the size estimated for an entry at insert time.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            return item[1] if item else 0
+    
+    def keys(self) -> List[str]:
+        with self._lock:
+            self._purge_expired()
+            return list(self._data.keys())
+    
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            self._purge_expired()
+            return [(key, item[0]) for key, item in self._data.items()]
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+    
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self.get(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry
+    
+    def __setitem__(self, key: str, entry: Dict[str, Any]) -> None:
+        self.set(key, entry)
+    
+    def __delitem__(self, key: str) -> None:
+        if self.pop(key) is None:
+            raise KeyError(key)
+    
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            self._purge_expired()
+            return key in self._data
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
@@ -0,0 +1,172 @@
+import re
+import threading
+import time
+from typing import Any, AnyStr, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .config import settings
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+class MirrorHealth:
+    """
+    EWMA of latency and error rate of one mirror.
+    """
+    __slots__ = ("base_url", "latency", "error_rate", "last_failure", "requests", "failures")
+    
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.last_failure = float("-inf")
+        self.requests = 0
+        self.failures = 0
+
+
+class MirrorPool:
+    """
+    Interchangeable domains of one source, ranked by observed health.
+    
+    URLs are built and cached against the canonical base URL. Each request
+    is routed to the mirror with the lowest latency EWMA among the healthy
+    ones (error-rate EWMA under error_threshold, or cooldown seconds since
+    the last failure); untried mirrors rank first so each gets measured.
+    Unhealthy mirrors are still tried last, as a final failover.
+    """
+    def __init__(self, canonical: str, mirrors: List[str], alpha: float, error_threshold: float, cooldown: float):
+        self.canonical = canonical.rstrip("/")
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        bases = [self.canonical] + [mirror.rstrip("/") for mirror in mirrors]
+        self._health: Dict[str, MirrorHealth] = {}
+        for base in bases:
+            self._health.setdefault(_host(base), MirrorHealth(base))
+        self._canonical_host = _host(self.canonical)
+        others = [re.escape(host) for host in self._health if host != self._canonical_host]
+        # Host mirror di teks (termasuk https:\/\/host di JSON), bukan bagian dari domain lain
+        pattern = r"(?<![\w.-])(?:%s)(?![\w-]|\.\w)" % "|".join(others)
+        self._other_hosts = re.compile(pattern, re.IGNORECASE) if others else None
+        self._other_hosts_bytes = re.compile(pattern.encode("utf-8"), re.IGNORECASE) if others else None
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._health)
+    
+    def owns(self, url: str) -> bool:
+        return _host(url) in self._health
+    
+    def _healthy(self, health: MirrorHealth, now: float) -> bool:
+        return health.error_rate < self.error_threshold or now - health.last_failure >= self.cooldown
+    
+    def ranked(self) -> List[str]:
+        """
+        Mirror base URLs, best first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            mirrors = list(self._health.values())
+            healthy = [health for health in mirrors if self._healthy(health, now)]
+            unhealthy = [health for health in mirrors if not self._healthy(health, now)]
+        # sorted() stabil: tanpa data, urutan konfigurasi (canonical dulu) dipertahankan
+        healthy.sort(key=lambda health: health.latency if health.latency is not None else 0.0)
+        unhealthy.sort(key=lambda health: health.error_rate)
+        return [health.base_url for health in healthy + unhealthy]
+    
+    def record(self, base_url: str, latency: float, failed: bool = False) -> None:
+        """
+        Feed the outcome of one request to a mirror into its EWMAs.
+        """
+        with self._lock:
+            health = self._health.get(_host(base_url))
+            if health is None:
+                return
+            health.requests += 1
+            health.error_rate += self.alpha * ((1.0 if failed else 0.0) - health.error_rate)
+            if failed:
+                health.failures += 1
+                health.last_failure = time.monotonic()
+            elif health.latency is None:
+                health.latency = latency
+            else:
+                health.latency += self.alpha * (latency - health.latency)
+    
+    def to_mirror(self, url: str, base_url: str) -> str:
+        """
+        Point a URL of this source at the given mirror.
+        """
+        parts = urlsplit(self.canonicalize(url))
+        mirror = urlsplit(base_url)
+        return parts._replace(scheme=mirror.scheme, netloc=mirror.netloc).geturl()
+    
+    def canonicalize(self, text: AnyStr) -> AnyStr:
+        """
+        Replace mirror hosts in a URL, HTML or JSON text with the canonical host.
+        
+        Bytes are rewritten as-is, which assumes an ASCII-compatible encoding.
+        """
+        if self._other_hosts is None:
+            return text
+        if isinstance(text, bytes):
+            return self._other_hosts_bytes.sub(self._canonical_host.encode("utf-8"), text)
+        return self._other_hosts.sub(self._canonical_host, text)
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    "base_url": health.base_url,
+                    "latency_ewma": health.latency,
+                    "error_rate": round(health.error_rate, 3),
+                    "healthy": self._healthy(health, now),
+                    "requests": health.requests,
+                    "failures": health.failures,
+                }
+                for host, health in self._health.items()
+            }
+
+
+# Satu pool per sumber, dikunci dengan base URL canonical
+_pools: Dict[str, MirrorPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_mirror_pool(canonical: str, mirrors: List[str]) -> MirrorPool:
+    """
+    Get the mirror pool of a source, creating it on first use.
+    
+    Args:
+        canonical: Base URL results and cache keys are expressed in
+        mirrors: Other base URLs serving the same site
+    
+    Returns:
+        MirrorPool configured from settings.MIRROR_*
+    """
+    with _pools_lock:
+        pool = _pools.get(canonical)
+        if pool is None:
+            pool = MirrorPool(
+                canonical,
+                mirrors,
+                alpha=settings.MIRROR_EWMA_ALPHA,
+                error_threshold=settings.MIRROR_ERROR_THRESHOLD,
+                cooldown=settings.MIRROR_COOLDOWN,
+            )
+            _pools[canonical] = pool
+        return pool
+
+
+def get_mirror_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Get per source mirror health.
+    
+    Returns:
+        Mapping of canonical base URL to per mirror latency/error EWMAs and counters
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+    return {canonical: pool.stats() for canonical, pool in pools.items()}
@@ -0,0 +1,222 @@
+import gzip
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Union
+
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from .cache import aget_entry_from_cache_or_fetch, ainvalidate_cache
+from .cache_backends import add_invalidation_listener
+from .cache_policy import get_cache_policy
+from .circuit_breaker import CircuitOpenError
+from .config import settings
+from .deadline import DeadlineExceeded
+from .lru import BoundedCache
+
+
+class CachedResponse(NamedTuple):
+    """
+    Final response body, encoded once and served as-is on every hit.
+    """
+    body: bytes
+    gzip_body: Optional[bytes]
+    etag: str
+
+
+# Response siap kirim per cache key, per proses; timestamp = timestamp entry data mentah asalnya
+_responses = BoundedCache(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES, max_bytes=settings.RESPONSE_CACHE_MAX_BYTES)
+_stats: Dict[str, int] = {"hits": 0, "misses": 0, "reused": 0, "not_modified": 0, "gzip": 0, "stale": 0, "partial": 0}
+
+
+def _drop_response(key: str) -> None:
+    # Worker lain menulis atau menginvalidasi data mentah key ini
+    if key == "*":
+        _responses.clear()
+    else:
+        _responses.pop(key)
+
+
+add_invalidation_listener(_drop_response)
+
+
+def encode_response(payload: Any) -> CachedResponse:
+    """
+    Encode a validated payload as compact JSON with an ETag and a gzip variant.
+    
+    Args:
+        payload: Validated response payload
+    
+    Returns:
+        CachedResponse; gzip_body is None below settings.RESPONSE_GZIP_MIN_BYTES
+    """
+    body = json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    gzip_body = None
+    if len(body) >= settings.RESPONSE_GZIP_MIN_BYTES:
+        gzip_body = gzip.compress(body, compresslevel=6)
+    # Weak ETag karena varian gzip dan identity berbagi tag yang sama
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return CachedResponse(body, gzip_body, etag)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def to_response(cached: CachedResponse, request: Request) -> Response:
+    """
+    Build the HTTP response for a cached body, honouring If-None-Match and Accept-Encoding.
+    
+    Args:
+        cached: Encoded response
+        request: Incoming request
+    
+    Returns:
+        304, gzip-encoded or identity JSON response
+    """
+    headers = {"ETag": cached.etag, "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match", ""), cached.etag):
+        _stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    if cached.gzip_body is not None and _accepts_gzip(request.headers.get("accept-encoding", "")):
+        _stats["gzip"] += 1
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=cached.gzip_body, media_type="application/json", headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+async def cached_json_response(
+    request: Request,
+    key: str,
+    build: Callable[[Any], Any],
+    fetch_func: Callable[..., Union[Any, Awaitable[Any]]],
+    *args,
+    force_refresh: bool = False,
+    **kwargs
+) -> Response:
+    """
+    Serve an endpoint from the response cache, falling back to the data cache.
+    
+    On a miss the raw data is taken from aget_entry_from_cache_or_fetch,
+    validated by build and encoded once. The encoded response is served
+    directly until the raw entry stops being fresh, capped at
+    settings.RESPONSE_CACHE_TTL. After that the raw entry is looked up
+    again, and the stored bytes are reused as long as its timestamp is
+    unchanged, e.g. for stale hits during the grace window. Writes and
+    invalidations broadcast by other workers drop the stored response.
+    
+    While the upstream circuit breaker is open, the last known good data is
+    served with "stale": true in the payload (and not kept as a response),
+    or 503 if there is none. When the request deadline runs out, the same
+    fallback applies with 504 instead; results cut short by the deadline
+    are served with "partial": true and not kept.
+    
+    Args:
+        request: Incoming request
+        key: Cache key shared with the raw data cache
+        build: Validates raw data into the response payload, may raise HTTPException
+        fetch_func: Function or coroutine function to fetch raw data
+        force_refresh: Drop the cached response and raw data first
+        *args, **kwargs: Arguments to pass to fetch_func
+    
+    Returns:
+        HTTP response
+    """
+    if force_refresh:
+        await ainvalidate_response(key)
+    
+    entry = _responses.get(key)
+    now = time.time()
+    if entry is not None and now < entry["fresh_until"]:
+        _stats["hits"] += 1
+        return to_response(entry["data"], request)
+    
+    _stats["misses"] += 1
+    try:
+        raw_entry = await aget_entry_from_cache_or_fetch(key, fetch_func, *args, **kwargs)
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=f"Upstream sedang tidak tersedia: {e}")
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=f"Upstream terlalu lambat: {e}")
+    
+    for flag in ("stale", "partial"):
+        if raw_entry.get(flag):
+            _stats[flag] += 1
+            payload = build(raw_entry["data"])
+            if isinstance(payload, dict):
+                payload = {**payload, flag: True}
+            return to_response(encode_response(payload), request)
+    
+    # Entry data mentah yang sama (termasuk data stale dalam grace window) memakai body yang sudah di-encode
+    if entry is not None and entry["timestamp"] == raw_entry["timestamp"]:
+        _stats["reused"] += 1
+        cached = entry["data"]
+    else:
+        cached = encode_response(build(raw_entry["data"]))
+    
+    policy = get_cache_policy(key)
+    now = time.time()
+    expires_at = raw_entry["timestamp"] + policy.ttl + policy.grace
+    if expires_at > now:
+        _responses[key] = {
+            "timestamp": raw_entry["timestamp"],
+            "data": cached,
+            "fresh_until": min(raw_entry["timestamp"] + policy.ttl, now + settings.RESPONSE_CACHE_TTL),
+            "expires_at": expires_at,
+        }
+    return to_response(cached, request)
+
+
+async def ainvalidate_response(key: Optional[str] = None) -> None:
+    """
+    Invalidate the cached response and the raw data for a key or all keys.
+    
+    Args:
+        key: Cache key to invalidate (optional, if None, invalidate all cache)
+    """
+    if key is None:
+        _responses.clear()
+    else:
+        _responses.pop(key)
+    await ainvalidate_cache(key)
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """
+    Get response cache statistics.
+    
+    Returns:
+        Dictionary with hit/miss counters (reused: misses served with the
+        stored body because the raw entry was unchanged) and memory usage
+    """
+    return {**_stats, "memory": _responses.stats()}
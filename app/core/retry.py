@@ -0,0 +1,122 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from .circuit_breaker import CircuitOpenError
+from .config import settings
+from .deadline import remaining
+from .limiter import is_overload_error
+
+T = TypeVar("T")
+
+_stats: Dict[str, int] = {"retries": 0, "gave_up": 0}
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Check whether a failed idempotent request is worth retrying.
+    
+    Overload errors (429/5xx, timeouts, resets) are retried; other HTTP
+    errors and open circuit breakers are not.
+    """
+    return not isinstance(error, CircuitOpenError) and is_overload_error(error)
+
+
+def backoff_delay(attempt: int, error: Optional[Exception] = None) -> float:
+    """
+    Jittered exponential backoff before the next attempt.
+    
+    Uses "full jitter": a random delay between 0 and
+    min(UPSTREAM_RETRY_MAX_DELAY, UPSTREAM_RETRY_BASE_DELAY * 2 ** attempt),
+    raised to a numeric Retry-After header if the upstream sent one.
+    
+    Args:
+        attempt: Number of the failed attempt, starting at 0
+        error: The error of the failed attempt
+    
+    Returns:
+        Seconds to wait
+    """
+    cap = min(settings.UPSTREAM_RETRY_MAX_DELAY, settings.UPSTREAM_RETRY_BASE_DELAY * 2 ** attempt)
+    delay = random.uniform(0, cap)
+    response = getattr(error, "response", None)
+    retry_after = getattr(response, "headers", {}).get("Retry-After") if response is not None else None
+    if retry_after is not None:
+        try:
+            delay = max(delay, min(float(retry_after), settings.UPSTREAM_RETRY_MAX_DELAY))
+        except ValueError:
+            pass
+    return delay
+
+
+def _fits_deadline(delay: float) -> bool:
+    # Tidak ada gunanya menunggu backoff jika budget request habis sebelum retry
+    left = remaining()
+    return left is None or delay < left
+
+
+def retry_call(func: Callable[[], T], attempts: Optional[int] = None) -> T:
+    """
+    Call an idempotent blocking function, retrying overload errors with backoff.
+    
+    Gives up early when the backoff would outlast the request deadline.
+    
+    Args:
+        func: Function to call
+        attempts: Total attempts (optional, defaults to settings.UPSTREAM_RETRY_ATTEMPTS)
+    
+    Returns:
+        Result of func
+    """
+    attempts = attempts or settings.UPSTREAM_RETRY_ATTEMPTS
+    for attempt in range(attempts):
+        try:
+            return func()
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, e)
+            if attempt == attempts - 1 or not _fits_deadline(delay):
+                _stats["gave_up"] += 1
+                raise
+            _stats["retries"] += 1
+            time.sleep(delay)
+
+
+async def aretry_call(func: Callable[[], Awaitable[T]], attempts: Optional[int] = None) -> T:
+    """
+    Await an idempotent coroutine function, retrying overload errors with backoff.
+    
+    Gives up early when the backoff would outlast the request deadline.
+    
+    Args:
+        func: Coroutine function to call
+        attempts: Total attempts (optional, defaults to settings.UPSTREAM_RETRY_ATTEMPTS)
+    
+    Returns:
+        Result of func
+    """
+    attempts = attempts or settings.UPSTREAM_RETRY_ATTEMPTS
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, e)
+            if attempt == attempts - 1 or not _fits_deadline(delay):
+                _stats["gave_up"] += 1
+                raise
+            _stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+
+def get_retry_stats() -> Dict[str, int]:
+    """
+    Get retry statistics.
+    
+    Returns:
+        Dictionary with the number of retries and of calls that ran out of attempts
+    """
+    return dict(_stats)
@@ -0,0 +1,116 @@
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+class NotModified(Exception):
+    """
+    Raised by a conditional GET that the upstream answered with 304.
+    """
+    def __init__(self, url: str):
+        super().__init__(f"{url} tidak berubah (304)")
+        self.url = url
+
+
+# ETag/Last-Modified per URL upstream: {"etag": ..., "last_modified": ...}
+Validators = Dict[str, Dict[str, Optional[str]]]
+
+# Validators entry cache yang sedang direvalidasi; None di luar revalidasi
+_revalidating: contextvars.ContextVar[Optional[Validators]] = contextvars.ContextVar("revalidating", default=None)
+# Validators response 200 selama fill satu key cache, disimpan bersama entry-nya
+_collected: contextvars.ContextVar[Optional[Validators]] = contextvars.ContextVar("collected_validators", default=None)
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {"conditional_requests": 0, "not_modified": 0, "modified": 0}
+
+
+@contextmanager
+def revalidating(validators: Validators) -> Iterator[None]:
+    """
+    Let upstream GETs in this context send conditional requests.
+    
+    Conditional headers come only from validators, the ETag/Last-Modified
+    stored with the cache entry being refreshed, so a 304 always refers to the page
+    that entry was parsed from. A GET whose page has not changed raises
+    NotModified instead of returning a body, so the caller can keep its
+    parsed result. Only use this around fetches that derive their result
+    from a single page.
+    """
+    token = _revalidating.set(validators)
+    try:
+        yield
+    finally:
+        _revalidating.reset(token)
+
+
+def is_revalidating() -> bool:
+    return _revalidating.get() is not None
+
+
+@contextmanager
+def collecting_validators() -> Iterator[Validators]:
+    """
+    Collect the validators of the 200 responses received in this context.
+    
+    The yielded dict is filled per URL, for the caller to store with the
+    result it parses from those responses.
+    """
+    collected: Validators = {}
+    token = _collected.set(collected)
+    try:
+        yield collected
+    finally:
+        _collected.reset(token)
+
+
+def remember_validators(url: str, response_headers: Any) -> None:
+    """
+    Record the ETag and Last-Modified headers of a 200 response for the current fill.
+    """
+    collected = _collected.get()
+    if collected is None:
+        return
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if etag or last_modified:
+        collected[url] = {"etag": etag, "last_modified": last_modified}
+    else:
+        collected.pop(url, None)
+
+
+def conditional_headers(url: str) -> Dict[str, str]:
+    """
+    Get If-None-Match/If-Modified-Since headers for a URL from the entry being revalidated.
+    
+    Returns:
+        Conditional headers, empty outside revalidating() or if the entry
+        has no validators for the URL
+    """
+    validators = (_revalidating.get() or {}).get(url)
+    if not validators:
+        return {}
+    
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def record_revalidation(not_modified: bool) -> None:
+    with _stats_lock:
+        _stats["conditional_requests"] += 1
+        _stats["not_modified" if not_modified else "modified"] += 1
+
+
+def get_revalidation_stats() -> Dict[str, int]:
+    """
+    Get conditional GET statistics.
+    
+    Returns:
+        Dictionary with the number of conditional requests sent and how many
+        were answered with 304 or a new body
+    """
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,109 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into a single execution.
+    
+    The first caller for a key becomes the leader and runs the function;
+    callers arriving while it is in flight wait on the same future and get
+    the same result or exception. In-flight calls are tracked with
+    concurrent.futures.Future, so waiters can be threads or asyncio tasks
+    on any event loop.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        # Referensi task leader agar tidak di-garbage-collect
+        self._tasks: Set[asyncio.Future] = set()
+        self.leaders = 0
+        self.followers = 0
+    
+    def _join(self, key: str) -> Tuple[concurrent.futures.Future, bool]:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.followers += 1
+                return future, False
+            future = concurrent.futures.Future()
+            self._inflight[key] = future
+            self.leaders += 1
+            return future, True
+    
+    def _finish(self, key: str, future: concurrent.futures.Future, result: Any = None, error: BaseException = None) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def do(self, key: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking function once per key among concurrent callers.
+        
+        Args:
+            key: Deduplication key
+            func: Function to run
+            *args, **kwargs: Arguments to pass to func
+        
+        Returns:
+            Result of func, shared by all concurrent callers
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+    
+    async def ado(self, key: str, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a coroutine function once per key among concurrent callers.
+        
+        The leader's work runs in its own task, so cancelling one waiter
+        (including the leader) does not cancel the call for the others.
+        
+        Args:
+            key: Deduplication key
+            func: Coroutine function to run
+            *args, **kwargs: Arguments to pass to func
+        
+        Returns:
+            Result of func, shared by all concurrent callers
+        """
+        future, leader = self._join(key)
+        if leader:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._tasks.add(task)
+            
+            def on_done(done: asyncio.Future) -> None:
+                self._tasks.discard(done)
+                if done.cancelled():
+                    self._finish(key, future, error=concurrent.futures.CancelledError())
+                elif done.exception() is not None:
+                    self._finish(key, future, error=done.exception())
+                else:
+                    self._finish(key, future, done.result())
+            
+            task.add_done_callback(on_done)
+        # shield agar pembatalan satu waiter tidak membatalkan future bersama
+        return await asyncio.shield(asyncio.wrap_future(future))
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._inflight),
+                "leaders": self.leaders,
+                "followers": self.followers,
+            }
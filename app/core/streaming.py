@@ -0,0 +1,130 @@
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+_SELECTOR = re.compile(r"^([\w-]*)(?:\.([\w-]+)|#([\w-]+))?$")
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {"streams": 0, "early_stops": 0, "bytes_parsed": 0}
+
+
+def _parse_section(selector: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    match = _SELECTOR.match(selector.strip())
+    if match is None or not any(match.groups()):
+        raise ValueError(f"Selector section tidak didukung: {selector}")
+    tag, class_name, element_id = match.groups()
+    return tag or None, class_name, element_id
+
+
+class _SectionTarget:
+    """
+    lxml parser target that forwards to a BeautifulSoup tree builder and
+    notes when the first element matching each section has been closed.
+    """
+    def __init__(self, builder: Any, sections: Sequence[str], rewrite: Optional[Callable[[str], str]]):
+        self._builder = builder
+        self._sections = [_parse_section(selector) for selector in sections]
+        self._rewrite = rewrite
+        # Per elemen terbuka: index section yang dimulai elemen ini, atau None
+        self._open: List[Optional[int]] = []
+        self.started = [False] * len(self._sections)
+        self.closed = [False] * len(self._sections)
+    
+    def _match(self, tag: str, attrs: Dict[str, str]) -> Optional[int]:
+        for i, (name, class_name, element_id) in enumerate(self._sections):
+            if self.started[i] or (name is not None and name != tag):
+                continue
+            if class_name is not None and class_name not in attrs.get("class", "").split():
+                continue
+            if element_id is not None and attrs.get("id") != element_id:
+                continue
+            return i
+        return None
+    
+    def start(self, tag: str, attrs: Dict[str, str], nsmap: Optional[Dict[str, str]] = None) -> None:
+        if self._rewrite is not None:
+            attrs = {name: self._rewrite(value) for name, value in attrs.items()}
+        section = self._match(tag, attrs)
+        if section is not None:
+            self.started[section] = True
+        self._open.append(section)
+        self._builder.start(tag, attrs, nsmap or {})
+    
+    def end(self, tag: str) -> None:
+        self._builder.end(tag)
+        section = self._open.pop() if self._open else None
+        if section is not None:
+            self.closed[section] = True
+    
+    def __getattr__(self, name: str) -> Any:
+        # data, comment, doctype, pi, close langsung ke tree builder
+        return getattr(self._builder, name)
+
+
+class StreamingSoup:
+    """
+    BeautifulSoup tree built from body chunks while they are downloaded.
+    
+    Chunks are fed to lxml's incremental HTML parser with BeautifulSoup's
+    own tree builder as target, so the result is the same soup
+    BeautifulSoup(html, "lxml") builds, and parsing overlaps the download.
+    Once the first element matching every selector in sections (tag,
+    tag.class or tag#id) has been closed, done is set and the rest of the
+    body can be skipped; the tree then holds everything up to that point.
+    """
+    def __init__(self, sections: Sequence[str] = (), encoding: Optional[str] = None, rewrite: Optional[Callable[[str], str]] = None):
+        self.soup = BeautifulSoup("", "lxml")
+        self.soup.reset()
+        builder = self.soup.builder
+        # BeautifulSoup() melepas builder dari soup setelah selesai parse
+        builder.initialize_soup(self.soup)
+        builder.reset()
+        self._target = _SectionTarget(builder, sections, rewrite)
+        parser_class = builder.default_parser(encoding)
+        self._parser = parser_class(target=self._target, recover=True, encoding=encoding)
+        self.encoding = encoding
+        self.bytes_parsed = 0
+    
+    @property
+    def done(self) -> bool:
+        return bool(self._target.closed) and all(self._target.closed)
+    
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Parse the next chunk of the body.
+        
+        Returns:
+            True once all sections are complete
+        """
+        self._parser.feed(chunk)
+        self.bytes_parsed += len(chunk)
+        return self.done
+    
+    def close(self) -> BeautifulSoup:
+        """
+        Finish parsing, closing elements left open by a truncated body.
+        """
+        if self.bytes_parsed:
+            self._parser.close()
+        self.soup.endData()
+        while self.soup.currentTag is not None and self.soup.currentTag.name != self.soup.ROOT_TAG_NAME:
+            self.soup.popTag()
+        with _stats_lock:
+            _stats["streams"] += 1
+            _stats["early_stops"] += 1 if self.done else 0
+            _stats["bytes_parsed"] += self.bytes_parsed
+        return self.soup
+
+
+def get_streaming_stats() -> Dict[str, int]:
+    """
+    Get streaming parse statistics.
+    
+    Returns:
+        Dictionary with pages parsed while downloading, how many of them
+        stopped downloading early, and bytes parsed
+    """
+    with _stats_lock:
+        return dict(_stats)
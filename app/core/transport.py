@@ -0,0 +1,255 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .config import settings
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Header yang tidak berlaku lagi karena body disimpan dalam bentuk terdekode
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class FixtureStore:
+    """
+    Directory of recorded upstream request/response pairs.
+    
+    Each exchange is one JSON file named after the SHA-256 of the method,
+    URL and request body, holding the status, headers, decoded body
+    (base64) and the latency observed while recording. Request headers are
+    not part of the key, so conditional and plain GETs replay the same
+    response.
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {"recorded": 0, "replayed": 0, "missing": 0}
+    
+    @staticmethod
+    def key(method: str, url: str, body: Optional[bytes]) -> str:
+        digest = hashlib.sha256(f"{method.upper()} {url}\n".encode("utf-8"))
+        digest.update(body or b"")
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+    
+    def save(
+        self,
+        method: str,
+        url: str,
+        request_body: Optional[bytes],
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        elapsed: float,
+    ) -> None:
+        """
+        Record one exchange, replacing an earlier recording of the same request.
+        """
+        fixture = {
+            "method": method.upper(),
+            "url": url,
+            "request_body": (request_body or b"").decode("utf-8", "replace"),
+            "status": status,
+            "headers": {name: value for name, value in headers.items() if name.lower() not in _DROPPED_HEADERS},
+            "body": base64.b64encode(body).decode("ascii"),
+            "elapsed": elapsed,
+        }
+        path = self._path(self.key(method, url, request_body))
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(fixture, f, indent=1)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._count("recorded")
+    
+    def load(self, method: str, url: str, request_body: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Get a recorded exchange, with "body" decoded to bytes.
+        
+        Returns:
+            Fixture dictionary, or None if the request was never recorded
+        """
+        try:
+            with open(self._path(self.key(method, url, request_body)), "r", encoding="utf-8") as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            self._count("missing")
+            return None
+        fixture["body"] = base64.b64decode(fixture["body"])
+        self._count("replayed")
+        return fixture
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "directory": self.directory}
+
+
+def replay_delay(fixture: Dict[str, Any], latency: float) -> float:
+    """
+    Seconds to wait before serving a replayed response.
+    
+    Args:
+        fixture: Recorded exchange
+        latency: Fixed latency, or a negative value for the recorded latency
+    """
+    return fixture.get("elapsed", 0.0) if latency < 0 else latency
+
+
+def _request_body(body: Any) -> Optional[bytes]:
+    if body is None:
+        return None
+    return body.encode("utf-8") if isinstance(body, str) else bytes(body)
+
+
+class RecordReplayAdapter(HTTPAdapter):
+    """
+    requests transport adapter that records exchanges to, or replays them from, a FixtureStore.
+    
+    In record mode requests go to the network and every response is saved;
+    in replay mode the network is never used and unrecorded requests fail
+    with ConnectionError.
+    """
+    def __init__(self, store: FixtureStore, mode: str, latency: float = 0.0, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.store = store
+        self.mode = mode
+        self.latency = latency
+    
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        body = _request_body(request.body)
+        if self.mode == REPLAY:
+            fixture = self.store.load(request.method, request.url, body)
+            if fixture is None:
+                raise requests.exceptions.ConnectionError(f"Fixture tidak ditemukan untuk {request.method} {request.url}", request=request)
+            time.sleep(replay_delay(fixture, self.latency))
+            return self._build_response(request, fixture)
+        
+        start = time.monotonic()
+        response = super().send(request, **kwargs)
+        content = response.content
+        self.store.save(request.method, request.url, body, response.status_code, dict(response.headers), content, time.monotonic() - start)
+        return response
+    
+    def _build_response(self, request: requests.PreparedRequest, fixture: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = fixture["status"]
+        response.headers = CaseInsensitiveDict(fixture["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = fixture["body"]
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.reason = "Replayed"
+        return response
+
+
+class AsyncRecordReplayTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that records exchanges to, or replays them from, a FixtureStore.
+    
+    Same modes as RecordReplayAdapter; replay latency is awaited without
+    blocking the event loop.
+    """
+    def __init__(self, store: FixtureStore, mode: str, latency: float = 0.0, inner: Optional[httpx.AsyncBaseTransport] = None):
+        self.store = store
+        self.mode = mode
+        self.latency = latency
+        self.inner = inner
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        url = str(request.url)
+        if self.mode == REPLAY:
+            fixture = self.store.load(request.method, url, body)
+            if fixture is None:
+                raise httpx.ConnectError(f"Fixture tidak ditemukan untuk {request.method} {url}", request=request)
+            await asyncio.sleep(replay_delay(fixture, self.latency))
+            return httpx.Response(fixture["status"], headers=fixture["headers"], content=fixture["body"], request=request)
+        
+        start = time.monotonic()
+        response = await self.inner.handle_async_request(request)
+        # Body dibaca dan didekode di sini agar fixture bisa diputar tanpa Content-Encoding
+        raw = httpx.Response(response.status_code, headers=response.headers, stream=response.stream, request=request)
+        content = await raw.aread()
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS}
+        self.store.save(request.method, url, body, response.status_code, headers, content, time.monotonic() - start)
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+    
+    async def aclose(self) -> None:
+        if self.inner is not None:
+            await self.inner.aclose()
+
+
+# Satu FixtureStore per direktori agar statistik sync dan async digabung
+_stores: Dict[str, FixtureStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fixture_store(directory: Optional[str] = None) -> FixtureStore:
+    """
+    Get the fixture store for a directory, creating it on first use.
+    
+    Args:
+        directory: Fixture directory (optional, defaults to settings.UPSTREAM_FIXTURE_DIR)
+    """
+    directory = directory or settings.UPSTREAM_FIXTURE_DIR
+    with _stores_lock:
+        store = _stores.get(directory)
+        if store is None:
+            store = FixtureStore(directory)
+            _stores[directory] = store
+        return store
+
+
+def transport_mode() -> str:
+    """
+    Get the configured upstream transport mode.
+    
+    Returns:
+        "" for the live network, "record" or "replay"
+    """
+    mode = settings.UPSTREAM_TRANSPORT_MODE.strip().lower()
+    if mode not in ("", RECORD, REPLAY):
+        raise ValueError(f"UPSTREAM_TRANSPORT_MODE tidak dikenal: {settings.UPSTREAM_TRANSPORT_MODE}")
+    if mode and not settings.UPSTREAM_FIXTURE_DIR:
+        raise ValueError("UPSTREAM_FIXTURE_DIR wajib diisi untuk mode record/replay")
+    return mode
+
+
+def get_transport_stats() -> Optional[Dict[str, Any]]:
+    """
+    Get record/replay statistics.
+    
+    Returns:
+        Mode and recorded/replayed/missing counters, or None when using the live network
+    """
+    mode = transport_mode()
+    if not mode:
+        return None
+    return {"mode": mode, **get_fixture_store().stats()}
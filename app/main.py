@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,6 +10,9 @@ import time
 
 from .api.api import api_router
 from .core.config import settings
+from .core.cache import close_cache_backend, start_cache_backend
+from .core.executors import shutdown_executors, start_executors
+from .core.http_client import shutdown_http_clients, startup_http_clients
 
 # Configure logging
 logging.basicConfig(
@@ -18,10 +22,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger("app.main")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources on startup and release them on shutdown"""
+    start_executors()
+    await startup_http_clients()
+    await start_cache_backend()
+    yield
+    await close_cache_backend()
+    await shutdown_http_clients()
+    shutdown_executors(wait=False)
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Set up CORS middleware
@@ -1,12 +1,20 @@
+import html
 import re
+import asyncio
 import logging
-import requests
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from bs4 import BeautifulSoup
 import concurrent.futures
 import time
 
 from .scraper import BaseScraper
+from ..core.bloom import mark_missing
+from ..core.cache import aget_from_cache_or_fetch, get_from_cache_or_fetch
+from ..core.circuit_breaker import CircuitOpenError
+from ..core.config import settings
+from ..core.deadline import DeadlineExceeded, deadline, mark_partial, remaining
+from ..core.executors import CPU, IO, run_blocking, submit
+from ..core.revalidation import NotModified
 
 logger = logging.getLogger(__name__)
 
@@ -15,22 +23,162 @@ class SamehadakuScraper(BaseScraper):
     """
     Scraper for Samehadaku.
     """
+    DAYS_OF_WEEK = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+    # Bagian halaman yang dibaca parser; sisa body (sidebar, footer) tidak perlu didownload
+    ANIME_DETAIL_SECTIONS = ("div.infoanime", "div.spe", "div.lstepsiode", "div.rand-animesu")
+    HOME_SECTIONS = ("div.topten-animesu", "div.post-show", "aside#sidebar")
+    
     def __init__(self, source_name: str = "samehadaku"):
         super().__init__(source_name)
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
-        })
+    
+    @property
+    def player_ajax_url(self) -> str:
+        return f"{self.base_url}/wp-admin/admin-ajax.php"
+    
+    @staticmethod
+    def _json_items(payload: Any) -> List[Dict[str, Any]]:
+        items = payload.get("data") if isinstance(payload, dict) else payload
+        if not isinstance(items, list):
+            raise ValueError("respons bukan daftar item")
+        return items
+    
+    @staticmethod
+    def _json_field(item: Dict[str, Any], *keys: str, required: bool = False) -> Any:
+        """
+        Get the first present field of a JSON item, "N/A" if none.
+        
+        Accepts the custom/v1 field names (as in all-schedule) and WordPress
+        core ones; {"rendered": ...} values are unwrapped and HTML stripped.
+        """
+        for key in keys:
+            value = item.get(key)
+            if isinstance(value, dict):
+                value = value.get("rendered")
+            if isinstance(value, str):
+                value = html.unescape(re.sub(r"<[^>]+>", "", value)).strip()
+            if value not in (None, "", []):
+                return value if isinstance(value, (str, list)) else str(value)
+        if required:
+            raise KeyError(keys[0])
+        return "N/A"
+    
+    @staticmethod
+    def _json_genres(value: Any) -> List[str]:
+        if isinstance(value, list):
+            return [str(g.get("name", "") if isinstance(g, dict) else g).strip() for g in value]
+        return [g.strip() for g in value.split(",")] if value != "N/A" else []
+    
+    @staticmethod
+    def _slug_from_url(url: str) -> Optional[str]:
+        anime_match = re.search(r'anime/([^/]+)', url)
+        return anime_match.group(1) if anime_match else None
+    
+    def _parse_search_json(self, payload: Any) -> List[Dict[str, Any]]:
+        """
+        Map search results from the JSON route to the HTML result format.
+        """
+        results = []
+        for item in self._json_items(payload):
+            url = self._json_field(item, "url", "link", required=True)
+            results.append({
+                "judul": self._json_field(item, "title", "judul", required=True),
+                "url": url,
+                "anime_slug": self._slug_from_url(url) or "N/A",
+                "status": self._json_field(item, "east_status", "status"),
+                "tipe": self._json_field(item, "east_type", "type"),
+                "skor": self._json_field(item, "east_score", "score"),
+                "penonton": self._json_field(item, "east_views", "views"),
+                "sinopsis": self._json_field(item, "synopsis", "excerpt", "content"),
+                "genre": self._json_genres(self._json_field(item, "genre", "genres")) or ["Anime"],
+                "cover": self._json_field(item, "featured_img_src", "cover"),
+            })
+        return results
+    
+    def _parse_anime_terbaru_json(self, payload: Any) -> List[Dict[str, Any]]:
+        """
+        Map latest episodes from the JSON route to the HTML result format.
+        """
+        anime_list = []
+        for item in self._json_items(payload):
+            url = self._json_field(item, "url", "link", required=True)
+            anime_slug = self._slug_from_url(url)
+            if anime_slug is None:
+                episode_match = re.search(r'([^/]+)-episode-\d+', url)
+                anime_slug = episode_match.group(1) if episode_match else None
+            anime_list.append({
+                "judul": self._json_field(item, "title", "judul", required=True),
+                "url": url,
+                "anime_slug": anime_slug,
+                "episode": self._json_field(item, "east_episode", "episode", required=True),
+                "uploader": self._json_field(item, "author_name", "author", "uploader"),
+                "rilis": self._json_field(item, "east_time", "release_time", "rilis"),
+                "cover": self._json_field(item, "featured_img_src", "cover"),
+            })
+        return anime_list
+    
+    def _parse_movie_list_json(self, payload: Any) -> List[Dict[str, Any]]:
+        """
+        Map movies from the JSON route to the HTML result format.
+        """
+        movie_list = []
+        for item in self._json_items(payload):
+            url = self._json_field(item, "url", "link", required=True)
+            movie_list.append({
+                "judul": self._json_field(item, "title", "judul", required=True),
+                "url": url,
+                "anime_slug": self._slug_from_url(url),
+                "status": self._json_field(item, "east_status", "status"),
+                "skor": self._json_field(item, "east_score", "score"),
+                "sinopsis": self._json_field(item, "synopsis", "excerpt", "content"),
+                "views": self._json_field(item, "east_views", "views"),
+                "cover": self._json_field(item, "featured_img_src", "cover"),
+                "genres": self._json_genres(self._json_field(item, "genre", "genres")),
+            })
+        return movie_list
     
     def search(self, query: str) -> List[Dict[str, Any]]:
         """
         Search for anime on Samehadaku.
         """
+        if (results := self._json_first("search", self._parse_search_json, query=query)) is not None:
+            return results
+        
         search_url = f"{self.base_url}/?s={query}"
         logger.info(f"Searching for '{query}' at {search_url}")
         
         try:
             soup = self.get_soup(search_url)
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logger.error(f"Error searching for '{query}': {e}")
+            return []
+        return self._parse_search(soup, query)
+    
+    async def asearch(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Search for anime on Samehadaku (async).
+        """
+        if (results := await self._ajson_first("search", self._parse_search_json, query=query)) is not None:
+            return results
+        
+        search_url = f"{self.base_url}/?s={query}"
+        logger.info(f"Searching for '{query}' at {search_url}")
+        
+        try:
+            soup = await self.aget_soup(search_url)
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logger.error(f"Error searching for '{query}': {e}")
+            return []
+        return await run_blocking(self._parse_search, soup, query)
+    
+    def _parse_search(self, soup: BeautifulSoup, query: str) -> List[Dict[str, Any]]:
+        """
+        Parse search results page.
+        """
+        try:
             search_results = []
             
             # Setiap hasil pencarian ada di dalam tag <article class="animpost">
@@ -112,7 +260,39 @@ class SamehadakuScraper(BaseScraper):
         logger.info(f"Getting anime details from {url}")
         
         try:
-            soup = self.get_soup(url)
+            soup = self.get_soup(url, sections=self.ANIME_DETAIL_SECTIONS)
+        except (CircuitOpenError, DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting anime details for {anime_slug}: {e}")
+            if self._is_not_found(e):
+                mark_missing("anime", anime_slug)
+            return {}
+        return self._parse_anime_details(soup, url, anime_slug)
+    
+    async def aget_anime_details(self, anime_slug: str) -> Dict[str, Any]:
+        """
+        Get anime details from Samehadaku (async).
+        """
+        url = f"{self.base_url}/anime/{anime_slug}/"
+        logger.info(f"Getting anime details from {url}")
+        
+        try:
+            soup = await self.aget_soup(url, sections=self.ANIME_DETAIL_SECTIONS)
+        except (CircuitOpenError, DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting anime details for {anime_slug}: {e}")
+            if self._is_not_found(e):
+                mark_missing("anime", anime_slug)
+            return {}
+        return await run_blocking(self._parse_anime_details, soup, url, anime_slug)
+    
+    def _parse_anime_details(self, soup: BeautifulSoup, url: str, anime_slug: str) -> Dict[str, Any]:
+        """
+        Parse anime detail page.
+        """
+        try:
             anime_details = {}
             
             # --- Informasi Utama ---
@@ -146,10 +326,11 @@ class SamehadakuScraper(BaseScraper):
             if detail_box:
                 for span in detail_box.find_all("span", recursive=False):
                     if key_tag := span.find("b"):
-                        key = key_tag.text.strip()
-                        key_tag.decompose()
-                        value = span.text.strip()
-                        details_data[key] = value
+                        # Jangan decompose: soup bisa dipakai bersama request lain
+                        key_text = key_tag.text
+                        span_text = span.text
+                        index = span_text.find(key_text)
+                        details_data[key_text.strip()] = (span_text[:index] + span_text[index + len(key_text):]).strip()
             anime_details['details'] = details_data
             
             # Tambahkan field tipe dan status dari details_data
@@ -236,7 +417,234 @@ class SamehadakuScraper(BaseScraper):
         logger.info(f"Getting episode details from {episode_url}")
         
         try:
-            soup = self.get_soup(episode_url)
+            soup = self.get_soup(episode_url, hedge="episode")
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting episode details for {episode_url}: {e}")
+            if self._is_not_found(e):
+                mark_missing("episode", episode_url)
+            return {}
+        
+        # --- Server Streaming ---
+        streaming_servers = []
+        post_id, server_options = self._get_server_options(soup)
+        
+        if post_id:
+            logger.info(f"Post ID found: {post_id}. Fetching stream links...")
+            streaming_servers = self._resolve_servers(episode_url, post_id, server_options)
+        
+        return self._parse_episode_details(soup, episode_url, streaming_servers)
+    
+    async def aget_episode_details(self, episode_url: str) -> Dict[str, Any]:
+        """
+        Get episode details from Samehadaku (async).
+        """
+        logger.info(f"Getting episode details from {episode_url}")
+        
+        try:
+            soup = await self.aget_soup(episode_url, hedge="episode")
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting episode details for {episode_url}: {e}")
+            if self._is_not_found(e):
+                mark_missing("episode", episode_url)
+            return {}
+        
+        # --- Server Streaming ---
+        streaming_servers = []
+        post_id, server_options = self._get_server_options(soup)
+        
+        if post_id:
+            logger.info(f"Post ID found: {post_id}. Fetching stream links...")
+            streaming_servers = await self._aresolve_servers(episode_url, post_id, server_options)
+        
+        return await run_blocking(self._parse_episode_details, soup, episode_url, streaming_servers)
+    
+    def _embed_cache_key(self, post_id: str, nume: str) -> str:
+        # Link embed hampir tidak pernah berubah untuk pasangan (post, nume) yang sama
+        return f"embed_{post_id}_{nume}"
+    
+    def _resolve_server(self, episode_url: str, post_id: str, nume: str, server_name: str) -> Optional[Dict[str, str]]:
+        streaming_url = get_from_cache_or_fetch(
+            self._embed_cache_key(post_id, nume),
+            self._fetch_embed_url,
+            episode_url,
+            post_id,
+            nume,
+            server_name,
+        )
+        if not streaming_url:
+            return None
+        return {"server_name": server_name, "streaming_url": streaming_url}
+    
+    def _fetch_embed_url(self, episode_url: str, post_id: str, nume: str, server_name: str) -> Optional[str]:
+        try:
+            embed_html = self.post_html(
+                self.player_ajax_url,
+                self._player_ajax_payload(post_id, nume),
+                headers=self._player_ajax_headers(episode_url),
+                timeout=settings.PLAYER_AJAX_TIMEOUT,
+                # player_ajax hanya membaca embed, aman dikirim dua kali
+                hedge="player_ajax",
+            )
+            server = self._parse_player_embed(embed_html, server_name)
+            return server["streaming_url"] if server else None
+        except Exception as e:
+            logger.error(f"Failed to get link for server {server_name}: {e}")
+            return None
+    
+    def _resolve_servers(self, episode_url: str, post_id: str, server_options: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """
+        Resolve all player options concurrently within settings.PLAYER_AJAX_DEADLINE.
+        
+        Embed links are cached per (post_id, nume) under the embed_* cache
+        policy, so only new or expired options are POSTed. Servers that fail
+        or miss the deadline (or the request deadline, if shorter) are left
+        out and the result is marked partial. The deadline also applies to
+        servers resolved in this thread while the io executor is saturated.
+        """
+        if not server_options:
+            return []
+        
+        wait_for = self._player_ajax_deadline()
+        # Deadline batch ikut tersalin ke setiap server, termasuk yang dijalankan inline saat executor io penuh
+        with deadline(wait_for) as batch:
+            futures = [
+                submit(IO, self._resolve_server, episode_url, post_id, nume, server_name)
+                for nume, server_name in server_options
+            ]
+            try:
+                done, not_done = concurrent.futures.wait(futures, timeout=max(0.0, batch.remaining()) if batch is not None else wait_for)
+            finally:
+                # Jangan tunggu server yang lambat, hasilnya diabaikan; yang belum mulai dibatalkan
+                for future in futures:
+                    future.cancel()
+        
+        if not_done:
+            mark_partial()
+            logger.warning(f"{len(not_done)} server melewati deadline {wait_for:.1f}s untuk {episode_url}")
+        return [server for future in futures if future in done and (server := future.result())]
+    
+    async def _aresolve_server(self, episode_url: str, post_id: str, nume: str, server_name: str) -> Optional[Dict[str, str]]:
+        streaming_url = await aget_from_cache_or_fetch(
+            self._embed_cache_key(post_id, nume),
+            self._afetch_embed_url,
+            episode_url,
+            post_id,
+            nume,
+            server_name,
+        )
+        if not streaming_url:
+            return None
+        return {"server_name": server_name, "streaming_url": streaming_url}
+    
+    async def _afetch_embed_url(self, episode_url: str, post_id: str, nume: str, server_name: str) -> Optional[str]:
+        try:
+            embed_html = await self.apost_html(
+                self.player_ajax_url,
+                self._player_ajax_payload(post_id, nume),
+                headers=self._player_ajax_headers(episode_url),
+                timeout=settings.PLAYER_AJAX_TIMEOUT,
+                # player_ajax hanya membaca embed, aman dikirim dua kali
+                hedge="player_ajax",
+            )
+            server = await run_blocking(self._parse_player_embed, embed_html, server_name)
+            return server["streaming_url"] if server else None
+        except Exception as e:
+            logger.error(f"Failed to get link for server {server_name}: {e}")
+            return None
+    
+    async def _aresolve_servers(self, episode_url: str, post_id: str, server_options: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """
+        Resolve all player options concurrently within settings.PLAYER_AJAX_DEADLINE (async).
+        
+        Embed links are cached per (post_id, nume); servers that miss the
+        deadline (or the request deadline, if shorter) are cancelled and the
+        result is marked partial.
+        """
+        if not server_options:
+            return []
+        
+        wait_for = self._player_ajax_deadline()
+        tasks = [
+            asyncio.ensure_future(self._aresolve_server(episode_url, post_id, nume, server_name))
+            for nume, server_name in server_options
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=wait_for)
+        for task in pending:
+            task.cancel()
+        
+        if pending:
+            mark_partial()
+            logger.warning(f"{len(pending)} server melewati deadline {wait_for:.1f}s untuk {episode_url}")
+        return [server for task in tasks if task in done and (server := task.result())]
+    
+    def _player_ajax_deadline(self) -> float:
+        """
+        Seconds to wait for player_ajax servers: PLAYER_AJAX_DEADLINE or the remaining request budget.
+        """
+        left = remaining()
+        return settings.PLAYER_AJAX_DEADLINE if left is None else max(0.0, min(settings.PLAYER_AJAX_DEADLINE, left))
+    
+    def _get_server_options(self, soup: BeautifulSoup) -> Tuple[Optional[str], List[Tuple[str, str]]]:
+        """
+        Get post ID and (nume, server_name) pairs from the episode player options.
+        """
+        server_options = soup.select("#server .east_player_option")
+        post_id = server_options[0].get('data-post') if server_options else None
+        
+        options = []
+        for option in server_options:
+            if nume := option.get('data-nume'):
+                server_name = option.find("span").get_text(strip=True) if option.find("span") else "Unknown Server"
+                options.append((nume, server_name))
+        return post_id, options
+    
+    def _player_ajax_payload(self, post_id: str, nume: str) -> Dict[str, str]:
+        """
+        Build player_ajax form payload.
+        """
+        return {'action': 'player_ajax', 'post': post_id, 'nume': nume, 'type': 'schtml'}
+    
+    def _player_ajax_headers(self, episode_url: str) -> Dict[str, str]:
+        """
+        Build player_ajax request headers.
+        """
+        return {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
+            "X-Requested-With": "XMLHttpRequest",
+            "Referer": episode_url
+        }
+    
+    def _parse_player_embed(self, embed_html: str, server_name: str) -> Optional[Dict[str, str]]:
+        """
+        Extract streaming URL from player_ajax response.
+        """
+        embed_soup = BeautifulSoup(embed_html, 'lxml')
+        iframe = embed_soup.find("iframe")
+        
+        if iframe and 'src' in iframe.attrs:
+            streaming_url = iframe['src']
+            logger.info(f"Link found for server: {server_name}")
+            
+            if "pixeldrain.com/u/" in streaming_url:
+                file_id = streaming_url.split("pixeldrain.com/u/")[1]
+                streaming_url = f"https://pixeldrain.com/api/file/{file_id}"
+                logger.info(f"Converting Pixeldrain URL to: {streaming_url}")
+            
+            return {
+                "server_name": server_name,
+                "streaming_url": streaming_url
+            }
+        return None
+    
+    def _parse_episode_details(self, soup: BeautifulSoup, episode_url: str, streaming_servers: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Parse episode detail page.
+        """
+        try:
             episode_data = {}
             
             # --- Informasi Episode ---
@@ -256,48 +664,6 @@ class SamehadakuScraper(BaseScraper):
                 "next_episode_url": next_episode_link['href'] if next_episode_link and not next_episode_link.has_attr('class') else None
             }
             
-            # --- Server Streaming ---
-            streaming_servers = []
-            server_options = soup.select("#server .east_player_option")
-            post_id = server_options[0].get('data-post') if server_options else None
-            
-            if post_id:
-                logger.info(f"Post ID found: {post_id}. Fetching stream links...")
-                ajax_url = "https://v1.samehadaku.how/wp-admin/admin-ajax.php"
-                ajax_headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
-                    "X-Requested-With": "XMLHttpRequest",
-                    "Referer": episode_url
-                }
-                
-                for option in server_options:
-                    if nume := option.get('data-nume'):
-                        server_name = option.find("span").get_text(strip=True) if option.find("span") else "Unknown Server"
-                        
-                        try:
-                            payload = {'action': 'player_ajax', 'post': post_id, 'nume': nume, 'type': 'schtml'}
-                            response = self.session.post(ajax_url, data=payload, headers=ajax_headers, timeout=10)
-                            response.raise_for_status()
-                            
-                            embed_soup = BeautifulSoup(response.text, 'lxml')
-                            iframe = embed_soup.find("iframe")
-                            
-                            if iframe and 'src' in iframe.attrs:
-                                streaming_url = iframe['src']
-                                logger.info(f"Link found for server: {server_name}")
-                                
-                                if "pixeldrain.com/u/" in streaming_url:
-                                    file_id = streaming_url.split("pixeldrain.com/u/")[1]
-                                    streaming_url = f"https://pixeldrain.com/api/file/{file_id}"
-                                    logger.info(f"Converting Pixeldrain URL to: {streaming_url}")
-                                
-                                streaming_servers.append({
-                                    "server_name": server_name,
-                                    "streaming_url": streaming_url
-                                })
-                        except Exception as e:
-                            logger.error(f"Failed to get link for server {server_name}: {e}")
-            
             episode_data['streaming_servers'] = sorted(streaming_servers, key=lambda x: x['server_name'])
             
             # --- Link Download ---
@@ -350,11 +716,45 @@ class SamehadakuScraper(BaseScraper):
         """
         Get latest anime from Samehadaku.
         """
+        if (anime_list := self._json_first("anime_terbaru", self._parse_anime_terbaru_json, page=page)) is not None:
+            return anime_list
+        
         url = f"{self.base_url}/anime-terbaru/page/{page}/" if page > 1 else f"{self.base_url}/anime-terbaru/"
         logger.info(f"Getting latest anime from {url}")
         
         try:
             soup = self.get_soup(url)
+        except (CircuitOpenError, DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting latest anime (page {page}): {e}")
+            return []
+        return self._parse_anime_terbaru(soup, page)
+    
+    async def aget_anime_terbaru(self, page: int = 1) -> List[Dict[str, Any]]:
+        """
+        Get latest anime from Samehadaku (async).
+        """
+        if (anime_list := await self._ajson_first("anime_terbaru", self._parse_anime_terbaru_json, page=page)) is not None:
+            return anime_list
+        
+        url = f"{self.base_url}/anime-terbaru/page/{page}/" if page > 1 else f"{self.base_url}/anime-terbaru/"
+        logger.info(f"Getting latest anime from {url}")
+        
+        try:
+            soup = await self.aget_soup(url)
+        except (CircuitOpenError, DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting latest anime (page {page}): {e}")
+            return []
+        return await run_blocking(self._parse_anime_terbaru, soup, page)
+    
+    def _parse_anime_terbaru(self, soup: BeautifulSoup, page: int) -> List[Dict[str, Any]]:
+        """
+        Parse latest anime page.
+        """
+        try:
             anime_list = []
             
             # Cari semua artikel anime dengan selector yang benar
@@ -417,11 +817,45 @@ class SamehadakuScraper(BaseScraper):
         """
         Get movie list from Samehadaku.
         """
+        if (movie_list := self._json_first("movie", self._parse_movie_list_json, page=page)) is not None:
+            return movie_list
+        
         url = f"{self.base_url}/anime-movie/page/{page}/" if page > 1 else f"{self.base_url}/anime-movie/"
         logger.info(f"Getting movie list from {url}")
         
         try:
             soup = self.get_soup(url)
+        except (CircuitOpenError, DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting movie list (page {page}): {e}")
+            return []
+        return self._parse_movie_list(soup, page)
+    
+    async def aget_movie_list(self, page: int = 1) -> List[Dict[str, Any]]:
+        """
+        Get movie list from Samehadaku (async).
+        """
+        if (movie_list := await self._ajson_first("movie", self._parse_movie_list_json, page=page)) is not None:
+            return movie_list
+        
+        url = f"{self.base_url}/anime-movie/page/{page}/" if page > 1 else f"{self.base_url}/anime-movie/"
+        logger.info(f"Getting movie list from {url}")
+        
+        try:
+            soup = await self.aget_soup(url)
+        except (CircuitOpenError, DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting movie list (page {page}): {e}")
+            return []
+        return await run_blocking(self._parse_movie_list, soup, page)
+    
+    def _parse_movie_list(self, soup: BeautifulSoup, page: int) -> List[Dict[str, Any]]:
+        """
+        Parse movie list page.
+        """
+        try:
             movie_list = []
             
             # Cari semua artikel movie dengan selector yang benar
@@ -486,72 +920,119 @@ class SamehadakuScraper(BaseScraper):
         """
         if day:
             # Jika hari tertentu diminta
-            api_url = f"https://v1.samehadaku.how/wp-json/custom/v1/all-schedule?perpage=100&day={day.lower()}"
+            api_url = f"{self.api_url}/all-schedule?perpage=100&day={day.lower()}"
             logger.info(f"Getting release schedule for {day} from {api_url}")
             
             try:
-                daily_schedule_raw = self.get_json(api_url)
-                
-                cleaned_schedule = []
-                for item in daily_schedule_raw:
-                    genres_raw = item.get("genre", "")
-                    genres_list = []
-                    if genres_raw and genres_raw != "N/A":
-                        genres_list = [g.strip() for g in genres_raw.split(',')]
-                    
-                    # Ekstrak anime_slug dari URL
-                    anime_slug = None
-                    url = item.get("url", "N/A")
-                    if url != "N/A":
-                        anime_match = re.search(r'anime/([^/]+)', url)
-                        if anime_match:
-                            anime_slug = anime_match.group(1)
-                    
-                    cleaned_schedule.append({
-                        "title": item.get("title", "N/A"),
-                        "url": url,
-                        "anime_slug": anime_slug,
-                        "cover_url": item.get("featured_img_src", "N/A"),
-                        "type": item.get("east_type", "N/A"),
-                        "score": item.get("east_score", "N/A"),
-                        "genres": genres_list,
-                        "release_time": item.get("east_time", "N/A")
-                    })
-                
-                return cleaned_schedule
-            
+                return self._clean_schedule(self.get_json(api_url, hedge="jadwal"))
+            except (CircuitOpenError, DeadlineExceeded):
+                raise
             except Exception as e:
                 logger.error(f"Error getting release schedule for {day}: {e}")
                 return []
         
         else:
             # Jika semua hari diminta
-            days_of_week = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+            days_of_week = self.DAYS_OF_WEEK
             full_schedule = {}
             
             logger.info("Getting release schedule for all days")
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=7) as executor:
-                # Buat fungsi untuk mengambil jadwal untuk satu hari
-                def fetch_schedule_for_day(day):
-                    try:
-                        schedule = self.get_jadwal_rilis(day)
-                        return day.capitalize(), schedule
-                    except Exception as e:
-                        logger.error(f"Error getting schedule for {day}: {e}")
-                        return day.capitalize(), []
+            # Buat fungsi untuk mengambil jadwal untuk satu hari
+            def fetch_schedule_for_day(day):
+                try:
+                    schedule = self.get_jadwal_rilis(day)
+                    return day.capitalize(), schedule
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    # Termasuk DeadlineExceeded: hari ini kosong, hasil ditandai partial
+                    logger.error(f"Error getting schedule for {day}: {e}")
+                    return day.capitalize(), []
                 
-                # Jalankan fungsi untuk semua hari secara paralel
-                future_to_day = {executor.submit(fetch_schedule_for_day, day): day for day in days_of_week}
+            # Jalankan fungsi untuk semua hari secara paralel di executor io, dengan deadline request pemanggil
+            future_to_day = {submit(IO, fetch_schedule_for_day, day): day for day in days_of_week}
                 
-                # Kumpulkan hasil
-                for future in concurrent.futures.as_completed(future_to_day):
-                    day, schedule = future.result()
-                    full_schedule[day] = schedule
+            # Kumpulkan hasil
+            for future in concurrent.futures.as_completed(future_to_day):
+                day, schedule = future.result()
+                full_schedule[day] = schedule
             
             # Urutkan hasil
             sorted_schedule = {day.capitalize(): full_schedule[day.capitalize()] for day in days_of_week}
-            return sorted_schedule
+            return self._schedule_or_empty(sorted_schedule)
+    
+    async def aget_jadwal_rilis(self, day: Optional[str] = None) -> Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Get release schedule from Samehadaku (async).
+        """
+        if day:
+            api_url = f"{self.api_url}/all-schedule?perpage=100&day={day.lower()}"
+            logger.info(f"Getting release schedule for {day} from {api_url}")
+            
+            try:
+                return self._clean_schedule(await self.aget_json(api_url, hedge="jadwal"))
+            except (CircuitOpenError, DeadlineExceeded):
+                raise
+            except Exception as e:
+                logger.error(f"Error getting release schedule for {day}: {e}")
+                return []
+        
+        logger.info("Getting release schedule for all days")
+        schedules = await asyncio.gather(*(self._aget_day_schedule(d) for d in self.DAYS_OF_WEEK))
+        return self._schedule_or_empty({d.capitalize(): schedule for d, schedule in zip(self.DAYS_OF_WEEK, schedules)})
+    
+    @staticmethod
+    def _schedule_or_empty(schedule: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return {} when every day of the schedule came back empty, so a failed scrape is not cached as data.
+        """
+        if any(schedule.values()):
+            return schedule
+        logger.error("Jadwal rilis kosong untuk semua hari")
+        return {}
+    
+    async def _aget_day_schedule(self, day: str) -> List[Dict[str, Any]]:
+        """
+        Get one day of the full schedule, empty if the request deadline ran out (partial result).
+        """
+        try:
+            return await self.aget_jadwal_rilis(day)
+        except DeadlineExceeded as e:
+            logger.error(f"Error getting schedule for {day}: {e}")
+            return []
+    
+    def _clean_schedule(self, daily_schedule_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize schedule items returned by the all-schedule API.
+        """
+        cleaned_schedule = []
+        for item in daily_schedule_raw:
+            genres_raw = item.get("genre", "")
+            genres_list = []
+            if genres_raw and genres_raw != "N/A":
+                genres_list = [g.strip() for g in genres_raw.split(',')]
+            
+            # Ekstrak anime_slug dari URL
+            anime_slug = None
+            url = item.get("url", "N/A")
+            if url != "N/A":
+                anime_match = re.search(r'anime/([^/]+)', url)
+                if anime_match:
+                    anime_slug = anime_match.group(1)
+            
+            cleaned_schedule.append({
+                "title": item.get("title", "N/A"),
+                "url": url,
+                "anime_slug": anime_slug,
+                "cover_url": item.get("featured_img_src", "N/A"),
+                "type": item.get("east_type", "N/A"),
+                "score": item.get("east_score", "N/A"),
+                "genres": genres_list,
+                "release_time": item.get("east_time", "N/A")
+            })
+        
+        return cleaned_schedule
     
     def get_home_data(self) -> Dict[str, Any]:
         """
@@ -561,210 +1042,259 @@ class SamehadakuScraper(BaseScraper):
         
         try:
             # Ambil HTML dari URL hanya sekali
-            soup = self.get_soup(self.base_url)
-            
-            # Log HTML untuk debugging
-            html_content = soup.prettify()
-            logger.info(f"HTML structure length: {len(html_content)}")
-            logger.info(f"HTML structure (first 1000 chars): {html_content[:1000]}...")
-            
-            # Log semua div classes untuk debugging
-            div_classes = set()
-            for div in soup.find_all('div', class_=True):
-                div_classes.update(div['class'])
-            logger.info(f"All div classes found: {sorted(list(div_classes))}")
-            
-            # Log semua article classes untuk debugging
-            article_classes = set()
-            for article in soup.find_all('article', class_=True):
-                article_classes.update(article['class'])
-            logger.info(f"All article classes found: {sorted(list(article_classes))}")
-            
-            # Jalankan semua fungsi scraping secara paralel
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                # Buat fungsi untuk mengambil data anime terbaru dari soup
-                def get_anime_terbaru_from_soup(soup):
-                    try:
-                        anime_list = []
-                        # Log selectors untuk debugging
-                        logger.info("Mencari anime terbaru dengan selector: .post-show > ul > li")
-                        items = soup.select(".post-show > ul > li")
-                        logger.info(f"Jumlah item anime terbaru yang ditemukan: {len(items)}")
-                        
-                        for li in items:
-                            title_el = li.select_one("h2.entry-title a")
-                            if not title_el:
-                                continue
-                            
-                            # Mengambil episode dengan selector yang lebih stabil
-                            episode_el = li.select_one(".dtla span:nth-of-type(1)")
-                            episode = episode_el.get_text(strip=True).replace("Episode", "").strip() if episode_el else "-"
-                            
-                            # Mengambil tanggal rilis
-                            released_on_el = li.select_one(".dtla span:nth-of-type(3)")
-                            rilis = released_on_el.get_text(strip=True).replace("Released on:", "").strip() if released_on_el else "-"
-                            
-                            url = title_el["href"]
-                            cover = li.select_one("img")["src"] if li.select_one("img") else "-"
-                            
-                            # Ekstrak anime_slug dari URL
-                            anime_slug = None
-                            if url != "N/A" and url != "-":
-                                anime_match = re.search(r'anime/([^/]+)', url)
-                                if anime_match:
-                                    anime_slug = anime_match.group(1)
-                            
-                            anime_list.append({
-                                "judul": title_el.text.strip(),
-                                "url": url,
-                                "anime_slug": anime_slug,
-                                "episode": episode,
-                                "rilis": rilis,
-                                "cover": cover
-                            })
-                        
-                        return anime_list
-                    except Exception as e:
-                        logger.error(f"Error getting anime terbaru from soup: {e}")
-                        return []
-                
-                # Buat fungsi untuk mengambil data movie dari soup
-                def get_movie_from_soup(soup):
-                    try:
-                        movie_list = []
-                        # Log selectors untuk debugging
-                        logger.info("Mencari movie dengan selector: aside#sidebar .widgetseries ul li")
-                        movie_items = soup.select("aside#sidebar .widgetseries ul li")
-                        logger.info(f"Jumlah item movie yang ditemukan: {len(movie_items)}")
-                        
-                        for item in movie_items:
-                            title_el = item.select_one("h2 a.series")
-                            if not title_el:
-                                continue
-                            
-                            # Mengambil genre
-                            genre_elements = item.select(".lftinfo span a")
-                            genres = [genre.text.strip() for genre in genre_elements]
-                            
-                            # Mengambil tanggal rilis
-                            release_date_el = item.select_one(".lftinfo span:last-of-type")
-                            release_date = release_date_el.text.strip() if release_date_el and not release_date_el.find('a') else "-"
-                            
-                            url = title_el.get("href")
-                            cover = item.select_one("img").get("src") if item.select_one("img") else "-"
-                            
-                            # Ekstrak anime_slug dari URL
-                            anime_slug = None
-                            if url != "N/A" and url != "-":
-                                anime_match = re.search(r'anime/([^/]+)', url)
-                                if anime_match:
-                                    anime_slug = anime_match.group(1)
-                            
-                            movie_list.append({
-                                "judul": title_el.text.strip(),
-                                "url": url,
-                                "anime_slug": anime_slug,
-                                "tanggal": release_date,
-                                "cover": cover,
-                                "genres": genres
-                            })
-                        
-                        return movie_list
-                    except Exception as e:
-                        logger.error(f"Error getting movie from soup: {e}")
-                        return []
-                
-                # Buat fungsi untuk mengambil data anime mingguan dari soup
-                def get_anime_mingguan_from_soup(soup):
-                    try:
-                        anime_list = []
-                        # Log selectors untuk debugging
-                        logger.info("Mencari anime mingguan dengan selector: div.topten-animesu li")
-                        items = soup.select("div.topten-animesu li")
-                        if not items:
-                            # Coba selector alternatif jika tidak ada hasil
-                            logger.info("Mencoba selector alternatif untuk anime mingguan: div.topten-animesu-left li, div.topten-animesu-right li")
-                            items = soup.select("div.topten-animesu-left li, div.topten-animesu-right li")
-                        logger.info(f"Jumlah item anime mingguan yang ditemukan: {len(items)}")
-                        
-                        for item in items:
-                            title_el = item.select_one("h2 a")
-                            if not title_el:
-                                # Coba selector alternatif untuk judul
-                                title_el = item.select_one("a.series")
-                                if not title_el:
-                                    continue
-                            
-                            # Mengambil rating
-                            rating_el = item.select_one(".rating")
-                            rating = rating_el.text.strip() if rating_el else "-"
-                            
-                            # Mengambil genre
-                            genre_elements = item.select(".lftinfo span a")
-                            genres = [genre.text.strip() for genre in genre_elements]
-                            
-                            url = title_el.get("href")
-                            cover = item.select_one("img").get("src") if item.select_one("img") else "-"
-                            
-                            # Ekstrak anime_slug dari URL
-                            anime_slug = None
-                            if url and url != "N/A" and url != "-":
-                                anime_match = re.search(r'anime/([^/]+)', url)
-                                if anime_match:
-                                    anime_slug = anime_match.group(1)
-                            
-                            # Debug log untuk membantu troubleshooting
-                            full_title = title_el.text.strip() if hasattr(title_el, 'text') else 'Unknown'
-                            logger.info(f"Extracted top10 item: {full_title}")
-                            
-                            # Ekstrak hanya nama anime dari judul
-                            # Format judul biasanya: "8.73\n\nTOP1\nOne Piece"
-                            anime_name = full_title
-                            if "\n" in full_title:
-                                # Ambil baris terakhir yang berisi nama anime
-                                anime_name = full_title.split("\n")[-1].strip()
-                            
-                            anime_list.append({
-                                "judul": anime_name,
-                                "url": url if url else "-",
-                                "anime_slug": anime_slug,
-                                "rating": rating,
-                                "cover": cover,
-                                "genres": genres
-                            })
-                        
-                        return anime_list
-                    except Exception as e:
-                        logger.error(f"Error getting anime mingguan from soup: {e}")
-                        return []
-                
-                # Jalankan semua fungsi secara paralel
-                future_anime_terbaru = executor.submit(get_anime_terbaru_from_soup, soup)
-                future_movie = executor.submit(get_movie_from_soup, soup)
-                future_anime_mingguan = executor.submit(get_anime_mingguan_from_soup, soup)
+            soup = self.get_soup(self.base_url, sections=self.HOME_SECTIONS)
+            self._log_home_structure(soup)
+            
+            # Jalankan semua fungsi parsing secara paralel di executor cpu
+            future_anime_terbaru = submit(CPU, self._parse_home_anime_terbaru, soup)
+            future_movie = submit(CPU, self._parse_home_movies, soup)
+            future_anime_mingguan = submit(CPU, self._parse_home_top10, soup)
                 
-                # Ambil jadwal rilis secara terpisah karena menggunakan API
-                future_jadwal_rilis = executor.submit(self.get_jadwal_rilis)
+            # Jadwal rilis diambil di thread ini sementara parsing berjalan; fan-out per harinya sudah di executor io
+            jadwal_rilis_home = self.get_jadwal_rilis()
                 
-                # Kumpulkan hasil
-                anime_terbaru_home = future_anime_terbaru.result()
-                movie_home = future_movie.result()
-                anime_mingguan = future_anime_mingguan.result()
-                jadwal_rilis_home = future_jadwal_rilis.result()
+            # Kumpulkan hasil
+            anime_terbaru_home = future_anime_terbaru.result()
+            movie_home = future_movie.result()
+            anime_mingguan = future_anime_mingguan.result()
             
             # Buat hasil akhir
-            return {
+            return self._home_or_empty({
                 "top10": anime_mingguan,
                 "new_eps": anime_terbaru_home,
                 "movies": movie_home,
                 "jadwal_rilis": jadwal_rilis_home
-            }
+            })
         
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
         except Exception as e:
             logger.error(f"Error getting home page data: {e}")
-            return {
-                "top10": [],
-                "new_eps": [],
-                "movies": [],
-                "jadwal_rilis": {}
-            }
\ No newline at end of file
+            return {}
+    
+    async def aget_home_data(self) -> Dict[str, Any]:
+        """
+        Get home page data from Samehadaku (async).
+        """
+        logger.info(f"Getting home page data from {self.base_url}")
+        
+        try:
+            # Halaman utama dan jadwal rilis diambil bersamaan
+            soup, jadwal_rilis_home = await asyncio.gather(
+                self.aget_soup(self.base_url, sections=self.HOME_SECTIONS),
+                self.aget_jadwal_rilis(),
+            )
+            anime_mingguan, anime_terbaru_home, movie_home = await run_blocking(self._parse_home_sections, soup)
+            
+            return self._home_or_empty({
+                "top10": anime_mingguan,
+                "new_eps": anime_terbaru_home,
+                "movies": movie_home,
+                "jadwal_rilis": jadwal_rilis_home
+            })
+        
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
+        except Exception as e:
+            logger.error(f"Error getting home page data: {e}")
+            return {}
+    
+    @staticmethod
+    def _home_or_empty(home: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return {} when every home section came back empty, so a failed scrape is not cached as data.
+        """
+        if any(home.values()):
+            return home
+        logger.error("Semua bagian halaman utama kosong")
+        return {}
+    
+    def _parse_home_sections(self, soup: BeautifulSoup) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Parse top 10, latest episodes and movie sections of the home page.
+        """
+        self._log_home_structure(soup)
+        return self._parse_home_top10(soup), self._parse_home_anime_terbaru(soup), self._parse_home_movies(soup)
+    
+    def _log_home_structure(self, soup: BeautifulSoup) -> None:
+        """
+        Log home page structure for debugging.
+        """
+        # Log HTML untuk debugging
+        html_content = soup.prettify()
+        logger.info(f"HTML structure length: {len(html_content)}")
+        logger.info(f"HTML structure (first 1000 chars): {html_content[:1000]}...")
+        
+        # Log semua div classes untuk debugging
+        div_classes = set()
+        for div in soup.find_all('div', class_=True):
+            div_classes.update(div['class'])
+        logger.info(f"All div classes found: {sorted(list(div_classes))}")
+        
+        # Log semua article classes untuk debugging
+        article_classes = set()
+        for article in soup.find_all('article', class_=True):
+            article_classes.update(article['class'])
+        logger.info(f"All article classes found: {sorted(list(article_classes))}")
+    
+    def _parse_home_anime_terbaru(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Parse latest episodes section of the home page.
+        """
+        try:
+            anime_list = []
+            # Log selectors untuk debugging
+            logger.info("Mencari anime terbaru dengan selector: .post-show > ul > li")
+            items = soup.select(".post-show > ul > li")
+            logger.info(f"Jumlah item anime terbaru yang ditemukan: {len(items)}")
+            
+            for li in items:
+                title_el = li.select_one("h2.entry-title a")
+                if not title_el:
+                    continue
+                
+                # Mengambil episode dengan selector yang lebih stabil
+                episode_el = li.select_one(".dtla span:nth-of-type(1)")
+                episode = episode_el.get_text(strip=True).replace("Episode", "").strip() if episode_el else "-"
+                
+                # Mengambil tanggal rilis
+                released_on_el = li.select_one(".dtla span:nth-of-type(3)")
+                rilis = released_on_el.get_text(strip=True).replace("Released on:", "").strip() if released_on_el else "-"
+                
+                url = title_el["href"]
+                cover = li.select_one("img")["src"] if li.select_one("img") else "-"
+                
+                # Ekstrak anime_slug dari URL
+                anime_slug = None
+                if url != "N/A" and url != "-":
+                    anime_match = re.search(r'anime/([^/]+)', url)
+                    if anime_match:
+                        anime_slug = anime_match.group(1)
+                
+                anime_list.append({
+                    "judul": title_el.text.strip(),
+                    "url": url,
+                    "anime_slug": anime_slug,
+                    "episode": episode,
+                    "rilis": rilis,
+                    "cover": cover
+                })
+            
+            return anime_list
+        except Exception as e:
+            logger.error(f"Error getting anime terbaru from soup: {e}")
+            return []
+    
+    def _parse_home_movies(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Parse movie sidebar of the home page.
+        """
+        try:
+            movie_list = []
+            # Log selectors untuk debugging
+            logger.info("Mencari movie dengan selector: aside#sidebar .widgetseries ul li")
+            movie_items = soup.select("aside#sidebar .widgetseries ul li")
+            logger.info(f"Jumlah item movie yang ditemukan: {len(movie_items)}")
+            
+            for item in movie_items:
+                title_el = item.select_one("h2 a.series")
+                if not title_el:
+                    continue
+                
+                # Mengambil genre
+                genre_elements = item.select(".lftinfo span a")
+                genres = [genre.text.strip() for genre in genre_elements]
+                
+                # Mengambil tanggal rilis
+                release_date_el = item.select_one(".lftinfo span:last-of-type")
+                release_date = release_date_el.text.strip() if release_date_el and not release_date_el.find('a') else "-"
+                
+                url = title_el.get("href")
+                cover = item.select_one("img").get("src") if item.select_one("img") else "-"
+                
+                # Ekstrak anime_slug dari URL
+                anime_slug = None
+                if url != "N/A" and url != "-":
+                    anime_match = re.search(r'anime/([^/]+)', url)
+                    if anime_match:
+                        anime_slug = anime_match.group(1)
+                
+                movie_list.append({
+                    "judul": title_el.text.strip(),
+                    "url": url,
+                    "anime_slug": anime_slug,
+                    "tanggal": release_date,
+                    "cover": cover,
+                    "genres": genres
+                })
+            
+            return movie_list
+        except Exception as e:
+            logger.error(f"Error getting movie from soup: {e}")
+            return []
+    
+    def _parse_home_top10(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Parse weekly top 10 section of the home page.
+        """
+        try:
+            anime_list = []
+            # Log selectors untuk debugging
+            logger.info("Mencari anime mingguan dengan selector: div.topten-animesu li")
+            items = soup.select("div.topten-animesu li")
+            if not items:
+                # Coba selector alternatif jika tidak ada hasil
+                logger.info("Mencoba selector alternatif untuk anime mingguan: div.topten-animesu-left li, div.topten-animesu-right li")
+                items = soup.select("div.topten-animesu-left li, div.topten-animesu-right li")
+            logger.info(f"Jumlah item anime mingguan yang ditemukan: {len(items)}")
+            
+            for item in items:
+                title_el = item.select_one("h2 a")
+                if not title_el:
+                    # Coba selector alternatif untuk judul
+                    title_el = item.select_one("a.series")
+                    if not title_el:
+                        continue
+                
+                # Mengambil rating
+                rating_el = item.select_one(".rating")
+                rating = rating_el.text.strip() if rating_el else "-"
+                
+                # Mengambil genre
+                genre_elements = item.select(".lftinfo span a")
+                genres = [genre.text.strip() for genre in genre_elements]
+                
+                url = title_el.get("href")
+                cover = item.select_one("img").get("src") if item.select_one("img") else "-"
+                
+                # Ekstrak anime_slug dari URL
+                anime_slug = None
+                if url and url != "N/A" and url != "-":
+                    anime_match = re.search(r'anime/([^/]+)', url)
+                    if anime_match:
+                        anime_slug = anime_match.group(1)
+                
+                # Debug log untuk membantu troubleshooting
+                full_title = title_el.text.strip() if hasattr(title_el, 'text') else 'Unknown'
+                logger.info(f"Extracted top10 item: {full_title}")
+                
+                # Ekstrak hanya nama anime dari judul
+                # Format judul biasanya: "8.73\n\nTOP1\nOne Piece"
+                anime_name = full_title
+                if "\n" in full_title:
+                    # Ambil baris terakhir yang berisi nama anime
+                    anime_name = full_title.split("\n")[-1].strip()
+                
+                anime_list.append({
+                    "judul": anime_name,
+                    "url": url if url else "-",
+                    "anime_slug": anime_slug,
+                    "rating": rating,
+                    "cover": cover,
+                    "genres": genres
+                })
+            
+            return anime_list
+        except Exception as e:
+            logger.error(f"Error getting anime mingguan from soup: {e}")
+            return []
@@ -1,10 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote_plus
+import httpx
 import requests
 from bs4 import BeautifulSoup
 import logging
 
+from ..core.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from ..core.config import settings
+from ..core.deadline import DeadlineExceeded, check_deadline, upstream_timeout
+from ..core.disk_cache import get_html_disk_cache
+from ..core.encoding import page_encoding
+from ..core.executors import run_blocking
+from ..core.hedging import get_hedge_policy
+from ..core.http_client import DEFAULT_HEADERS, get_async_client, get_sync_session
+from ..core.json_routes import disable_json_route, json_route_enabled, record_json_route
+from ..core.limiter import get_host_limiter, is_overload_error
+from ..core.mirrors import get_mirror_pool
+from ..core.retry import aretry_call, retry_call
+from ..core.revalidation import NotModified, conditional_headers, is_revalidating, record_revalidation, remember_validators
+from ..core.singleflight import SingleFlight
+from ..core.streaming import StreamingSoup
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +30,41 @@ logger = logging.getLogger(__name__)
 class BaseScraper(ABC):
     """
     Base class for all scrapers.
+    
+    Concurrent GETs of the same URL (sync or async) share one upstream
+    request, and concurrent get_soup/aget_soup calls share one parse.
+    Every upstream request holds a slot of its host's adaptive limiter and
+    goes through the circuit breaker for its host and page type; GETs are
+    retried with jittered backoff on overload errors. Call sites can opt in
+    to hedged GETs by passing a hedge policy name. Every upstream request
+    times out after settings.HTTP_TIMEOUT or the remaining request deadline
+    (app.core.deadline), whichever is shorter. With
+    settings.HTML_DISK_CACHE_DIR set, HTML bodies are kept on disk and
+    reused for settings.HTML_DISK_CACHE_MAX_AGE seconds.
+    
+    Inside revalidating() (see app.core.revalidation), GETs of pages the
+    refreshed cache entry holds ETag/Last-Modified for are conditional and
+    raise NotModified on 304. Validators of other responses are collected
+    for the cache entry being filled.
+    
+    URLs are built against the canonical base_url. With mirrors configured
+    for the source, each request goes to the fastest healthy mirror and
+    fails over to the next one on overload errors; mirror hosts in
+    response bodies are rewritten to the canonical host.
+    
+    Soups are parsed from the raw body in the encoding declared by the
+    response or remembered for the host (app.core.encoding), without
+    decoding it to a string first. get_soup/aget_soup called with sections
+    parse the body while it is downloaded and stop reading once those
+    sections are complete (see app.core.streaming).
+    
+    Page types with a route in the source's json_routes are read from the
+    REST API first; _json_first/_ajson_first return None to fall back to
+    HTML when the route fails or returns no usable items.
     """
+    # Request upstream yang sedang berjalan per URL, dibagi semua scraper
+    _url_flights = SingleFlight()
+    
     def __init__(self, source_name: str):
         self.source_name = source_name
         self.source_config = self._get_source_config()
@@ -20,6 +72,8 @@ class BaseScraper(ABC):
         self.search_url = self.source_config.get("search_url", "")
         self.api_url = self.source_config.get("api_url", "")
         self.active = self.source_config.get("active", False)
+        self.mirrors = get_mirror_pool(self.base_url, self.source_config.get("mirrors", [])) if self.base_url else None
+        self.json_routes: Dict[str, str] = self.source_config.get("json_routes", {})
         
         if not self.active:
             logger.warning(f"Scraper {source_name} is not active")
@@ -33,43 +87,450 @@ class BaseScraper(ABC):
             return {}
         return settings.ANIME_SOURCES[self.source_name]
     
-    def get_html(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        """
+        Check whether an HTTP error (requests or httpx) was an upstream 404.
+        """
+        response = getattr(error, "response", None)
+        return getattr(response, "status_code", None) == 404
+    
+    @staticmethod
+    def _flight_key(kind: str, url: str, headers: Optional[Dict[str, str]]) -> str:
+        # Request kondisional bisa berakhir NotModified, hanya dibagi dengan validators yang sama
+        if is_revalidating():
+            kind = f"{kind}?{sorted(conditional_headers(url).items())}"
+        if not headers:
+            return f"{kind} {url}"
+        return f"{kind} {url} {sorted(headers.items())}"
+    
+    @staticmethod
+    def _with_validators(url: str, headers: Optional[Dict[str, str]]) -> Tuple[Optional[Dict[str, str]], bool]:
+        if not is_revalidating():
+            return headers, False
+        conditional = conditional_headers(url)
+        if not conditional:
+            return headers, False
+        return {**(headers or {}), **conditional}, True
+    
+    def _check_modified(self, url: str, response: Any, conditional: bool) -> None:
+        """
+        Raise NotModified for a 304, otherwise remember the response's validators.
+        """
+        not_modified = response.status_code == 304
+        if conditional:
+            record_revalidation(not_modified)
+        if not_modified:
+            self._touch_disk_html(url)
+            raise NotModified(url)
+        remember_validators(url, response.headers)
+    
+    def _route(self, url: str) -> List[str]:
+        """
+        URLs to try for a request, best mirror first.
+        """
+        if self.mirrors is None or len(self.mirrors) == 1 or not self.mirrors.owns(url):
+            return [url]
+        return [self.mirrors.to_mirror(url, base) for base in self.mirrors.ranked()]
+        
+    def _record_mirror(self, url: str, start: float, failed: bool = False) -> None:
+        if self.mirrors is not None and len(self.mirrors) > 1:
+            self.mirrors.record(url, time.monotonic() - start, failed)
+    
+    def _canonical_text(self, text: str) -> str:
+        return self.mirrors.canonicalize(text) if self.mirrors is not None else text
+    
+    def _canonical_json(self, response: Any) -> Any:
+        if self.mirrors is None or len(self.mirrors) == 1:
+            return response.json()
+        return json.loads(self._canonical_text(response.text))
+    
+    def _request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        """
+        Send one request to url through its host's circuit breaker and limiter.
+        """
+        timeout = upstream_timeout(timeout, where=f"{method} {url}")
+        with get_circuit_breaker(url).guard(), get_host_limiter(url).slot():
+            try:
+                response = getattr(get_sync_session(), method.lower())(url, timeout=timeout, **kwargs)
+            except requests.exceptions.Timeout:
+                check_deadline(f"{method} {url} selesai")
+                raise
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                response.close()
+                raise
+            return response
+    
+    def _failover(self, method: str, url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        """
+        Send a request to the best mirror, moving to the next one on overload errors or an open breaker.
+        """
+        targets = self._route(url)
+        error: Optional[Exception] = None
+        for i, target in enumerate(targets):
+            start = time.monotonic()
+            try:
+                response = self._request(method, target, timeout, **kwargs)
+            except CircuitOpenError as e:
+                error = e
+                continue
+            except Exception as e:
+                # 404 dan deadline habis bukan masalah mirror, tidak perlu pindah
+                if not is_overload_error(e):
+                    raise
+                self._record_mirror(target, start, failed=True)
+                if i + 1 < len(targets):
+                    logger.warning(f"Mirror {target} gagal ({e}), mencoba {targets[i + 1]}")
+                error = e
+                continue
+            self._record_mirror(target, start)
+            return response
+        raise error
+    
+    async def _arequest(self, method: str, url: str, timeout: Optional[float] = None, **kwargs: Any) -> httpx.Response:
+        """
+        Send one request to url through its host's circuit breaker and limiter (async).
+        """
+        timeout = upstream_timeout(timeout, where=f"{method} {url}")
+        client = get_async_client()
+        with get_circuit_breaker(url).guard():
+            async with get_host_limiter(url).aslot():
+                try:
+                    if kwargs.pop("stream", False):
+                        response = await client.send(client.build_request(method, url, timeout=timeout, **kwargs), stream=True)
+                    else:
+                        response = await getattr(client, method.lower())(url, timeout=timeout, **kwargs)
+                except httpx.TimeoutException:
+                    check_deadline(f"{method} {url} selesai")
+                    raise
+                try:
+                    # httpx menganggap 304 error; untuk request kondisional ditangani _check_modified
+                    if response.status_code != 304:
+                        response.raise_for_status()
+                except httpx.HTTPStatusError:
+                    await response.aclose()
+                    raise
+                return response
+    
+    async def _afailover(self, method: str, url: str, timeout: Optional[float] = None, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request to the best mirror, moving to the next one on overload errors or an open breaker (async).
+        """
+        targets = self._route(url)
+        error: Optional[Exception] = None
+        for i, target in enumerate(targets):
+            start = time.monotonic()
+            try:
+                response = await self._arequest(method, target, timeout, **kwargs)
+            except CircuitOpenError as e:
+                error = e
+                continue
+            except Exception as e:
+                if not is_overload_error(e):
+                    raise
+                self._record_mirror(target, start, failed=True)
+                if i + 1 < len(targets):
+                    logger.warning(f"Mirror {target} gagal ({e}), mencoba {targets[i + 1]}")
+                error = e
+                continue
+            self._record_mirror(target, start)
+            return response
+        raise error
+    
+    def _send_get(self, url: str, headers: Dict[str, str], hedge: Optional[str] = None, **kwargs: Any) -> requests.Response:
+        def attempt() -> requests.Response:
+            return self._failover("GET", url, headers=headers, **kwargs)
+        
+        if hedge and settings.HEDGING_ENABLED:
+            return get_hedge_policy(hedge).run(lambda: retry_call(attempt))
+        return retry_call(attempt)
+    
+    async def _asend_get(self, url: str, headers: Optional[Dict[str, str]], hedge: Optional[str] = None, **kwargs: Any) -> httpx.Response:
+        async def attempt() -> httpx.Response:
+            return await self._afailover("GET", url, headers=headers, **kwargs)
+        
+        if hedge and settings.HEDGING_ENABLED:
+            return await get_hedge_policy(hedge).arun(lambda: aretry_call(attempt))
+        return await aretry_call(attempt)
+    
+    def _read_disk_html(self, url: str, max_age: Optional[float] = None) -> Optional[str]:
+        body = self._read_disk_body(url, max_age)
+        return body.decode("utf-8") if body is not None else None
+    
+    def _read_disk_body(self, url: str, max_age: Optional[float] = None) -> Optional[bytes]:
+        """
+        Get the UTF-8 body stored on disk for URL, None if missing or older than max_age.
+        """
+        disk = get_html_disk_cache()
+        if disk is None:
+            return None
+        try:
+            stored = disk.get(url)
+        except OSError as e:
+            logger.warning(f"Error reading disk cache for {url}: {e}")
+            return None
+        if stored is None or (max_age is not None and time.time() - stored.fetched_at >= max_age):
+            return None
+        return stored.body
+    
+    def _write_disk_html(self, url: str, html: str, response_headers: Any) -> None:
+        disk = get_html_disk_cache()
+        if disk is None:
+            return
+        try:
+            disk.put(
+                url,
+                html.encode("utf-8"),
+                etag=response_headers.get("ETag"),
+                last_modified=response_headers.get("Last-Modified"),
+            )
+        except OSError as e:
+            logger.warning(f"Error writing disk cache for {url}: {e}")
+    
+    def _touch_disk_html(self, url: str) -> None:
+        disk = get_html_disk_cache()
+        if disk is None:
+            return
+        try:
+            disk.touch(url)
+        except OSError as e:
+            logger.warning(f"Error updating disk cache for {url}: {e}")
+    
+    def _json_route_url(self, page_type: str, **params: Any) -> Optional[str]:
+        template = self.json_routes.get(page_type)
+        if not template or not json_route_enabled(f"{self.source_name}_{page_type}"):
+            return None
+        path = template.format(**{name: quote_plus(str(value)) for name, value in params.items()})
+        return path if path.startswith(("http://", "https://")) else f"{self.api_url}{path}"
+    
+    def _json_result(self, page_type: str, parse: Callable[[Any], List[Dict[str, Any]]], payload: Any) -> Optional[List[Dict[str, Any]]]:
+        name = f"{self.source_name}_{page_type}"
+        try:
+            items = parse(payload)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Route JSON {page_type} tidak berisi field yang dibutuhkan ({e}), kembali ke HTML")
+            disable_json_route(name)
+            items = []
+        # Hasil kosong bisa berarti route mengabaikan parameter, HTML yang memastikan
+        record_json_route(name, bool(items))
+        return items or None
+    
+    def _json_failed(self, page_type: str, error: Exception) -> None:
+        name = f"{self.source_name}_{page_type}"
+        # Breaker terbuka untuk API tidak berarti route-nya salah; halaman HTML punya breaker sendiri
+        if not isinstance(error, CircuitOpenError):
+            logger.warning(f"Route JSON {page_type} gagal ({error}), kembali ke HTML")
+            disable_json_route(name)
+        record_json_route(name, False)
+    
+    def _json_first(self, page_type: str, parse: Callable[[Any], List[Dict[str, Any]]], **params: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a page's items from its JSON route, if the source has one.
+        
+        Args:
+            page_type: Key in json_routes (e.g. "anime_terbaru")
+            parse: Turns the JSON payload into result items, raising KeyError/ValueError on missing fields
+            params: Values for the route template placeholders, URL-encoded
+        
+        Returns:
+            Items, or None to scrape the HTML page instead
+        """
+        url = self._json_route_url(page_type, **params)
+        if url is None:
+            return None
+        try:
+            payload = self.get_json(url)
+        except (DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            self._json_failed(page_type, e)
+            return None
+        return self._json_result(page_type, parse, payload)
+    
+    async def _ajson_first(self, page_type: str, parse: Callable[[Any], List[Dict[str, Any]]], **params: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a page's items from its JSON route, if the source has one (async).
+        """
+        url = self._json_route_url(page_type, **params)
+        if url is None:
+            return None
+        try:
+            payload = await self.aget_json(url)
+        except (DeadlineExceeded, NotModified):
+            raise
+        except Exception as e:
+            self._json_failed(page_type, e)
+            return None
+        return self._json_result(page_type, parse, payload)
+    
+    def get_cached_html(self, url: str) -> Optional[str]:
+        """
+        Get the last HTML stored on disk for URL, regardless of age.
+        
+        Lets results be re-derived offline (e.g. after changing a selector).
+        
+        Returns:
+            HTML, or None if the disk cache is disabled or has no copy
+        """
+        return self._read_disk_html(url)
+    
+    def get_html(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> str:
         """
         Get HTML content from URL.
+        
+        hedge names the hedging policy (e.g. "episode") to use, None to disable.
+        """
+        return self._url_flights.do(self._flight_key("html", url, headers), self._fetch_html, url, headers, hedge)
+    
+    def _fetch_html(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> str:
+        if headers is None:
+            headers = DEFAULT_HEADERS
+        
+        html = self._read_disk_html(url, settings.HTML_DISK_CACHE_MAX_AGE)
+        if html is not None:
+            return html
+        
+        headers, conditional = self._with_validators(url, headers)
+        try:
+            response = self._send_get(url, headers, hedge)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error getting HTML from {url}: {e}")
+            raise
+        self._check_modified(url, response, conditional)
+        html = self._canonical_text(response.text)
+        self._write_disk_html(url, html, response.headers)
+        return html
+    
+    def get_html_bytes(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
         """
+        Get the raw HTML body of URL and its encoding.
+        
+        The encoding is None when neither the response nor the page declares
+        one and the host's encoding is not known yet.
+        """
+        return self._url_flights.do(self._flight_key("bytes", url, headers), self._fetch_html_bytes, url, headers, hedge)
+    
+    def _fetch_html_bytes(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
         if headers is None:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
-            }
+            headers = DEFAULT_HEADERS
         
+        body = self._read_disk_body(url, settings.HTML_DISK_CACHE_MAX_AGE)
+        if body is not None:
+            return body, "utf-8"
+        
+        headers, conditional = self._with_validators(url, headers)
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            return response.text
+            response = self._send_get(url, headers, hedge)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting HTML from {url}: {e}")
             raise
+        self._check_modified(url, response, conditional)
+        body = response.content
+        encoding = page_encoding(url, response.headers.get("Content-Type"), body)
+        if get_html_disk_cache() is not None:
+            self._write_disk_html(url, self._canonical_text(body.decode(encoding or "utf-8", "replace")), response.headers)
+        return body, encoding
+    
+    def _parse_html_bytes(self, body: bytes, encoding: Optional[str]) -> BeautifulSoup:
+        if self.mirrors is not None and len(self.mirrors) > 1:
+            body = self.mirrors.canonicalize(body)
+        return BeautifulSoup(body, "lxml", from_encoding=encoding)
     
-    def get_soup(self, url: str, headers: Optional[Dict[str, str]] = None) -> BeautifulSoup:
+    def get_soup(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        hedge: Optional[str] = None,
+        sections: Sequence[str] = (),
+    ) -> BeautifulSoup:
         """
         Get BeautifulSoup object from URL.
+        
+        sections lists selectors (tag, tag.class or tag#id) of the parts of
+        the page the caller reads; when given and hedge is None, the body is
+        parsed while downloading and the rest of the page is skipped once
+        they are complete.
+        
+        The soup may be shared with concurrent callers and must not be mutated.
         """
-        html = self.get_html(url, headers)
-        return BeautifulSoup(html, "lxml")
+        if self._streams(hedge, sections):
+            return self._url_flights.do(self._flight_key(self._stream_kind(sections), url, headers), self._stream_soup, url, headers, sections)
+        return self._url_flights.do(self._flight_key("soup", url, headers), self._build_soup, url, headers, hedge)
+    
+    def _build_soup(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> BeautifulSoup:
+        body, encoding = self.get_html_bytes(url, headers, hedge)
+        return self._parse_html_bytes(body, encoding)
+    
+    @staticmethod
+    def _streams(hedge: Optional[str], sections: Sequence[str]) -> bool:
+        # Hedging butuh body lengkap dari request pemenang, jadi tidak di-stream
+        return bool(sections) and hedge is None and settings.STREAMING_PARSE_ENABLED
+    
+    @staticmethod
+    def _stream_kind(sections: Sequence[str]) -> str:
+        return "soup?sections=" + ",".join(sections)
+    
+    def _streaming_soup(self, url: str, response: Any, sections: Sequence[str]) -> StreamingSoup:
+        rewrite = self._canonical_text if self.mirrors is not None and len(self.mirrors) > 1 else None
+        # Tanpa charset di header atau host yang sudah dikenal, lxml membaca <meta charset> sendiri
+        return StreamingSoup(sections, encoding=page_encoding(url, response.headers.get("Content-Type")), rewrite=rewrite)
     
-    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    def _stream_soup(self, url: str, headers: Optional[Dict[str, str]], sections: Sequence[str]) -> BeautifulSoup:
+        if headers is None:
+            headers = DEFAULT_HEADERS
+        
+        disk_enabled = get_html_disk_cache() is not None
+        body = self._read_disk_body(url, settings.HTML_DISK_CACHE_MAX_AGE) if disk_enabled else None
+        if body is not None:
+            return self._parse_html_bytes(body, "utf-8")
+        
+        headers, conditional = self._with_validators(url, headers)
+        try:
+            response = self._send_get(url, headers, stream=True)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error getting HTML from {url}: {e}")
+            raise
+        try:
+            self._check_modified(url, response, conditional)
+            parser = self._streaming_soup(url, response, sections)
+            body = bytearray()
+            complete = True
+            try:
+                for chunk in response.iter_content(settings.STREAMING_CHUNK_SIZE):
+                    if disk_enabled:
+                        body += chunk
+                    if parser.feed(chunk):
+                        complete = False
+                        break
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error getting HTML from {url}: {e}")
+                raise
+            # Hanya body lengkap yang disimpan ke disk
+            if complete and disk_enabled:
+                self._write_disk_html(url, self._canonical_text(bytes(body).decode(parser.encoding or "utf-8", "replace")), response.headers)
+            return parser.close()
+        finally:
+            response.close()
+    
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Dict[str, Any]:
         """
         Get JSON from URL.
+        
+        hedge names the hedging policy (e.g. "jadwal") to use, None to disable.
         """
+        return self._url_flights.do(self._flight_key("json", url, headers), self._fetch_json, url, headers, hedge)
+    
+    def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Dict[str, Any]:
         if headers is None:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
-            }
+            headers = DEFAULT_HEADERS
         
+        headers, conditional = self._with_validators(url, headers)
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            return response.json()
+            response = self._send_get(url, headers, hedge)
+            self._check_modified(url, response, conditional)
+            return self._canonical_json(response)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting JSON from {url}: {e}")
             raise
@@ -77,6 +538,189 @@ class BaseScraper(ABC):
             logger.error(f"Error parsing JSON from {url}: {e}")
             raise
     
+    def post_html(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        hedge: Optional[str] = None,
+    ) -> str:
+        """
+        POST form data to URL and return the HTML response.
+        
+        POSTs are not retried. hedge names the hedging policy (e.g.
+        "player_ajax") to use, None to disable; only pass it for POSTs
+        that are safe to send twice.
+        """
+        if headers is None:
+            headers = DEFAULT_HEADERS
+        
+        def attempt() -> requests.Response:
+            return self._failover("POST", url, timeout, data=data, headers=headers)
+        
+        try:
+            if hedge and settings.HEDGING_ENABLED:
+                response = get_hedge_policy(hedge).run(attempt)
+            else:
+                response = attempt()
+            return self._canonical_text(response.text)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error posting to {url}: {e}")
+            raise
+    
+    async def aget_html(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> str:
+        """
+        Get HTML content from URL using the shared async connection pool.
+        """
+        return await self._url_flights.ado(self._flight_key("html", url, headers), self._afetch_html, url, headers, hedge)
+    
+    async def _afetch_html(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> str:
+        disk_enabled = get_html_disk_cache() is not None
+        if disk_enabled:
+            html = await run_blocking(self._read_disk_html, url, settings.HTML_DISK_CACHE_MAX_AGE)
+            if html is not None:
+                return html
+        
+        headers, conditional = self._with_validators(url, headers)
+        try:
+            response = await self._asend_get(url, headers, hedge)
+        except httpx.HTTPError as e:
+            logger.error(f"Error getting HTML from {url}: {e}")
+            raise
+        self._check_modified(url, response, conditional)
+        html = self._canonical_text(response.text)
+        if disk_enabled:
+            await run_blocking(self._write_disk_html, url, html, response.headers)
+        return html
+    
+    async def aget_html_bytes(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
+        """
+        Get the raw HTML body of URL and its encoding using the shared async connection pool.
+        """
+        return await self._url_flights.ado(self._flight_key("bytes", url, headers), self._afetch_html_bytes, url, headers, hedge)
+    
+    async def _afetch_html_bytes(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
+        disk_enabled = get_html_disk_cache() is not None
+        if disk_enabled:
+            body = await run_blocking(self._read_disk_body, url, settings.HTML_DISK_CACHE_MAX_AGE)
+            if body is not None:
+                return body, "utf-8"
+        
+        headers, conditional = self._with_validators(url, headers)
+        try:
+            response = await self._asend_get(url, headers, hedge)
+        except httpx.HTTPError as e:
+            logger.error(f"Error getting HTML from {url}: {e}")
+            raise
+        self._check_modified(url, response, conditional)
+        body = response.content
+        encoding = page_encoding(url, response.headers.get("Content-Type"), body)
+        if disk_enabled:
+            html = self._canonical_text(body.decode(encoding or "utf-8", "replace"))
+            await run_blocking(self._write_disk_html, url, html, response.headers)
+        return body, encoding
+    
+    async def aget_soup(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        hedge: Optional[str] = None,
+        sections: Sequence[str] = (),
+    ) -> BeautifulSoup:
+        """
+        Get BeautifulSoup object from URL using the shared async connection pool.
+        
+        sections works as in get_soup; chunks are parsed in the blocking executor.
+        
+        The soup may be shared with concurrent callers and must not be mutated.
+        """
+        if self._streams(hedge, sections):
+            return await self._url_flights.ado(self._flight_key(self._stream_kind(sections), url, headers), self._astream_soup, url, headers, sections)
+        return await self._url_flights.ado(self._flight_key("soup", url, headers), self._abuild_soup, url, headers, hedge)
+    
+    async def _abuild_soup(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> BeautifulSoup:
+        body, encoding = await self.aget_html_bytes(url, headers, hedge)
+        return await run_blocking(self._parse_html_bytes, body, encoding)
+    
+    async def _astream_soup(self, url: str, headers: Optional[Dict[str, str]], sections: Sequence[str]) -> BeautifulSoup:
+        disk_enabled = get_html_disk_cache() is not None
+        if disk_enabled:
+            body = await run_blocking(self._read_disk_body, url, settings.HTML_DISK_CACHE_MAX_AGE)
+            if body is not None:
+                return await run_blocking(self._parse_html_bytes, body, "utf-8")
+        
+        headers, conditional = self._with_validators(url, headers)
+        try:
+            response = await self._asend_get(url, headers, stream=True)
+        except httpx.HTTPError as e:
+            logger.error(f"Error getting HTML from {url}: {e}")
+            raise
+        try:
+            self._check_modified(url, response, conditional)
+            parser = self._streaming_soup(url, response, sections)
+            body = bytearray()
+            complete = True
+            try:
+                async for chunk in response.aiter_bytes(settings.STREAMING_CHUNK_SIZE):
+                    if disk_enabled:
+                        body += chunk
+                    if await run_blocking(parser.feed, chunk):
+                        complete = False
+                        break
+            except httpx.HTTPError as e:
+                logger.error(f"Error getting HTML from {url}: {e}")
+                raise
+            if complete and disk_enabled:
+                html = self._canonical_text(bytes(body).decode(parser.encoding or "utf-8", "replace"))
+                await run_blocking(self._write_disk_html, url, html, response.headers)
+            return await run_blocking(parser.close)
+        finally:
+            await response.aclose()
+    
+    async def aget_json(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get JSON from URL using the shared async connection pool.
+        """
+        return await self._url_flights.ado(self._flight_key("json", url, headers), self._afetch_json, url, headers, hedge)
+    
+    async def _afetch_json(self, url: str, headers: Optional[Dict[str, str]] = None, hedge: Optional[str] = None) -> Dict[str, Any]:
+        headers, conditional = self._with_validators(url, headers)
+        try:
+            response = await self._asend_get(url, headers, hedge)
+            self._check_modified(url, response, conditional)
+            return self._canonical_json(response)
+        except httpx.HTTPError as e:
+            logger.error(f"Error getting JSON from {url}: {e}")
+            raise
+        except ValueError as e:
+            logger.error(f"Error parsing JSON from {url}: {e}")
+            raise
+    
+    async def apost_html(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        hedge: Optional[str] = None,
+    ) -> str:
+        """
+        POST form data to URL using the shared async connection pool.
+        """
+        async def attempt() -> httpx.Response:
+            return await self._afailover("POST", url, timeout, data=data, headers=headers)
+        
+        try:
+            if hedge and settings.HEDGING_ENABLED:
+                response = await get_hedge_policy(hedge).arun(attempt)
+            else:
+                response = await attempt()
+            return self._canonical_text(response.text)
+        except httpx.HTTPError as e:
+            logger.error(f"Error posting to {url}: {e}")
+            raise
+    
     @abstractmethod
     def search(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -124,4 +768,49 @@ class BaseScraper(ABC):
         """
         Get home page data.
         """
-        pass
\ No newline at end of file
+        pass
+    
+    # Async variants. Scrapers without native async support fall back to
+    # running the synchronous implementation on the bounded executor.
+    
+    async def asearch(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Search for anime (async).
+        """
+        return await run_blocking(self.search, query)
+    
+    async def aget_anime_details(self, anime_slug: str) -> Dict[str, Any]:
+        """
+        Get anime details (async).
+        """
+        return await run_blocking(self.get_anime_details, anime_slug)
+    
+    async def aget_episode_details(self, episode_url: str) -> Dict[str, Any]:
+        """
+        Get episode details (async).
+        """
+        return await run_blocking(self.get_episode_details, episode_url)
+    
+    async def aget_anime_terbaru(self, page: int = 1) -> List[Dict[str, Any]]:
+        """
+        Get latest anime (async).
+        """
+        return await run_blocking(self.get_anime_terbaru, page)
+    
+    async def aget_movie_list(self, page: int = 1) -> List[Dict[str, Any]]:
+        """
+        Get movie list (async).
+        """
+        return await run_blocking(self.get_movie_list, page)
+    
+    async def aget_jadwal_rilis(self, day: Optional[str] = None) -> Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Get release schedule (async).
+        """
+        return await run_blocking(self.get_jadwal_rilis, day)
+    
+    async def aget_home_data(self) -> Dict[str, Any]:
+        """
+        Get home page data (async).
+        """
+        return await run_blocking(self.get_home_data)
@@ -12,6 +12,25 @@ from tests.test_movie_validator import TestMovieValidator
 from tests.test_anime_terbaru_validator import TestAnimeTerbaruValidator
 from tests.test_anime_detail_validator import TestAnimeDetailValidator
 from tests.test_episode_detail_validator import TestEpisodeDetailValidator
+from tests.test_samehadaku_scraper import TestSamehadakuScraper, TestUrlCoalescing
+from tests.test_cache import TestAsyncCache, TestStaleWhileRevalidate, TestNegativeCache, TestLastKnownGood, TestCacheStampede, TestCacheSerialization, TestRedisBackend, TestTieredBackend
+from tests.test_lru import TestBoundedCache
+from tests.test_singleflight import TestSingleFlight
+from tests.test_cache_policy import TestCachePolicy
+from tests.test_response_cache import TestResponseCache
+from tests.test_bloom import TestBloomFilter
+from tests.test_limiter import TestAdaptiveLimiter
+from tests.test_circuit_breaker import TestCircuitBreaker, TestRetry
+from tests.test_hedging import TestHedging
+from tests.test_disk_cache import TestDiskCache
+from tests.test_revalidation import TestRevalidation
+from tests.test_transport import TestRecordReplay
+from tests.test_deadline import TestDeadline
+from tests.test_mirrors import TestMirrorPool
+from tests.test_streaming import TestStreamingParse
+from tests.test_encoding import TestPageEncoding
+from tests.test_json_routes import TestJsonFastPath
+from tests.test_executors import TestNamedExecutors
 
 def run_tests():
     # Buat test suite
@@ -24,6 +43,34 @@ def run_tests():
     test_suite.addTest(unittest.makeSuite(TestAnimeTerbaruValidator))
     test_suite.addTest(unittest.makeSuite(TestAnimeDetailValidator))
     test_suite.addTest(unittest.makeSuite(TestEpisodeDetailValidator))
+    test_suite.addTest(unittest.makeSuite(TestSamehadakuScraper))
+    test_suite.addTest(unittest.makeSuite(TestUrlCoalescing))
+    test_suite.addTest(unittest.makeSuite(TestAsyncCache))
+    test_suite.addTest(unittest.makeSuite(TestStaleWhileRevalidate))
+    test_suite.addTest(unittest.makeSuite(TestNegativeCache))
+    test_suite.addTest(unittest.makeSuite(TestLastKnownGood))
+    test_suite.addTest(unittest.makeSuite(TestCacheStampede))
+    test_suite.addTest(unittest.makeSuite(TestCacheSerialization))
+    test_suite.addTest(unittest.makeSuite(TestRedisBackend))
+    test_suite.addTest(unittest.makeSuite(TestTieredBackend))
+    test_suite.addTest(unittest.makeSuite(TestBoundedCache))
+    test_suite.addTest(unittest.makeSuite(TestSingleFlight))
+    test_suite.addTest(unittest.makeSuite(TestCachePolicy))
+    test_suite.addTest(unittest.makeSuite(TestResponseCache))
+    test_suite.addTest(unittest.makeSuite(TestBloomFilter))
+    test_suite.addTest(unittest.makeSuite(TestAdaptiveLimiter))
+    test_suite.addTest(unittest.makeSuite(TestCircuitBreaker))
+    test_suite.addTest(unittest.makeSuite(TestRetry))
+    test_suite.addTest(unittest.makeSuite(TestHedging))
+    test_suite.addTest(unittest.makeSuite(TestDiskCache))
+    test_suite.addTest(unittest.makeSuite(TestRevalidation))
+    test_suite.addTest(unittest.makeSuite(TestRecordReplay))
+    test_suite.addTest(unittest.makeSuite(TestDeadline))
+    test_suite.addTest(unittest.makeSuite(TestMirrorPool))
+    test_suite.addTest(unittest.makeSuite(TestStreamingParse))
+    test_suite.addTest(unittest.makeSuite(TestPageEncoding))
+    test_suite.addTest(unittest.makeSuite(TestJsonFastPath))
+    test_suite.addTest(unittest.makeSuite(TestNamedExecutors))
     
     # Jalankan test
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,45 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import bloom
+from app.core.bloom import BloomFilter, RotatingBloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_no_false_negatives_and_low_false_positive_rate(self):
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom_filter.add(f"slug-{i}")
+        
+        self.assertTrue(all(f"slug-{i}" in bloom_filter for i in range(1000)))
+        false_positives = sum(f"other-{i}" in bloom_filter for i in range(10000))
+        self.assertLess(false_positives / 10000, 0.03)
+    
+    def test_rotation_forgets_old_items(self):
+        with mock.patch.object(bloom.time, "monotonic", return_value=1000.0):
+            rotating = RotatingBloomFilter(capacity=100, error_rate=0.01, rotate_seconds=60)
+            rotating.add("anime:missing")
+        
+        # Satu periode kemudian item masih diingat di generasi sebelumnya
+        with mock.patch.object(bloom.time, "monotonic", return_value=1061.0):
+            self.assertIn("anime:missing", rotating)
+        # Setelah rotasi berikutnya item dilupakan
+        with mock.patch.object(bloom.time, "monotonic", return_value=1122.0):
+            self.assertNotIn("anime:missing", rotating)
+    
+    def test_mark_missing_is_scoped_by_kind(self):
+        bloom.known_missing.clear()
+        bloom.mark_missing("anime", "tidak-ada")
+        
+        self.assertTrue(bloom.is_known_missing("anime", "tidak-ada"))
+        self.assertFalse(bloom.is_known_missing("episode", "tidak-ada"))
+        bloom.known_missing.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
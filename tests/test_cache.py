@@ -0,0 +1,477 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import cache as cache_module
+from app.core import response_cache
+from app.core.cache import aget_from_cache_or_fetch, ainvalidate_cache, set_cache_backend
+from app.core.cache_backends import MemoryBackend, RedisBackend, TieredBackend, deserialize_entry, serialize_entry
+from app.core.cache_policy import get_cache_policy
+from app.core.circuit_breaker import CircuitOpenError
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover
+    fakeredis = None
+
+try:
+    # Dibutuhkan fakeredis untuk menjalankan script Lua
+    import lupa
+except ImportError:  # pragma: no cover
+    lupa = None
+
+
+class TestAsyncCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    async def test_cache_hit_not_delayed_by_slow_fetch(self):
+        cache_module.cache["hot_key"] = {"timestamp": time.time(), "data": {"hot": True}}
+        
+        def slow_fetch():
+            time.sleep(0.5)
+            return {"slow": True}
+        
+        def unexpected_fetch():
+            raise AssertionError("Cache hit tidak boleh memanggil fetch")
+        
+        slow_task = asyncio.create_task(aget_from_cache_or_fetch("cold_key", slow_fetch))
+        # Beri kesempatan fetch lambat untuk mulai berjalan
+        await asyncio.sleep(0.05)
+        
+        start = time.perf_counter()
+        hit = await aget_from_cache_or_fetch("hot_key", unexpected_fetch)
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(hit, {"hot": True})
+        self.assertLess(elapsed, 0.05)
+        self.assertFalse(slow_task.done())
+        
+        self.assertEqual(await slow_task, {"slow": True})
+        self.assertEqual(cache_module.cache["cold_key"]["data"], {"slow": True})
+    
+    async def test_coroutine_fetch_is_awaited(self):
+        async def async_fetch(value):
+            await asyncio.sleep(0)
+            return {"value": value}
+        
+        result = await aget_from_cache_or_fetch("async_key", async_fetch, 7)
+        
+        self.assertEqual(result, {"value": 7})
+        self.assertEqual(cache_module.cache["async_key"]["data"], {"value": 7})
+
+
+class TestStaleWhileRevalidate(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    def put_stale(self, key, data, age):
+        now = time.time()
+        cache_module.cache[key] = {"timestamp": now - age, "data": data, "expires_at": now + 60}
+    
+    async def wait_for_refreshes(self):
+        if cache_module._refresh_tasks:
+            await asyncio.gather(*cache_module._refresh_tasks)
+    
+    async def test_stale_served_immediately_with_single_refresh(self):
+        self.put_stale("home_data", {"version": 1}, age=20)
+        calls = []
+        
+        async def slow_fetch():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return {"version": 2}
+        
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            aget_from_cache_or_fetch("home_data", slow_fetch, ttl=10, grace=60) for _ in range(5)
+        ])
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(results, [{"version": 1}] * 5)
+        self.assertLess(elapsed, 0.1)
+        
+        await self.wait_for_refreshes()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache_module.cache["home_data"]["data"], {"version": 2})
+    
+    async def test_refresh_failure_keeps_stale_value(self):
+        self.put_stale("search_naruto", ["naruto"], age=20)
+        errors_before = cache_module._swr_stats["refresh_errors"]
+        
+        async def failing_fetch():
+            raise RuntimeError("upstream down")
+        
+        self.assertEqual(await aget_from_cache_or_fetch("search_naruto", failing_fetch, ttl=10, grace=60), ["naruto"])
+        await self.wait_for_refreshes()
+        
+        self.assertEqual(cache_module._swr_stats["refresh_errors"], errors_before + 1)
+        self.assertEqual(await aget_from_cache_or_fetch("search_naruto", failing_fetch, ttl=10, grace=60), ["naruto"])
+        await self.wait_for_refreshes()
+    
+    async def test_entry_past_grace_is_fetched_synchronously(self):
+        self.put_stale("movie_list_page_1", ["old"], age=100)
+        
+        result = await aget_from_cache_or_fetch("movie_list_page_1", lambda: ["new"], ttl=10, grace=60)
+        
+        self.assertEqual(result, ["new"])
+    
+    def test_sync_path_serves_stale_and_refreshes(self):
+        self.put_stale("anime_terbaru_page_1", ["old"], age=20)
+        refreshed = threading.Event()
+        
+        def fetch():
+            refreshed.set()
+            return ["new"]
+        
+        self.assertEqual(cache_module.get_from_cache_or_fetch("anime_terbaru_page_1", fetch, ttl=10, grace=60), ["old"])
+        self.assertTrue(refreshed.wait(2))
+        for _ in range(100):
+            if cache_module.cache["anime_terbaru_page_1"]["data"] == ["new"]:
+                break
+            time.sleep(0.01)
+        self.assertEqual(cache_module.cache["anime_terbaru_page_1"]["data"], ["new"])
+
+
+
+class TestNegativeCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    async def test_empty_result_cached_for_negative_ttl(self):
+        calls = []
+        
+        async def no_hits():
+            calls.append(1)
+            return []
+        
+        self.assertEqual(await aget_from_cache_or_fetch("search_zzzz", no_hits), [])
+        self.assertEqual(await aget_from_cache_or_fetch("search_zzzz", no_hits), [])
+        self.assertEqual(len(calls), 1)
+        
+        entry = cache_module.cache["search_zzzz"]
+        policy = get_cache_policy("search_zzzz")
+        self.assertAlmostEqual(entry["expires_at"] - entry["timestamp"], policy.negative_ttl, delta=1)
+    
+    async def test_failed_section_scrape_cached_for_negative_ttl(self):
+        # Scrape jadwal/home yang gagal: dict dengan semua bagian kosong
+        failed = {
+            "jadwal_rilis_all": {"Monday": [], "Tuesday": [], "Sunday": []},
+            "home_data": {"top10": [], "new_eps": [], "movies": [], "jadwal_rilis": {"Monday": []}},
+        }
+        stores_before = cache_module._negative_stats["negative_stores"]
+        
+        for key, data in failed.items():
+            self.assertEqual(await aget_from_cache_or_fetch(key, lambda data=data: data), data)
+            
+            entry = cache_module.cache[key]
+            self.assertAlmostEqual(entry["expires_at"] - entry["timestamp"], get_cache_policy(key).negative_ttl, delta=1)
+            self.assertIsNone(cache_module.cache.get(f"last_good:{key}"))
+        
+        self.assertEqual(cache_module._negative_stats["negative_stores"], stores_before + 2)
+    
+    async def test_expired_negative_entry_is_refetched(self):
+        now = time.time()
+        cache_module.cache["anime_detail_foo"] = {"timestamp": now - 3600, "data": {}, "expires_at": now + 60}
+        
+        result = await aget_from_cache_or_fetch("anime_detail_foo", lambda: {"judul": "Foo"})
+        
+        self.assertEqual(result, {"judul": "Foo"})
+    
+    async def test_empty_refresh_keeps_stale_data(self):
+        now = time.time()
+        cache_module.cache["anime_terbaru_page_1"] = {"timestamp": now - 20, "data": ["old"], "expires_at": now + 60}
+        errors_before = cache_module._swr_stats["refresh_errors"]
+        
+        async def failed_scrape():
+            return []
+        
+        self.assertEqual(await aget_from_cache_or_fetch("anime_terbaru_page_1", failed_scrape, ttl=10, grace=60), ["old"])
+        await asyncio.gather(*cache_module._refresh_tasks)
+        
+        self.assertEqual(cache_module.cache["anime_terbaru_page_1"]["data"], ["old"])
+        self.assertEqual(cache_module._swr_stats["refresh_errors"], errors_before + 1)
+
+
+class TestLastKnownGood(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    def expire(self, key):
+        # Lewati ttl + grace sehingga entry utama hilang
+        cache_module.cache.pop(key)
+    
+    async def test_open_breaker_serves_last_good_marked_stale(self):
+        await aget_from_cache_or_fetch("anime_detail_naruto", lambda: {"title": "Naruto"}, ttl=10, grace=60)
+        self.expire("anime_detail_naruto")
+        
+        def breaker_open():
+            raise CircuitOpenError("example.com anime", 30)
+        
+        entry = await cache_module.aget_entry_from_cache_or_fetch("anime_detail_naruto", breaker_open, ttl=10, grace=60)
+        
+        self.assertEqual(entry["data"], {"title": "Naruto"})
+        self.assertTrue(entry["stale"])
+        self.assertEqual(cache_module.get_cache_stats()["stale_while_revalidate"]["last_good_hits"], 1)
+    
+    async def test_open_breaker_without_last_good_raises(self):
+        def breaker_open():
+            raise CircuitOpenError("example.com anime", 30)
+        
+        with self.assertRaises(CircuitOpenError):
+            await aget_from_cache_or_fetch("anime_detail_bleach", breaker_open, ttl=10, grace=60)
+    
+    def test_sync_path_serves_last_good(self):
+        cache_module.get_from_cache_or_fetch("movie_list_page_2", lambda: ["movie"], ttl=10, grace=60)
+        self.expire("movie_list_page_2")
+        
+        def breaker_open():
+            raise CircuitOpenError("example.com anime-movie", 30)
+        
+        self.assertEqual(cache_module.get_from_cache_or_fetch("movie_list_page_2", breaker_open, ttl=10, grace=60), ["movie"])
+
+
+class TestCacheStampede(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    async def test_concurrent_misses_fetch_once(self):
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"top10": []}
+        
+        results = await asyncio.gather(*[aget_from_cache_or_fetch("home_data", fetch) for _ in range(20)])
+        
+        self.assertEqual(results, [{"top10": []}] * 20)
+        self.assertEqual(len(calls), 1)
+    
+    def test_concurrent_sync_misses_fetch_once(self):
+        calls = []
+        results = []
+        
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return ["naruto"]
+        
+        threads = [
+            threading.Thread(target=lambda: results.append(cache_module.get_from_cache_or_fetch("search_naruto", fetch)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, [["naruto"]] * 8)
+        self.assertEqual(len(calls), 1)
+
+    async def test_async_caller_joins_sync_fetch(self):
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return ["naruto"]
+        
+        thread = threading.Thread(target=cache_module.get_from_cache_or_fetch, args=("search_naruto", fetch))
+        thread.start()
+        await asyncio.sleep(0.05)
+        
+        self.assertEqual(await aget_from_cache_or_fetch("search_naruto", fetch), ["naruto"])
+        thread.join()
+        self.assertEqual(len(calls), 1)
+
+
+class TestCacheSerialization(unittest.TestCase):
+    def test_small_entry_roundtrip(self):
+        entry = {"timestamp": 123.5, "data": {"judul": "Contoh", "genre": ["Action"]}}
+        payload = serialize_entry(entry)
+        
+        self.assertTrue(payload.startswith(b"j"))
+        self.assertEqual(deserialize_entry(payload), entry)
+    
+    def test_large_entry_is_compressed(self):
+        entry = {"timestamp": 1.0, "data": [{"judul": f"Anime {i}", "url": "https://example.com"} for i in range(200)]}
+        payload = serialize_entry(entry)
+        
+        self.assertTrue(payload.startswith(b"z"))
+        self.assertEqual(deserialize_entry(payload), entry)
+
+    def test_validators_roundtrip(self):
+        entry = {"timestamp": 1.0, "data": {"judul": "Contoh"}, "validators": {"https://example.com/": {"etag": '"v1"', "last_modified": None}}}
+        
+        self.assertEqual(deserialize_entry(serialize_entry(entry)), entry)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis tidak terpasang")
+class TestRedisBackend(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = fakeredis.FakeServer()
+        self.redis = fakeredis.FakeAsyncRedis(server=self.server)
+        self.backend = RedisBackend(client=self.redis, prefix="test:")
+        set_cache_backend(self.backend)
+    
+    async def asyncTearDown(self):
+        set_cache_backend(None)
+        await self.redis.aclose()
+    
+    async def test_fetch_once_and_ttl_enforced_by_redis(self):
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            return {"top10": [1, 2, 3]}
+        
+        first = await aget_from_cache_or_fetch("home_data", fetch, ttl=60)
+        second = await aget_from_cache_or_fetch("home_data", fetch, ttl=60)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+        ttl = await self.redis.ttl("test:home_data")
+        self.assertGreater(ttl, 60)
+        # Redis menyimpan data selama ttl + grace window
+        self.assertLessEqual(ttl, 60 + get_cache_policy("home_data").grace)
+    
+    async def test_invalidate_only_touches_own_prefix(self):
+        await self.redis.set("other:key", b"keep")
+        await aget_from_cache_or_fetch("search_naruto", lambda: ["naruto"], ttl=60)
+        await aget_from_cache_or_fetch("search_onepiece", lambda: ["one piece"], ttl=60)
+        
+        await ainvalidate_cache("search_naruto")
+        # Salinan last known good tetap disimpan untuk fallback circuit breaker
+        self.assertEqual(
+            sorted(await self.backend.keys()),
+            ["last_good:search_naruto", "last_good:search_onepiece", "search_onepiece"],
+        )
+        
+        await ainvalidate_cache()
+        self.assertEqual(await self.backend.keys(), [])
+        self.assertEqual(await self.redis.get("other:key"), b"keep")
+    
+    @unittest.skipIf(lupa is None, "lupa tidak terpasang")
+    async def test_worker_waits_for_lease_holder(self):
+        # Worker lain memegang lease dan mengisi key
+        peer = RedisBackend(client=fakeredis.FakeAsyncRedis(server=self.server), prefix="test:")
+        token = await peer.acquire_lease("home_data", 5)
+        self.assertIsNotNone(token)
+        self.assertIsNone(await self.backend.acquire_lease("home_data", 5))
+        
+        async def peer_fill():
+            await asyncio.sleep(0.1)
+            await peer.set("home_data", {"timestamp": time.time(), "data": {"from": "peer"}}, 60)
+            await peer.release_lease("home_data", token)
+        
+        async def unexpected_fetch():
+            raise AssertionError("Worker yang menunggu lease tidak boleh fetch")
+        
+        with mock.patch.object(cache_module.settings, "CACHE_LEASE_POLL_INTERVAL", 0.02):
+            filler = asyncio.create_task(peer_fill())
+            result = await aget_from_cache_or_fetch("home_data", unexpected_fetch, ttl=60)
+            await filler
+        
+        self.assertEqual(result, {"from": "peer"})
+        # Lease sudah dilepas dan tidak terlihat sebagai key cache
+        self.assertIsNotNone(await self.backend.acquire_lease("home_data", 5))
+        self.assertEqual(await self.backend.keys(), ["home_data"])
+        await peer.client.aclose()
+
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis tidak terpasang")
+class TestTieredBackend(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # Dua worker berbagi satu server Redis
+        server = fakeredis.FakeServer()
+        self.worker_a = TieredBackend(MemoryBackend(), RedisBackend(client=fakeredis.FakeAsyncRedis(server=server), prefix="test:"))
+        self.worker_b = TieredBackend(MemoryBackend(), RedisBackend(client=fakeredis.FakeAsyncRedis(server=server), prefix="test:"))
+        await self.worker_a.start()
+        await self.worker_b.start()
+    
+    async def asyncTearDown(self):
+        await self.worker_a.close()
+        await self.worker_b.close()
+    
+    async def wait_until(self, predicate):
+        for _ in range(100):
+            if predicate():
+                return
+            await asyncio.sleep(0.02)
+        self.fail("Kondisi tidak terpenuhi")
+    
+    async def test_l1_and_l2_hit_ratios(self):
+        entry = {"timestamp": time.time(), "data": {"hot": True}}
+        await self.worker_a.set("home_data", entry, 60)
+        
+        self.assertEqual((await self.worker_b.get("home_data"))["data"], {"hot": True})
+        self.assertEqual((await self.worker_b.get("home_data"))["data"], {"hot": True})
+        self.assertIsNone(await self.worker_b.get("missing"))
+        
+        stats = self.worker_b.stats()
+        self.assertEqual(stats["l1_hits"], 1)
+        self.assertEqual(stats["l2_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertAlmostEqual(stats["l1_hit_ratio"], 1 / 3)
+        self.assertAlmostEqual(stats["l2_hit_ratio"], 1 / 2)
+    
+    async def test_invalidation_is_broadcast_to_other_workers(self):
+        await self.worker_a.set("jadwal_rilis_all", {"timestamp": time.time(), "data": {"Monday": []}}, 60)
+        await self.worker_b.get("jadwal_rilis_all")
+        self.assertIn("jadwal_rilis_all", self.worker_b.l1.store)
+        
+        await self.worker_a.delete("jadwal_rilis_all")
+        await self.wait_until(lambda: "jadwal_rilis_all" not in self.worker_b.l1.store)
+        self.assertIsNone(await self.worker_b.get("jadwal_rilis_all"))
+    
+    async def test_remote_invalidation_drops_encoded_responses(self):
+        response_cache._responses["home_data"] = {"timestamp": time.time(), "data": response_cache.encode_response({"top10": []}), "fresh_until": time.time() + 60}
+        self.addCleanup(response_cache._responses.clear)
+        
+        await self.worker_a.delete("home_data")
+        
+        await self.wait_until(lambda: "home_data" not in response_cache._responses)
+    
+    async def test_own_writes_keep_local_l1(self):
+        await self.worker_a.set("home_data", {"timestamp": time.time(), "data": 1}, 60)
+        await asyncio.sleep(0.1)
+        
+        self.assertIn("home_data", self.worker_a.l1.store)
+
+
+if __name__ == '__main__':
+    unittest.main()
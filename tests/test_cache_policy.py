@@ -0,0 +1,73 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import cache as cache_module
+from app.core import cache_policy
+from app.core.cache import aget_from_cache_or_fetch, set_cache_backend
+from app.core.cache_policy import CachePolicy, build_policies, describe_policies, get_cache_policy
+from app.core.config import settings
+
+
+class TestCachePolicy(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    def test_families_use_long_ttl_settings(self):
+        self.assertEqual(get_cache_policy("home_data").ttl, settings.CACHE_TTL)
+        self.assertEqual(get_cache_policy("jadwal_rilis_all").ttl, settings.CACHE_LONG_TTL)
+        self.assertEqual(get_cache_policy("anime_detail_one-piece").ttl, settings.CACHE_LONG_TTL)
+        self.assertEqual(get_cache_policy("movie_list_page_7").ttl, settings.CACHE_VERY_LONG_TTL)
+    
+    def test_exact_key_wins_over_pattern(self):
+        self.assertEqual(get_cache_policy("anime_terbaru_page_1").ttl, settings.CACHE_TTL)
+        self.assertEqual(get_cache_policy("anime_terbaru_page_12").ttl, settings.CACHE_LONG_TTL)
+        self.assertEqual(get_cache_policy("movie_list_page_1").ttl, settings.CACHE_LONG_TTL)
+    
+    def test_unknown_key_uses_default_policy(self):
+        policy = get_cache_policy("something_else")
+        
+        self.assertEqual(policy.ttl, settings.CACHE_TTL)
+        self.assertEqual(policy.grace, settings.CACHE_STALE_GRACE)
+        self.assertIsNone(policy.max_size)
+    
+    def test_overrides_merge_into_defaults(self):
+        policies = build_policies({"search_*": {"ttl": 30}, "genre_*": {"ttl": 7200, "grace": 0}})
+        
+        self.assertEqual(policies["search_*"].ttl, 30)
+        self.assertEqual(policies["search_*"].grace, 120)
+        self.assertEqual(policies["genre_*"], CachePolicy(ttl=7200, grace=0))
+    
+    def test_policies_visible_in_stats(self):
+        table = describe_policies()
+        
+        self.assertIn("*", table)
+        self.assertEqual(table["jadwal_rilis_*"]["ttl"], settings.CACHE_LONG_TTL)
+        self.assertEqual(cache_module.get_cache_stats()["policies"], table)
+    
+    async def test_policy_ttl_applied_to_entries(self):
+        await aget_from_cache_or_fetch("movie_list_page_9", lambda: ["movie"])
+        
+        entry = cache_module.cache["movie_list_page_9"]
+        policy = get_cache_policy("movie_list_page_9")
+        self.assertAlmostEqual(entry["expires_at"] - entry["timestamp"], policy.ttl + policy.grace, delta=1)
+    
+    async def test_oversized_result_is_not_cached(self):
+        with mock.patch.dict(cache_policy.POLICIES, {"search_*": CachePolicy(ttl=60, grace=0, max_size=1024)}):
+            result = await aget_from_cache_or_fetch("search_big", lambda: ["x" * 4096])
+        
+        self.assertEqual(result, ["x" * 4096])
+        self.assertNotIn("search_big", cache_module.cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import os
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import httpx
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, page_type
+from app.core.config import settings
+from app.core.retry import aretry_call, backoff_delay, retry_call
+
+REQUEST = httpx.Request("GET", "https://example.com/")
+
+
+def status_error(code, headers=None):
+    response = httpx.Response(code, request=REQUEST, headers=headers)
+    return httpx.HTTPStatusError(str(code), request=REQUEST, response=response)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def fail(self, breaker, error):
+        with self.assertRaises(type(error)):
+            with breaker.guard():
+                raise error
+    
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=60)
+        for _ in range(3):
+            self.fail(breaker, status_error(503))
+        
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.allow()
+        self.assertEqual(breaker.stats()["rejected"], 1)
+    
+    def test_not_found_counts_as_success(self):
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60)
+        self.fail(breaker, status_error(503))
+        self.fail(breaker, status_error(404))
+        self.fail(breaker, status_error(503))
+        
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        self.fail(breaker, httpx.ConnectTimeout("timeout", request=REQUEST))
+        time.sleep(0.06)
+        
+        breaker.allow()
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        # Hanya satu probe yang boleh berjalan
+        with self.assertRaises(CircuitOpenError):
+            breaker.allow()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        self.fail(breaker, status_error(502))
+        time.sleep(0.06)
+        
+        self.fail(breaker, status_error(502))
+        
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.stats()["opened"], 2)
+    
+    def test_page_type(self):
+        self.assertEqual(page_type("https://example.com/"), "home")
+        self.assertEqual(page_type("https://example.com/?s=naruto"), "search")
+        self.assertEqual(page_type("https://example.com/anime/naruto/"), "anime")
+        self.assertEqual(page_type("https://example.com/anime-terbaru/page/2/"), "anime-terbaru")
+        self.assertEqual(page_type("https://example.com/naruto-episode-3/"), "episode")
+        self.assertEqual(page_type("https://example.com/wp-json/custom/v1/all-schedule?day=monday"), "wp-json")
+
+
+class TestRetry(unittest.TestCase):
+    def no_delay(self):
+        return mock.patch.object(settings, "UPSTREAM_RETRY_BASE_DELAY", 0)
+    
+    def test_retries_overload_errors_until_success(self):
+        outcomes = [status_error(503), httpx.ReadTimeout("timeout", request=REQUEST), "ok"]
+        
+        def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        
+        with self.no_delay():
+            self.assertEqual(retry_call(flaky, attempts=3), "ok")
+    
+    def test_gives_up_after_attempts(self):
+        calls = []
+        
+        async def failing():
+            calls.append(1)
+            raise status_error(500)
+        
+        with self.no_delay(), self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(aretry_call(failing, attempts=3))
+        self.assertEqual(len(calls), 3)
+    
+    def test_not_found_and_open_breaker_not_retried(self):
+        for error in (status_error(404), CircuitOpenError("test", 10)):
+            calls = []
+            
+            def failing():
+                calls.append(1)
+                raise error
+            
+            with self.no_delay(), self.assertRaises(type(error)):
+                retry_call(failing, attempts=3)
+            self.assertEqual(len(calls), 1)
+    
+    def test_backoff_is_jittered_and_honours_retry_after(self):
+        with mock.patch.object(settings, "UPSTREAM_RETRY_BASE_DELAY", 0.5), mock.patch.object(settings, "UPSTREAM_RETRY_MAX_DELAY", 5.0):
+            delays = [backoff_delay(2) for _ in range(20)]
+            retry_after = backoff_delay(0, status_error(429, {"Retry-After": "3"}))
+        
+        self.assertTrue(all(0 <= delay <= 2.0 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+        self.assertGreaterEqual(retry_after, 3.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import sys
+import os
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import cache as cache_module
+from app.core.cache import aget_entry_from_cache_or_fetch, set_cache_backend
+from app.core.config import settings
+from app.core.deadline import DeadlineExceeded, deadline, mark_partial, remaining, upstream_timeout
+from app.core.limiter import AdaptiveLimiter
+from app.services.samehadaku_scraper import SamehadakuScraper
+from tests.test_samehadaku_scraper import EMBED_HTML, FakeSamehadakuScraper
+
+
+class TestDeadline(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    def test_timeout_is_remaining_budget(self):
+        self.assertEqual(upstream_timeout(), settings.HTTP_TIMEOUT)
+        with deadline(2.0):
+            self.assertLessEqual(upstream_timeout(), 2.0)
+            self.assertEqual(upstream_timeout(0.5), 0.5)
+            # Deadline dalam tidak boleh memperpanjang deadline luar
+            with deadline(60.0):
+                self.assertLessEqual(remaining(), 2.0)
+        with deadline(0.01):
+            with self.assertRaises(DeadlineExceeded):
+                upstream_timeout()
+    
+    def test_sync_get_uses_remaining_budget(self):
+        timeouts = []
+        
+        def fake_get(url, headers=None, timeout=None):
+            timeouts.append(timeout)
+            return mock.Mock(status_code=200, text="<html></html>", headers={}, raise_for_status=lambda: None)
+        
+        with mock.patch("app.services.scraper.get_sync_session", return_value=mock.Mock(get=fake_get)):
+            with deadline(3.0):
+                SamehadakuScraper().get_html("https://example.com/anime/deadline/")
+        
+        self.assertGreater(timeouts[0], 2.5)
+        self.assertLessEqual(timeouts[0], 3.0)
+    
+    def test_limiter_queue_wait_bounded(self):
+        limiter = AdaptiveLimiter(initial=1, min_limit=1, max_limit=1, latency_target=10)
+        limiter.acquire()
+        
+        with deadline(0.1):
+            with self.assertRaises(DeadlineExceeded):
+                with limiter.slot():
+                    pass
+        
+        self.assertEqual(limiter.stats()["waiting"], 0)
+        limiter.release()
+        self.assertEqual(limiter.in_flight, 0)
+    
+    async def test_partial_result_served_but_not_cached(self):
+        def fetch():
+            mark_partial()
+            return {"jadwal_rilis": {"Monday": []}}
+        
+        with deadline(5.0):
+            entry = await aget_entry_from_cache_or_fetch("home_data", fetch)
+        
+        self.assertTrue(entry["partial"])
+        self.assertIsNone(cache_module.cache.get("home_data"))
+    
+    async def test_player_ajax_cut_off_by_request_deadline(self):
+        async def apost(url, data, headers=None, timeout=None, hedge=None):
+            await asyncio.sleep(2.0 if data["nume"] == "1" else 0.0)
+            return EMBED_HTML
+        
+        with mock.patch.object(FakeSamehadakuScraper, "apost_html", side_effect=apost):
+            with deadline(0.3) as current:
+                start = time.perf_counter()
+                result = await FakeSamehadakuScraper().aget_episode_details("https://example.com/foo-episode-3/")
+                elapsed = time.perf_counter() - start
+        
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual([s["server_name"] for s in result["streaming_servers"]], ["Server A"])
+        self.assertTrue(current.partial)
+
+
+if __name__ == '__main__':
+    unittest.main()
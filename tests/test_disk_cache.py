@@ -0,0 +1,94 @@
+import sys
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.config import settings
+from app.core.disk_cache import DiskCache
+from app.services.samehadaku_scraper import SamehadakuScraper
+from tests.test_samehadaku_scraper import HOME_HTML
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+    
+    def test_roundtrip_keeps_metadata(self):
+        disk = DiskCache(self.tmp.name, max_bytes=10 ** 6)
+        disk.put("https://example.com/anime/foo/", HOME_HTML.encode("utf-8"), etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT", fetched_at=123.0)
+        
+        entry = disk.get("https://example.com/anime/foo/")
+        
+        self.assertEqual(entry.body.decode("utf-8"), HOME_HTML)
+        self.assertEqual(entry.etag, '"abc"')
+        self.assertEqual(entry.last_modified, "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertEqual(entry.fetched_at, 123.0)
+        self.assertIsNone(disk.get("https://example.com/anime/bar/"))
+    
+    def test_identical_bodies_stored_once_and_compressed(self):
+        disk = DiskCache(self.tmp.name, max_bytes=10 ** 6)
+        body = HOME_HTML.encode("utf-8") * 20
+        first = disk.put("https://example.com/a/", body)
+        second = disk.put("https://example.com/b/", body)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(disk.stats()["objects"], 1)
+        self.assertEqual(disk.stats()["dedup_writes"], 1)
+        self.assertLess(disk.stats()["bytes"], len(body))
+    
+    def test_least_recently_used_evicted_over_cap(self):
+        bodies = {url: os.urandom(2000) for url in ("a", "b", "c")}
+        disk = DiskCache(self.tmp.name, max_bytes=5000)
+        disk.put("a", bodies["a"])
+        disk.put("b", bodies["b"])
+        # Akses "a" agar "b" menjadi yang paling lama tidak dipakai
+        disk.get("a")
+        disk.put("c", bodies["c"])
+        
+        self.assertIsNotNone(disk.get("a"))
+        self.assertIsNone(disk.get("b"))
+        self.assertIsNotNone(disk.get("c"))
+        self.assertLessEqual(disk.total_bytes, 5000)
+        self.assertEqual(disk.stats()["evictions"], 1)
+    
+    def test_index_survives_restart(self):
+        DiskCache(self.tmp.name, max_bytes=10 ** 6).put("https://example.com/", b"<html></html>")
+        
+        reopened = DiskCache(self.tmp.name, max_bytes=10 ** 6)
+        
+        self.assertEqual(reopened.get("https://example.com/").body, b"<html></html>")
+        self.assertEqual(reopened.stats()["objects"], 1)
+        self.assertGreater(reopened.total_bytes, 0)
+    
+    def test_scraper_reuses_fresh_disk_copy(self):
+        calls = []
+        
+        def fake_get(url, headers=None, timeout=None):
+            calls.append(url)
+            return mock.Mock(text=HOME_HTML, headers={"ETag": '"v1"'}, raise_for_status=lambda: None)
+        
+        session = mock.Mock(get=fake_get)
+        scraper = SamehadakuScraper()
+        url = "https://example.com/anime/disk/"
+        with mock.patch.object(settings, "HTML_DISK_CACHE_DIR", self.tmp.name), \
+                mock.patch("app.services.scraper.get_sync_session", return_value=session):
+            self.assertEqual(scraper.get_html(url), HOME_HTML)
+            # Cold start: HTML diambil dari disk, bukan dari upstream
+            self.assertEqual(scraper.get_html(url), HOME_HTML)
+            self.assertEqual(len(calls), 1)
+            
+            with mock.patch.object(settings, "HTML_DISK_CACHE_MAX_AGE", 0):
+                scraper.get_html(url)
+            self.assertEqual(len(calls), 2)
+            
+            self.assertEqual(scraper.get_cached_html(url), HOME_HTML)
+
+
+if __name__ == '__main__':
+    unittest.main()
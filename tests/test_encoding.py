@@ -0,0 +1,53 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.encoding import clear_host_encodings, declared_charset, get_encoding_stats, meta_charset, page_encoding
+from app.services.samehadaku_scraper import SamehadakuScraper
+
+LATIN1_HTML = '<html><head><meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1"></head><body><h1 class="entry-title">Café</h1></body></html>'.encode("latin-1")
+UTF8_HTML = '<!DOCTYPE html><html><head><meta charset="UTF-8"></head><body><h1 class="entry-title">Café</h1></body></html>'.encode("utf-8")
+
+
+class TestPageEncoding(unittest.TestCase):
+    def setUp(self):
+        clear_host_encodings()
+        self.addCleanup(clear_host_encodings)
+    
+    def test_declared_and_meta_charset(self):
+        self.assertEqual(declared_charset('text/html; charset="UTF-8"'), "utf-8")
+        self.assertIsNone(declared_charset("text/html"))
+        self.assertIsNone(declared_charset("text/html; charset=bukan-encoding"))
+        self.assertEqual(meta_charset(UTF8_HTML), "utf-8")
+        self.assertEqual(meta_charset(LATIN1_HTML), "iso8859-1")
+        # Hanya 1024 byte pertama yang diperiksa
+        self.assertIsNone(meta_charset(b" " * 2000 + UTF8_HTML))
+    
+    def test_encoding_remembered_per_host(self):
+        self.assertEqual(page_encoding("https://a.example/x/", "text/html; charset=windows-1252"), "cp1252")
+        before = get_encoding_stats()["host"]
+        # Header tanpa charset dan tanpa <meta>: pakai encoding host
+        self.assertEqual(page_encoding("https://a.example/y/", "text/html", b"<html></html>"), "cp1252")
+        self.assertEqual(get_encoding_stats()["host"], before + 1)
+        self.assertIsNone(page_encoding("https://b.example/", "text/html", b"<html></html>"))
+        self.assertEqual(page_encoding("https://b.example/", "text/html", UTF8_HTML), "utf-8")
+        self.assertEqual(get_encoding_stats()["hosts"], {"a.example": "cp1252", "b.example": "utf-8"})
+    
+    def test_soup_uses_meta_charset_without_header(self):
+        scraper = SamehadakuScraper()
+        # requests mendekode text/html tanpa charset sebagai ISO-8859-1; soup harus tetap benar
+        response = mock.Mock(status_code=200, content=UTF8_HTML, headers={"Content-Type": "text/html"}, raise_for_status=lambda: None)
+        session = mock.Mock(get=mock.Mock(return_value=response))
+        with mock.patch("app.services.scraper.get_sync_session", return_value=session):
+            soup = scraper.get_soup("https://encoding.example/anime/cafe/")
+        
+        self.assertEqual(soup.select_one("h1.entry-title").text, "Café")
+        self.assertEqual(get_encoding_stats()["hosts"]["encoding.example"], "utf-8")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import sys
+import os
+import contextvars
+import threading
+import unittest
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import executors
+from app.core.executors import InstrumentedExecutor
+
+marker = contextvars.ContextVar("marker", default=None)
+
+
+class TestNamedExecutors(unittest.TestCase):
+    def setUp(self):
+        executors.shutdown_executors()
+        self.addCleanup(executors.shutdown_executors)
+    
+    def test_named_executors_report_stats(self):
+        executors.start_executors()
+        executors.submit(executors.CPU, sum, [1, 2, 3]).result()
+        
+        stats = executors.get_executor_stats()
+        self.assertEqual(set(stats), {"blocking", "io", "cpu"})
+        self.assertEqual(stats["cpu"]["completed"], 1)
+        self.assertEqual(stats["cpu"]["active"], 0)
+        self.assertEqual(stats["cpu"]["queued"], 0)
+        self.assertEqual(stats["io"]["max_workers"], executors.settings.IO_EXECUTOR_WORKERS)
+    
+    def test_saturated_executor_runs_task_in_caller(self):
+        executor = InstrumentedExecutor("test", 1, caller_runs=True)
+        self.addCleanup(executor.shutdown)
+        release = threading.Event()
+        busy = executor.submit(release.wait, 5)
+        
+        inline = executor.submit(threading.get_ident)
+        
+        self.assertEqual(inline.result(), threading.get_ident())
+        self.assertEqual(executor.stats()["caller_runs"], 1)
+        self.assertEqual(executor.stats()["active"] + executor.stats()["queued"], 1)
+        release.set()
+        self.assertTrue(busy.result(timeout=5))
+    
+    def test_cancelled_queued_futures_release_their_slot(self):
+        executor = InstrumentedExecutor("test", 1, caller_runs=False)
+        self.addCleanup(executor.shutdown)
+        release = threading.Event()
+        busy = executor.submit(release.wait, 5)
+        queued = [executor.submit(threading.get_ident) for _ in range(3)]
+        
+        self.assertTrue(all(future.cancel() for future in queued))
+        self.assertEqual(executor.stats()["queued"], 0)
+        release.set()
+        self.assertTrue(busy.result(timeout=5))
+        
+        executor.caller_runs = True
+        admitted = executor.submit(threading.get_ident)
+        
+        self.assertNotEqual(admitted.result(timeout=5), threading.get_ident())
+        self.assertEqual(executor.stats()["caller_runs"], 0)
+    
+    def test_nested_fan_out_does_not_deadlock(self):
+        executor = InstrumentedExecutor("test", 2, caller_runs=True)
+        self.addCleanup(executor.shutdown)
+        
+        def outer(i):
+            inner = [executor.submit(lambda j=j: i * 10 + j) for j in range(3)]
+            return [future.result(timeout=5) for future in inner]
+        
+        futures = [executor.submit(outer, i) for i in range(4)]
+        
+        self.assertEqual([future.result(timeout=5) for future in futures], [[i * 10 + j for j in range(3)] for i in range(4)])
+    
+    def test_submit_copies_caller_context(self):
+        token = marker.set("request-1")
+        try:
+            future = executors.submit(executors.IO, marker.get)
+        finally:
+            marker.reset(token)
+        
+        self.assertEqual(future.result(timeout=5), "request-1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import hedging
+from app.core.hedging import HedgePolicy
+from app.services.samehadaku_scraper import SamehadakuScraper
+
+
+class TestHedging(unittest.TestCase):
+    def make_policy(self, budget_ratio=1.0, samples=0.05):
+        policy = HedgePolicy("test", percentile=0.9, budget_ratio=budget_ratio, min_samples=5)
+        for _ in range(10):
+            policy.observe(samples)
+        return policy
+    
+    def test_no_hedge_without_enough_samples(self):
+        policy = HedgePolicy("test", percentile=0.9, budget_ratio=1.0, min_samples=5)
+        calls = []
+        
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "ok"
+        
+        self.assertIsNone(policy.delay())
+        self.assertEqual(asyncio.run(policy.arun(call)), "ok")
+        self.assertEqual(len(calls), 1)
+    
+    def test_slow_async_call_is_hedged_and_loser_cancelled(self):
+        policy = self.make_policy()
+        cancelled = []
+        attempt = []
+        
+        async def call():
+            attempt.append(1)
+            # Request pertama tersangkut, hedge selesai cepat
+            delay = 1.0 if len(attempt) == 1 else 0.01
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+            return len(attempt)
+        
+        start = time.perf_counter()
+        result = asyncio.run(policy.arun(call))
+        
+        self.assertEqual(result, 2)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(cancelled, [1])
+        stats = policy.stats()
+        self.assertEqual(stats["hedges"], 1)
+        self.assertEqual(stats["hedge_wins"], 1)
+    
+    def test_fast_call_is_not_hedged(self):
+        policy = self.make_policy(samples=0.5)
+        
+        async def call():
+            return "ok"
+        
+        self.assertEqual(asyncio.run(policy.arun(call)), "ok")
+        self.assertEqual(policy.stats()["hedges"], 0)
+    
+    def test_budget_caps_hedges(self):
+        policy = self.make_policy(budget_ratio=0.05, samples=0.01)
+        
+        async def call():
+            await asyncio.sleep(0.03)
+            return "ok"
+        
+        async def run():
+            for _ in range(40):
+                await policy.arun(call)
+        
+        asyncio.run(run())
+        
+        stats = policy.stats()
+        self.assertEqual(stats["calls"], 40)
+        self.assertLessEqual(stats["hedges"], 2)
+        self.assertGreater(stats["budget_exhausted"], 0)
+    
+    def test_sync_hedge_returns_first_success(self):
+        policy = self.make_policy()
+        lock = threading.Lock()
+        attempt = []
+        
+        def call():
+            with lock:
+                attempt.append(1)
+                number = len(attempt)
+            time.sleep(1.0 if number == 1 else 0.01)
+            return number
+        
+        start = time.perf_counter()
+        
+        self.assertEqual(policy.run(call), 2)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(policy.stats()["hedge_wins"], 1)
+    
+    def test_failed_hedge_falls_back_to_primary(self):
+        policy = self.make_policy()
+        attempt = []
+        
+        async def call():
+            attempt.append(1)
+            if len(attempt) == 2:
+                raise RuntimeError("hedge gagal")
+            await asyncio.sleep(0.2)
+            return "primary"
+        
+        self.assertEqual(asyncio.run(policy.arun(call)), "primary")
+
+    def test_slow_post_is_hedged(self):
+        policy = self.make_policy()
+        lock = threading.Lock()
+        attempt = []
+        
+        def post(url, timeout=None, data=None, headers=None):
+            with lock:
+                attempt.append(1)
+                number = len(attempt)
+            # POST pertama tersangkut, hedge menjawab cepat
+            time.sleep(1.0 if number == 1 else 0.01)
+            return mock.Mock(status_code=200, text=f"embed {number}", headers={}, raise_for_status=lambda: None)
+        
+        scraper = SamehadakuScraper()
+        session = mock.Mock(post=post)
+        with mock.patch.dict(hedging._policies, {"test_post": policy}), mock.patch("app.services.scraper.get_sync_session", return_value=session):
+            start = time.perf_counter()
+            html = scraper.post_html(scraper.player_ajax_url, {"nume": "1"}, hedge="test_post")
+        
+        self.assertEqual(html, "embed 2")
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(policy.stats()["hedge_wins"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
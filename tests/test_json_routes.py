@@ -0,0 +1,102 @@
+import sys
+import os
+import asyncio
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.json_routes import get_json_route_stats, reset_json_routes
+from tests.test_samehadaku_scraper import FakeSamehadakuScraper
+
+LATEST_JSON = [
+    {
+        "title": {"rendered": "Foo &#8211; Episode 3"},
+        "url": "https://example.com/foo-episode-3/",
+        "east_episode": "3",
+        "author_name": "admin",
+        "east_time": "1 day",
+        "featured_img_src": "https://example.com/foo.jpg",
+    }
+]
+
+SEARCH_JSON = {
+    "data": [
+        {
+            "title": "Bar",
+            "url": "https://example.com/anime/bar/",
+            "east_type": "TV",
+            "east_score": 8.1,
+            "genre": "Action, Comedy",
+            "featured_img_src": "https://example.com/bar.jpg",
+        }
+    ]
+}
+
+
+class TestJsonFastPath(unittest.TestCase):
+    def setUp(self):
+        reset_json_routes()
+        self.addCleanup(reset_json_routes)
+        self.scraper = FakeSamehadakuScraper()
+        self.scraper.json_routes = {"anime_terbaru": "/latest?page={page}", "search": "/search?q={query}"}
+        self.json_urls = []
+    
+    def serve(self, payload):
+        def get_json(url, headers=None, hedge=None):
+            self.json_urls.append(url)
+            return payload
+        return mock.patch.object(self.scraper, "get_json", side_effect=get_json)
+    
+    def test_json_route_skips_html(self):
+        with self.serve(LATEST_JSON), mock.patch.object(self.scraper, "get_soup", side_effect=AssertionError("HTML tidak boleh diambil")):
+            result = self.scraper.get_anime_terbaru(2)
+        
+        self.assertEqual(self.json_urls, [f"{self.scraper.api_url}/latest?page=2"])
+        self.assertEqual(result, [{
+            "judul": "Foo – Episode 3",
+            "url": "https://example.com/foo-episode-3/",
+            "anime_slug": "foo",
+            "episode": "3",
+            "uploader": "admin",
+            "rilis": "1 day",
+            "cover": "https://example.com/foo.jpg",
+        }])
+        self.assertEqual(get_json_route_stats()["samehadaku_anime_terbaru"]["json"], 1)
+    
+    def test_missing_fields_fall_back_to_html_and_disable_route(self):
+        incomplete = [{"title": "Foo", "url": "https://example.com/foo-episode-3/"}]
+        with self.serve(incomplete):
+            first = self.scraper.get_anime_terbaru()
+            second = self.scraper.get_anime_terbaru()
+        
+        # Hasil dari HOME_HTML palsu, route hanya dicoba sekali
+        self.assertEqual(first, second)
+        self.assertEqual(first[0]["anime_slug"], "foo")
+        self.assertEqual(len(self.json_urls), 1)
+        self.assertEqual(get_json_route_stats()["samehadaku_anime_terbaru"], {"json": 0, "html": 1, "failures": 1})
+    
+    def test_unconfigured_page_type_scrapes_html(self):
+        with self.serve(LATEST_JSON):
+            self.scraper.get_movie_list()
+        
+        self.assertEqual(self.json_urls, [])
+    
+    def test_async_search_from_json(self):
+        async def aget_json(url, headers=None, hedge=None):
+            self.json_urls.append(url)
+            return SEARCH_JSON
+        
+        with mock.patch.object(self.scraper, "aget_json", side_effect=aget_json):
+            result = asyncio.run(self.scraper.asearch("bar baz"))
+        
+        self.assertEqual(self.json_urls, [f"{self.scraper.api_url}/search?q=bar+baz"])
+        self.assertEqual(result[0]["anime_slug"], "bar")
+        self.assertEqual(result[0]["skor"], "8.1")
+        self.assertEqual(result[0]["genre"], ["Action", "Comedy"])
+        self.assertEqual(result[0]["status"], "N/A")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+
+import httpx
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.limiter import AdaptiveLimiter, get_host_limiter, is_overload_error
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def make_limiter(self, initial=2, **kwargs):
+        options = {"min_limit": 1, "max_limit": 10, "latency_target": 1.0, "decrease_interval": 0.0}
+        options.update(kwargs)
+        return AdaptiveLimiter(initial=initial, **options)
+    
+    def test_async_calls_capped_at_window(self):
+        limiter = self.make_limiter(initial=2, max_limit=2)
+        running = []
+        peak = []
+        
+        async def call():
+            async with limiter.aslot():
+                running.append(1)
+                peak.append(len(running))
+                await asyncio.sleep(0.02)
+                running.pop()
+        
+        async def run():
+            await asyncio.gather(*(call() for _ in range(6)))
+        
+        asyncio.run(run())
+        
+        self.assertEqual(max(peak), 2)
+        stats = limiter.stats()
+        self.assertEqual(stats["acquired"], 6)
+        self.assertEqual(stats["queued"], 4)
+        self.assertGreater(stats["wait_max"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+    
+    def test_threads_capped_at_window(self):
+        # Window dikunci di 2: setiap sukses cepat menambah window, sementara thread lain masih menunggu
+        limiter = self.make_limiter(initial=2, max_limit=2)
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+        
+        def call():
+            with limiter.slot():
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.02)
+                with lock:
+                    running[0] -= 1
+        
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+    
+    def test_additive_increase_and_multiplicative_decrease(self):
+        limiter = self.make_limiter(initial=4)
+        for _ in range(4):
+            limiter.record(0.1)
+        self.assertAlmostEqual(limiter.limit, 5.0, delta=0.2)
+        
+        limiter.record(0.1, failed=True)
+        self.assertAlmostEqual(limiter.limit, 2.5, delta=0.1)
+        
+        # Request lambat juga dianggap sinyal overload
+        limiter.record(5.0)
+        self.assertAlmostEqual(limiter.limit, 1.25, delta=0.1)
+        self.assertEqual(limiter.stats()["decreases"], 2)
+    
+    def test_decrease_at_most_once_per_interval(self):
+        limiter = self.make_limiter(initial=8, decrease_interval=60.0)
+        for _ in range(5):
+            limiter.record(0.1, failed=True)
+        
+        self.assertEqual(limiter.limit, 4.0)
+        self.assertEqual(limiter.stats()["errors"], 5)
+    
+    def test_window_never_below_min(self):
+        limiter = self.make_limiter(initial=1, min_limit=1)
+        limiter.record(0.1, failed=True)
+        
+        self.assertEqual(limiter.limit, 1.0)
+    
+    def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = self.make_limiter(initial=1)
+        
+        async def run():
+            await limiter.aacquire()
+            waiter = asyncio.ensure_future(limiter.aacquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            limiter.release()
+            # Slot harus bisa diambil lagi
+            await asyncio.wait_for(limiter.aacquire(), timeout=1)
+            limiter.release()
+        
+        asyncio.run(run())
+        
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+        self.assertEqual(limiter.stats()["waiting"], 0)
+    
+    def test_overload_classification(self):
+        request = httpx.Request("GET", "https://example.com/")
+        
+        def status_error(code):
+            return httpx.HTTPStatusError(str(code), request=request, response=httpx.Response(code, request=request))
+        
+        self.assertTrue(is_overload_error(status_error(503)))
+        self.assertTrue(is_overload_error(status_error(429)))
+        self.assertFalse(is_overload_error(status_error(404)))
+        self.assertTrue(is_overload_error(httpx.ConnectTimeout("timeout", request=request)))
+        self.assertFalse(is_overload_error(asyncio.CancelledError()))
+    
+    def test_one_limiter_per_host(self):
+        first = get_host_limiter("https://Example.org/anime/foo/")
+        
+        self.assertIs(first, get_host_limiter("https://example.org/episode/bar/"))
+        self.assertIsNot(first, get_host_limiter("https://other.example.org/"))
+
+
+if __name__ == '__main__':
+    unittest.main()
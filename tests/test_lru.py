@@ -0,0 +1,86 @@
+import sys
+import os
+import time
+import unittest
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import lru
+from app.core.lru import BoundedCache, estimate_size
+
+
+class TestBoundedCache(unittest.TestCase):
+    def entry(self, data, ttl=None):
+        now = time.time()
+        entry = {"timestamp": now, "data": data}
+        if ttl is not None:
+            entry["expires_at"] = now + ttl
+        return entry
+    
+    def test_entry_budget_evicts_least_recently_used(self):
+        cache = BoundedCache(max_entries=2, max_bytes=10 ** 9)
+        cache["a"] = self.entry(1)
+        cache["b"] = self.entry(2)
+        # Akses "a" agar "b" menjadi yang paling lama tidak dipakai
+        self.assertEqual(cache["a"]["data"], 1)
+        cache["c"] = self.entry(3)
+        
+        self.assertEqual(sorted(cache.keys()), ["a", "c"])
+        self.assertEqual(cache.stats()["evictions"], 1)
+    
+    def test_byte_budget_evicts_until_under_budget(self):
+        big = ["x" * 1000 for _ in range(10)]
+        budget = estimate_size(big) * 2 + 1024
+        cache = BoundedCache(max_entries=100, max_bytes=budget)
+        for key in ("a", "b", "c", "d"):
+            cache[key] = self.entry(list(big))
+        
+        self.assertLessEqual(cache.total_bytes, budget)
+        self.assertEqual(cache.keys(), ["c", "d"])
+    
+    def test_expired_entries_are_evicted_eagerly(self):
+        cache = BoundedCache(max_entries=10, max_bytes=10 ** 9)
+        cache["old"] = self.entry({"x": 1}, ttl=-1)
+        cache["fresh"] = self.entry({"x": 2}, ttl=60)
+        
+        self.assertNotIn("old", cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()["expirations"], 1)
+        self.assertEqual(cache.total_bytes, cache.size_of("fresh"))
+    
+    def test_size_estimated_once_on_insert(self):
+        cache = BoundedCache(max_entries=10, max_bytes=10 ** 9)
+        calls = []
+        original = lru.estimate_size
+        
+        def counting_estimate(obj):
+            calls.append(obj)
+            return original(obj)
+        
+        lru.estimate_size = counting_estimate
+        try:
+            cache["home_data"] = self.entry({"top10": list(range(10))})
+            for _ in range(5):
+                cache.get("home_data")
+            cache.size_of("home_data")
+            cache.stats()
+        finally:
+            lru.estimate_size = original
+        
+        self.assertEqual(len(calls), 1)
+        self.assertGreater(cache.size_of("home_data"), 0)
+    
+    def test_replace_and_pop_keep_byte_total_consistent(self):
+        cache = BoundedCache(max_entries=10, max_bytes=10 ** 9)
+        cache["a"] = self.entry("x" * 100)
+        cache["a"] = self.entry("y" * 10)
+        self.assertEqual(cache.total_bytes, cache.size_of("a"))
+        
+        cache.pop("a")
+        self.assertEqual(cache.total_bytes, 0)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+import requests
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.mirrors import MirrorPool
+from app.services.samehadaku_scraper import SamehadakuScraper
+
+
+class FakeMirrors:
+    """
+    Upstream serving the same page on several hosts, some of them down.
+    """
+    def __init__(self, down=()):
+        self.down = set(down)
+        self.requests = []
+    
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(url)
+        host = url.split("/")[2]
+        if host in self.down:
+            raise requests.exceptions.ConnectionError(f"{host} down")
+        body = f'<a href="https://{host}/anime/frieren/">Frieren</a>'
+        return mock.Mock(status_code=200, text=body, headers={}, raise_for_status=lambda: None)
+
+
+class TestMirrorPool(unittest.TestCase):
+    def make_pool(self, canonical="https://main.example", mirrors=("https://m1.example", "https://m2.example")):
+        return MirrorPool(canonical, list(mirrors), alpha=0.5, error_threshold=0.5, cooldown=60.0)
+    
+    def test_ranked_by_latency_ewma(self):
+        pool = self.make_pool()
+        # Tanpa data: urutan konfigurasi, canonical dulu
+        self.assertEqual(pool.ranked(), ["https://main.example", "https://m1.example", "https://m2.example"])
+        
+        pool.record("https://main.example", 0.9)
+        pool.record("https://m1.example", 0.2)
+        pool.record("https://m2.example", 0.5)
+        self.assertEqual(pool.ranked(), ["https://m1.example", "https://m2.example", "https://main.example"])
+        
+        # Mirror yang gagal berturut-turut turun ke belakang sampai cooldown lewat
+        pool.record("https://m1.example", 0.2, failed=True)
+        pool.record("https://m1.example", 0.2, failed=True)
+        self.assertEqual(pool.ranked()[-1], "https://m1.example")
+        self.assertFalse(pool.stats()["m1.example"]["healthy"])
+    
+    def test_canonicalize_links(self):
+        pool = self.make_pool()
+        html = '<a href="https://m1.example/anime/x/">x</a> <img src="//m2.example/a.jpg"> https://notm1.example/ https://m1.example.org/'
+        self.assertEqual(
+            pool.canonicalize(html),
+            '<a href="https://main.example/anime/x/">x</a> <img src="//main.example/a.jpg"> https://notm1.example/ https://m1.example.org/',
+        )
+        self.assertEqual(pool.canonicalize('{"url": "https:\\/\\/M2.example\\/anime\\/x\\/"}'), '{"url": "https:\\/\\/main.example\\/anime\\/x\\/"}')
+        self.assertEqual(pool.to_mirror("https://m1.example/anime/x/?page=2", "https://m2.example"), "https://m2.example/anime/x/?page=2")
+    
+    def test_scraper_fails_over_to_next_mirror(self):
+        upstream = FakeMirrors(down={"down.mirror.test"})
+        scraper = SamehadakuScraper()
+        scraper.base_url = "https://down.mirror.test"
+        scraper.mirrors = MirrorPool("https://down.mirror.test", ["https://up.mirror.test"], alpha=0.5, error_threshold=0.5, cooldown=60.0)
+        
+        with mock.patch("app.services.scraper.get_sync_session", return_value=upstream):
+            html = scraper.get_html("https://down.mirror.test/anime/frieren/")
+        
+        self.assertEqual(upstream.requests[:2], ["https://down.mirror.test/anime/frieren/", "https://up.mirror.test/anime/frieren/"])
+        # Link di body mengarah ke host canonical, bukan mirror yang menjawab
+        self.assertEqual(html, '<a href="https://down.mirror.test/anime/frieren/">Frieren</a>')
+        self.assertEqual(scraper.mirrors.ranked()[0], "https://up.mirror.test")
+        
+        stats = scraper.mirrors.stats()
+        self.assertEqual(stats["down.mirror.test"]["failures"], 1)
+        self.assertEqual(stats["up.mirror.test"]["failures"], 0)
+    
+    def test_single_host_not_rewritten(self):
+        scraper = SamehadakuScraper()
+        self.assertEqual(scraper._route(f"{scraper.base_url}/anime/x/"), [f"{scraper.base_url}/anime/x/"])
+        self.assertEqual(scraper.player_ajax_url, f"{scraper.base_url}/wp-admin/admin-ajax.php")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import sys
+import os
+import gzip
+import json
+import unittest
+from unittest import mock
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import home
+from app.core import cache as cache_module
+from app.core import response_cache
+from app.core.cache import set_cache_backend
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.deadline import DeadlineExceeded
+from app.main import app
+from app.services.scraper_factory import ScraperFactory
+from tests.test_samehadaku_scraper import FakeSamehadakuScraper
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+        response_cache._responses.clear()
+        patcher = mock.patch.object(ScraperFactory, "get_default_scraper", return_value=FakeSamehadakuScraper())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(app)
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        response_cache._responses.clear()
+        set_cache_backend(None)
+    
+    def test_hit_skips_validation_and_serves_same_bytes(self):
+        with mock.patch.object(home, "validate_home_data", wraps=home.validate_home_data) as validate:
+            first = self.client.get("/api/v1/home/")
+            second = self.client.get("/api/v1/home/")
+        
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(validate.call_count, 1)
+        self.assertIn("confidence_score", first.json())
+        self.assertEqual(first.headers["etag"], second.headers["etag"])
+    
+    def test_stale_hit_reuses_encoded_body(self):
+        first = self.client.get("/api/v1/home/")
+        # Data mentah masuk grace window: response tidak lagi segar, entry mentah belum berubah
+        raw = cache_module.cache["home_data"]
+        cache_module.cache["home_data"] = {**raw, "timestamp": raw["timestamp"] - cache_module.get_cache_policy("home_data").ttl - 1}
+        stored = response_cache._responses["home_data"]
+        response_cache._responses["home_data"] = {**stored, "timestamp": stored["timestamp"] - cache_module.get_cache_policy("home_data").ttl - 1, "fresh_until": 0}
+        reused_before = response_cache._stats["reused"]
+        
+        with mock.patch.object(home, "validate_home_data", wraps=home.validate_home_data) as validate:
+            stale = self.client.get("/api/v1/home/")
+        
+        self.assertEqual(stale.content, first.content)
+        self.assertEqual(validate.call_count, 0)
+        self.assertEqual(response_cache._stats["reused"], reused_before + 1)
+    
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get("/api/v1/home/").headers["etag"]
+        
+        response = self.client.get("/api/v1/home/", headers={"If-None-Match": etag})
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["etag"], etag)
+    
+    def test_gzip_variant(self):
+        payload = {"data": ["x" * 100] * 50}
+        cached = response_cache.encode_response(payload)
+        request = mock.Mock(headers={"accept-encoding": "br, gzip;q=0.8"})
+        
+        response = response_cache.to_response(cached, request)
+        
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.body)), payload)
+        
+        identity = response_cache.to_response(cached, mock.Mock(headers={"accept-encoding": "gzip;q=0"}))
+        self.assertNotIn("content-encoding", identity.headers)
+        self.assertEqual(identity.body, cached.body)
+    
+    def test_force_refresh_rebuilds_response(self):
+        self.client.get("/api/v1/home/")
+        
+        with mock.patch.object(home, "validate_home_data", wraps=home.validate_home_data) as validate:
+            self.client.get("/api/v1/home/", params={"force_refresh": True})
+        
+        self.assertEqual(validate.call_count, 1)
+    
+    def test_open_breaker_serves_stale_payload(self):
+        first = self.client.get("/api/v1/home/").json()
+        response_cache._responses.clear()
+        cache_module.cache.pop("home_data")
+        
+        with mock.patch.object(FakeSamehadakuScraper, "aget_home_data", side_effect=CircuitOpenError("example.com home", 30)):
+            stale = self.client.get("/api/v1/home/")
+            # Response stale tidak disimpan, request berikutnya mencoba upstream lagi
+            self.assertNotIn("home_data", response_cache._responses)
+        
+        self.assertEqual(stale.status_code, 200)
+        self.assertTrue(stale.json()["stale"])
+        self.assertEqual(stale.json()["top10"], first["top10"])
+    
+    def test_open_breaker_without_fallback_is_503(self):
+        with mock.patch.object(FakeSamehadakuScraper, "aget_home_data", side_effect=CircuitOpenError("example.com home", 30)):
+            response = self.client.get("/api/v1/home/")
+        
+        self.assertEqual(response.status_code, 503)
+    
+    def test_deadline_without_fallback_is_504(self):
+        with mock.patch.object(FakeSamehadakuScraper, "aget_home_data", side_effect=DeadlineExceeded("GET https://example.com/")):
+            response = self.client.get("/api/v1/home/")
+        
+        self.assertEqual(response.status_code, 504)
+    
+    def test_errors_are_not_cached(self):
+        with mock.patch.object(FakeSamehadakuScraper, "asearch", return_value=[]):
+            self.assertEqual(self.client.get("/api/v1/search/", params={"query": "zzz"}).status_code, 500)
+        
+        self.assertIsNone(response_cache._responses.get("search_zzz"))
+
+
+if __name__ == '__main__':
+    unittest.main()
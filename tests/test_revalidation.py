@@ -0,0 +1,182 @@
+import sys
+import os
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import httpx
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import cache as cache_module
+from app.core.cache import aget_from_cache_or_fetch, set_cache_backend
+from app.core.revalidation import NotModified, collecting_validators, get_revalidation_stats, revalidating
+from app.services.samehadaku_scraper import SamehadakuScraper
+
+DETAIL_HTML = b"""<html><body>
+<div class="infoanime"><h2 class="entry-title">Frieren</h2><div class="desc"><div class="entry-content"><p>Sinopsis</p></div></div></div>
+<div class="spe"><span><b>Status</b> Ongoing</span></div>
+<div class="lstepsiode"><ul><li><span class="lchx"><a href="https://example.com/frieren-episode-1/">Frieren Episode 1</a></span></li></ul></div>
+<div class="rand-animesu"><ul></ul></div>
+</body></html>"""
+
+
+class FakeUpstream:
+    """
+    Upstream that answers conditional GETs with 304 while the page is unchanged.
+    """
+    def __init__(self, etag='"v1"'):
+        self.etag = etag
+        self.requests = []
+    
+    def get(self, url, headers=None, timeout=None):
+        headers = headers or {}
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == self.etag:
+            return mock.Mock(status_code=304, text="", headers={"ETag": self.etag}, raise_for_status=lambda: None)
+        return mock.Mock(status_code=200, text=f"<html>{self.etag}</html>", headers={"ETag": self.etag}, raise_for_status=lambda: None)
+
+
+class TestRevalidation(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        set_cache_backend(None)
+        cache_module.invalidate_cache()
+        self.upstream = FakeUpstream()
+        patcher = mock.patch("app.services.scraper.get_sync_session", return_value=self.upstream)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scraper = SamehadakuScraper()
+        self.parses = 0
+        self.broken = False
+    
+    def tearDown(self):
+        cache_module.invalidate_cache()
+        set_cache_backend(None)
+    
+    def fetch(self, url):
+        if self.broken:
+            return {}
+        html = self.scraper.get_html(url)
+        self.parses += 1
+        return {"html": html}
+    
+    def age(self, key, seconds):
+        entry = cache_module.cache[key]
+        cache_module.cache[key] = {**entry, "timestamp": entry["timestamp"] - seconds}
+    
+    async def wait_for_refreshes(self):
+        if cache_module._refresh_tasks:
+            await asyncio.gather(*cache_module._refresh_tasks)
+    
+    def test_conditional_get_raises_not_modified(self):
+        url = "https://example.com/anime/frieren/"
+        with collecting_validators() as validators:
+            self.scraper.get_html(url)
+        self.assertNotIn("If-None-Match", self.upstream.requests[-1])
+        self.assertEqual(validators, {url: {"etag": '"v1"', "last_modified": None}})
+        before = get_revalidation_stats()["not_modified"]
+        
+        with revalidating(validators):
+            with self.assertRaises(NotModified):
+                self.scraper.get_html(url)
+        
+        self.assertEqual(self.upstream.requests[-1]["If-None-Match"], '"v1"')
+        self.assertEqual(get_revalidation_stats()["not_modified"], before + 1)
+    
+    async def test_unchanged_page_extends_ttl_without_parsing(self):
+        key = "anime_detail_frieren"
+        url = "https://example.com/anime/frieren/"
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        self.age(key, 20)
+        not_modified_before = cache_module._swr_stats["not_modified"]
+        
+        self.assertEqual(await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60), {"html": '<html>"v1"</html>'})
+        await self.wait_for_refreshes()
+        
+        self.assertEqual(self.parses, 1)
+        self.assertEqual(len(self.upstream.requests), 2)
+        self.assertLess(time.time() - cache_module.cache[key]["timestamp"], 5)
+        self.assertEqual(cache_module._swr_stats["not_modified"], not_modified_before + 1)
+    
+    async def test_failed_refresh_keeps_entry_validators(self):
+        key = "anime_detail_frieren"
+        url = "https://example.com/anime/frieren/"
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        self.assertEqual(cache_module.cache[key]["validators"], {url: {"etag": '"v1"', "last_modified": None}})
+        
+        # Halaman berubah tapi hasil parse kosong: entry lama tetap disimpan bersama validators-nya
+        self.upstream.etag = '"v2"'
+        self.broken = True
+        self.age(key, 20)
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        await self.wait_for_refreshes()
+        self.assertEqual(cache_module.cache[key]["validators"][url]["etag"], '"v1"')
+        
+        self.broken = False
+        self.age(key, 20)
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        await self.wait_for_refreshes()
+        
+        self.assertEqual(self.upstream.requests[-1]["If-None-Match"], '"v1"')
+        self.assertEqual(cache_module.cache[key]["data"], {"html": '<html>"v2"</html>'})
+        self.assertEqual(cache_module.cache[key]["validators"][url]["etag"], '"v2"')
+    
+    async def test_scraper_refresh_extends_ttl_on_304(self):
+        key = "anime_detail_frieren"
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, headers={"ETag": '"v1"', "Content-Type": "text/html; charset=UTF-8"}, content=DETAIL_HTML)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.addAsyncCleanup(client.aclose)
+        with mock.patch("app.services.scraper.get_async_client", return_value=client):
+            first = await aget_from_cache_or_fetch(key, self.scraper.aget_anime_details, "frieren", ttl=10, grace=60)
+            self.assertTrue(first)
+            self.age(key, 20)
+            not_modified_before = cache_module._swr_stats["not_modified"]
+            errors_before = cache_module._swr_stats["refresh_errors"]
+            
+            await aget_from_cache_or_fetch(key, self.scraper.aget_anime_details, "frieren", ttl=10, grace=60)
+            await self.wait_for_refreshes()
+        
+        self.assertEqual(requests[-1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(cache_module.cache[key]["data"], first)
+        self.assertLess(time.time() - cache_module.cache[key]["timestamp"], 5)
+        self.assertEqual(cache_module._swr_stats["not_modified"], not_modified_before + 1)
+        self.assertEqual(cache_module._swr_stats["refresh_errors"], errors_before)
+    
+    async def test_changed_page_is_parsed_again(self):
+        key = "movie_list_page_3"
+        url = "https://example.com/anime-movie/page/3/"
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        self.age(key, 20)
+        self.upstream.etag = '"v2"'
+        
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        await self.wait_for_refreshes()
+        
+        self.assertEqual(self.parses, 2)
+        self.assertEqual(cache_module.cache[key]["data"], {"html": '<html>"v2"</html>'})
+    
+    async def test_multi_page_family_not_revalidated(self):
+        key = "home_data"
+        url = "https://example.com/"
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        self.age(key, 20)
+        
+        await aget_from_cache_or_fetch(key, self.fetch, url, ttl=10, grace=60)
+        await self.wait_for_refreshes()
+        
+        self.assertNotIn("If-None-Match", self.upstream.requests[-1])
+        self.assertNotIn("validators", cache_module.cache[key])
+        self.assertEqual(self.parses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,304 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core import cache as cache_module
+from app.core import executors
+from app.core.bloom import is_known_missing, known_missing
+from app.core.cache import aget_from_cache_or_fetch, cache, invalidate_cache, set_cache_backend
+from app.core.config import settings
+from app.core.deadline import upstream_timeout
+from app.services.samehadaku_scraper import SamehadakuScraper
+
+HOME_HTML = """
+<html><body>
+<div class="post-show"><ul><li>
+  <h2 class="entry-title"><a href="https://example.com/anime/foo/">Foo</a></h2>
+  <img src="https://example.com/foo.jpg">
+  <div class="dtla"><span>Episode 3</span><span>admin</span><span>Released on: 1 day</span></div>
+</li></ul></div>
+<div class="topten-animesu"><ul><li>
+  <a class="series" href="https://example.com/anime/bar/">8.1\n\nTOP1\nBar</a>
+  <img src="https://example.com/bar.jpg">
+</li></ul></div>
+</body></html>
+"""
+
+EPISODE_HTML = """
+<html><body>
+<h1 class="entry-title">Foo Episode 3</h1>
+<div id="server">
+  <div class="east_player_option" data-post="42" data-nume="1"><span>Server B</span></div>
+  <div class="east_player_option" data-post="42" data-nume="2"><span>Server A</span></div>
+</div>
+</body></html>
+"""
+
+EMBED_HTML = '<iframe src="https://pixeldrain.com/u/abc123"></iframe>'
+
+SCHEDULE_JSON = [{"title": "Foo", "url": "https://example.com/anime/foo/", "genre": "Action, Comedy"}]
+
+
+class FakeSamehadakuScraper(SamehadakuScraper):
+    """SamehadakuScraper dengan transport palsu untuk pengujian tanpa jaringan."""
+    def get_html(self, url, headers=None, hedge=None):
+        return EPISODE_HTML if "episode" in url else HOME_HTML
+    
+    def get_html_bytes(self, url, headers=None, hedge=None):
+        return self.get_html(url, headers, hedge).encode("utf-8"), "utf-8"
+    
+    def get_json(self, url, headers=None, hedge=None):
+        return SCHEDULE_JSON
+    
+    def post_html(self, url, data, headers=None, timeout=None, hedge=None):
+        return EMBED_HTML
+    
+    async def aget_html(self, url, headers=None, hedge=None):
+        return self.get_html(url, headers)
+    
+    async def aget_html_bytes(self, url, headers=None, hedge=None):
+        return (await self.aget_html(url, headers, hedge)).encode("utf-8"), "utf-8"
+    
+    async def aget_json(self, url, headers=None, hedge=None):
+        return self.get_json(url, headers)
+    
+    async def apost_html(self, url, data, headers=None, timeout=None, hedge=None):
+        return self.post_html(url, data, headers, timeout, hedge)
+    
+    @staticmethod
+    def _streams(hedge, sections):
+        # Transport palsu lewat get_html, jadi soup selalu dibangun dari HTML lengkap
+        return False
+
+
+class TestSamehadakuScraper(unittest.TestCase):
+    def setUp(self):
+        self.scraper = FakeSamehadakuScraper()
+        # Link embed di-cache per (post, nume), mulai setiap test dari cache kosong
+        set_cache_backend(None)
+        invalidate_cache()
+    
+    def tearDown(self):
+        invalidate_cache()
+        set_cache_backend(None)
+    
+    def test_home_data_sync_async_parity(self):
+        sync_result = self.scraper.get_home_data()
+        async_result = asyncio.run(self.scraper.aget_home_data())
+        
+        self.assertEqual(sync_result, async_result)
+        self.assertEqual(sync_result["new_eps"][0]["anime_slug"], "foo")
+        self.assertEqual(sync_result["top10"][0]["judul"], "Bar")
+        self.assertEqual(list(sync_result["jadwal_rilis"].keys())[0], "Monday")
+        self.assertEqual(sync_result["jadwal_rilis"]["Monday"][0]["genres"], ["Action", "Comedy"])
+    
+    def test_upstream_404_marks_slug_missing(self):
+        known_missing.clear()
+        request = httpx.Request("GET", "https://example.com/anime/tidak-ada/")
+        not_found = httpx.HTTPStatusError("404", request=request, response=httpx.Response(404, request=request))
+        
+        with mock.patch.object(FakeSamehadakuScraper, "aget_html", side_effect=not_found):
+            self.assertEqual(asyncio.run(self.scraper.aget_anime_details("tidak-ada")), {})
+        
+        self.assertTrue(is_known_missing("anime", "tidak-ada"))
+        known_missing.clear()
+    
+    def test_episode_details_sync_async_parity(self):
+        episode_url = "https://example.com/foo-episode-3/"
+        sync_result = self.scraper.get_episode_details(episode_url)
+        async_result = asyncio.run(self.scraper.aget_episode_details(episode_url))
+        
+        self.assertEqual(sync_result, async_result)
+        self.assertEqual(sync_result["title"], "Foo Episode 3")
+        # Server diurutkan berdasarkan nama dan URL Pixeldrain dikonversi
+        self.assertEqual([s["server_name"] for s in sync_result["streaming_servers"]], ["Server A", "Server B"])
+        self.assertEqual(sync_result["streaming_servers"][0]["streaming_url"], "https://pixeldrain.com/api/file/abc123")
+
+
+    def test_player_ajax_resolved_concurrently_within_deadline(self):
+        def slow_post(url, data, headers=None, timeout=None, hedge=None):
+            # Server B lambat dan melewati deadline
+            time.sleep(1.0 if data["nume"] == "1" else 0.2)
+            return EMBED_HTML
+        
+        async def aslow_post(url, data, headers=None, timeout=None, hedge=None):
+            await asyncio.sleep(1.0 if data["nume"] == "1" else 0.2)
+            return EMBED_HTML
+        
+        episode_url = "https://example.com/foo-episode-3/"
+        with mock.patch.object(settings, "PLAYER_AJAX_DEADLINE", 0.5):
+            # Async dulu: asyncio.run membatalkan request yang tertinggal, thread sync tidak
+            with mock.patch.object(FakeSamehadakuScraper, "apost_html", side_effect=aslow_post):
+                start = time.perf_counter()
+                async_result = asyncio.run(self.scraper.aget_episode_details(episode_url))
+                async_elapsed = time.perf_counter() - start
+            with mock.patch.object(FakeSamehadakuScraper, "post_html", side_effect=slow_post):
+                start = time.perf_counter()
+                sync_result = self.scraper.get_episode_details(episode_url)
+                sync_elapsed = time.perf_counter() - start
+        
+        for result, elapsed in ((sync_result, sync_elapsed), (async_result, async_elapsed)):
+            self.assertEqual([s["server_name"] for s in result["streaming_servers"]], ["Server A"])
+            self.assertLess(elapsed, 0.9)
+    
+    def test_player_ajax_deadline_bounds_inline_servers(self):
+        def slow_post(url, data, headers=None, timeout=None, hedge=None):
+            if data["nume"] == "1":
+                # Seperti request asli: timeout dipotong sisa deadline, Server B tidak menjawab
+                time.sleep(upstream_timeout(timeout))
+                raise requests.exceptions.Timeout("Server B")
+            return EMBED_HTML
+        
+        # Executor io dengan satu thread yang sibuk: semua server dijalankan di thread pemanggil
+        executors.shutdown_executors()
+        self.addCleanup(executors.shutdown_executors)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        with mock.patch.object(settings, "IO_EXECUTOR_WORKERS", 1):
+            executors.submit(executors.IO, release.wait, 5)
+        
+        with mock.patch.object(settings, "PLAYER_AJAX_DEADLINE", 0.5), mock.patch.object(FakeSamehadakuScraper, "post_html", side_effect=slow_post):
+            start = time.perf_counter()
+            result = self.scraper.get_episode_details("https://example.com/foo-episode-3/")
+            elapsed = time.perf_counter() - start
+        
+        self.assertEqual([s["server_name"] for s in result["streaming_servers"]], ["Server A"])
+        self.assertLess(elapsed, 0.9)
+        self.assertGreater(executors.get_executor_stats()["io"]["caller_runs"], 0)
+    
+    def test_player_ajax_keeps_sorted_order(self):
+        async def apost(url, data, headers=None, timeout=None, hedge=None):
+            # Server yang selesai duluan tidak menentukan urutan
+            await asyncio.sleep(0.1 if data["nume"] == "2" else 0.0)
+            return EMBED_HTML
+        
+        with mock.patch.object(FakeSamehadakuScraper, "apost_html", side_effect=apost):
+            result = asyncio.run(self.scraper.aget_episode_details("https://example.com/foo-episode-3/"))
+        
+        self.assertEqual([s["server_name"] for s in result["streaming_servers"]], ["Server A", "Server B"])
+
+    def test_embed_links_cached_per_post_and_nume(self):
+        posts = []
+        
+        async def apost(url, data, headers=None, timeout=None, hedge=None):
+            posts.append(data["nume"])
+            return EMBED_HTML
+        
+        episode_url = "https://example.com/foo-episode-3/"
+        with mock.patch.object(FakeSamehadakuScraper, "apost_html", side_effect=apost):
+            first = asyncio.run(self.scraper.aget_episode_details(episode_url))
+            second = asyncio.run(self.scraper.aget_episode_details(episode_url))
+        
+        self.assertEqual(first, second)
+        self.assertEqual(sorted(posts), ["1", "2"])
+        # Rewrite Pixeldrain disimpan dalam bentuk final
+        self.assertEqual(cache["embed_42_1"]["data"], "https://pixeldrain.com/api/file/abc123")
+    
+    def test_failed_schedule_refresh_keeps_stale_data(self):
+        async def run():
+            first = await aget_from_cache_or_fetch("jadwal_rilis_all", self.scraper.aget_jadwal_rilis, ttl=10, grace=60)
+            entry = cache["jadwal_rilis_all"]
+            cache["jadwal_rilis_all"] = {**entry, "timestamp": entry["timestamp"] - 20}
+            errors_before = cache_module._swr_stats["refresh_errors"]
+            
+            # Semua hari gagal (500): refresh tidak boleh menimpa data stale
+            with mock.patch.object(FakeSamehadakuScraper, "get_json", side_effect=RuntimeError("500")):
+                stale = await aget_from_cache_or_fetch("jadwal_rilis_all", self.scraper.aget_jadwal_rilis, ttl=10, grace=60)
+                await asyncio.gather(*cache_module._refresh_tasks)
+            return first, stale, cache_module._swr_stats["refresh_errors"] - errors_before
+        
+        first, stale, refresh_errors = asyncio.run(run())
+        
+        self.assertEqual(first["Monday"][0]["title"], "Foo")
+        self.assertEqual(stale, first)
+        self.assertEqual(refresh_errors, 1)
+        self.assertEqual(cache["jadwal_rilis_all"]["data"], first)
+        self.assertEqual(cache["last_good:jadwal_rilis_all"]["data"], first)
+        with mock.patch.object(FakeSamehadakuScraper, "get_json", side_effect=RuntimeError("500")):
+            self.assertEqual(self.scraper.get_jadwal_rilis(), {})
+            self.assertEqual(self.scraper.get_home_data()["top10"][0]["judul"], "Bar")
+    
+    def test_failed_embed_is_not_cached(self):
+        with mock.patch.object(FakeSamehadakuScraper, "post_html", side_effect=RuntimeError("boom")):
+            result = self.scraper.get_episode_details("https://example.com/foo-episode-3/")
+        
+        self.assertEqual(result["streaming_servers"], [])
+        self.assertNotIn("embed_42_1", cache)
+        self.assertEqual(len(self.scraper.get_episode_details("https://example.com/foo-episode-3/")["streaming_servers"]), 2)
+
+
+class TestUrlCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.scraper = SamehadakuScraper()
+        self.calls = []
+    
+    def test_concurrent_async_fetches_share_request_and_parse(self):
+        async def handler(request):
+            self.calls.append(str(request.url))
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text=HOME_HTML)
+        
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                with mock.patch("app.services.scraper.get_async_client", return_value=client):
+                    return await asyncio.gather(*(self.scraper.aget_soup("https://example.com/") for _ in range(5)))
+            finally:
+                await client.aclose()
+        
+        soups = asyncio.run(run())
+        
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(soup is soups[0] for soup in soups))
+    
+    def test_concurrent_sync_fetches_share_request(self):
+        def fake_get(url, headers=None, timeout=None):
+            self.calls.append(url)
+            time.sleep(0.05)
+            return mock.Mock(text=HOME_HTML, raise_for_status=lambda: None)
+        
+        session = mock.Mock(get=fake_get)
+        results = []
+        with mock.patch("app.services.scraper.get_sync_session", return_value=session):
+            threads = [
+                threading.Thread(target=lambda: results.append(self.scraper.get_html("https://example.com/")))
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(results, [HOME_HTML] * 5)
+    
+    def test_different_urls_are_not_coalesced(self):
+        async def handler(request):
+            self.calls.append(str(request.url))
+            return httpx.Response(200, text=HOME_HTML)
+        
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                with mock.patch("app.services.scraper.get_async_client", return_value=client):
+                    await asyncio.gather(self.scraper.aget_html("https://example.com/a/"), self.scraper.aget_html("https://example.com/b/"))
+            finally:
+                await client.aclose()
+        
+        asyncio.run(run())
+        
+        self.assertEqual(sorted(self.calls), ["https://example.com/a/", "https://example.com/b/"])
+
+
+if __name__ == '__main__':
+    unittest.main()
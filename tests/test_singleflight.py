@@ -0,0 +1,100 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_tasks_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"home": True}
+        
+        results = await asyncio.gather(*[flight.ado("home_data", fetch) for _ in range(20)])
+        
+        self.assertEqual(results, [{"home": True}] * 20)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats(), {"in_flight": 0, "leaders": 1, "followers": 19})
+    
+    async def test_exception_is_shared_and_key_released(self):
+        flight = SingleFlight()
+        
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+        
+        results = await asyncio.gather(*[flight.ado("k", failing) for _ in range(3)], return_exceptions=True)
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        
+        async def ok():
+            return 1
+        
+        self.assertEqual(await flight.ado("k", ok), 1)
+    
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight = SingleFlight()
+        
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "done"
+        
+        leader = asyncio.create_task(flight.ado("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.ado("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        
+        self.assertEqual(await follower, "done")
+    
+    def test_threads_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        results = []
+        
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return "data"
+        
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", fetch))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, ["data"] * 8)
+        self.assertEqual(len(calls), 1)
+    
+    async def test_task_waits_on_thread_leader(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        
+        def blocking_fetch():
+            started.set()
+            time.sleep(0.1)
+            return "from-thread"
+        
+        async def never_called():
+            raise AssertionError("Follower tidak boleh menjalankan fetch")
+        
+        thread = threading.Thread(target=flight.do, args=("k", blocking_fetch))
+        thread.start()
+        started.wait(1)
+        
+        self.assertEqual(await flight.ado("k", never_called), "from-thread")
+        thread.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
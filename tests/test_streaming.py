@@ -0,0 +1,103 @@
+import sys
+import os
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+from bs4 import BeautifulSoup
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.streaming import StreamingSoup
+from app.services.samehadaku_scraper import SamehadakuScraper
+
+EPISODES = "".join(
+    f'<li><span class="eps"><a href="https://example.com/foo-episode-{i}/">{i}</a></span>'
+    f'<span class="lchx"><a href="https://example.com/foo-episode-{i}/">Foo Episode {i}</a></span>'
+    f'<span class="date">1 Januari 2024</span></li>'
+    for i in range(1, 1201)
+)
+
+DETAIL_HTML = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Foo &ndash; Samehadaku</title></head><body>
+<div class="infoanime"><h2 class="entry-title">Foo Café</h2><img src="https://example.com/foo.jpg">
+<div class="desc"><div class="entry-content"><p>Sinopsis Foo</p></div></div></div>
+<div class="spe"><span><b>Status</b> Ongoing</span></div>
+<div class="lstepsiode"><ul>{EPISODES}</ul></div>
+<div class="rand-animesu"><ul><li><a class="series" href="https://example.com/anime/bar/"><span class="judul">Bar</span></a></li></ul></div>
+<aside id="sidebar">{"<p>widget</p>" * 5000}</aside>
+</body></html>""".encode("utf-8")
+
+
+def chunked(body, size=4096):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestStreamingParse(unittest.TestCase):
+    def test_same_tree_as_beautifulsoup(self):
+        parser = StreamingSoup()
+        for chunk in chunked(DETAIL_HTML, 1000):
+            self.assertFalse(parser.feed(chunk))
+        
+        self.assertEqual(str(parser.close()), str(BeautifulSoup(DETAIL_HTML, "lxml")))
+    
+    def test_stops_after_sections_close(self):
+        parser = StreamingSoup(SamehadakuScraper.ANIME_DETAIL_SECTIONS)
+        fed = 0
+        for chunk in chunked(DETAIL_HTML):
+            fed += len(chunk)
+            if parser.feed(chunk):
+                break
+        soup = parser.close()
+        full = BeautifulSoup(DETAIL_HTML, "lxml")
+        
+        self.assertLess(fed, DETAIL_HTML.index(b"<aside") + 4096)
+        self.assertEqual(str(soup.find("div", class_="lstepsiode")), str(full.find("div", class_="lstepsiode")))
+        self.assertLess(len(soup.select("aside#sidebar p")), 5000)
+    
+    def test_anime_details_stream_matches_full_parse(self):
+        scraper = SamehadakuScraper()
+        read = []
+        
+        def iter_content(chunk_size):
+            for chunk in chunked(DETAIL_HTML, chunk_size):
+                read.append(len(chunk))
+                yield chunk
+        
+        response = mock.Mock(status_code=200, headers={"Content-Type": "text/html; charset=UTF-8"}, raise_for_status=lambda: None, iter_content=iter_content)
+        session = mock.Mock(get=mock.Mock(return_value=response))
+        with mock.patch("app.services.scraper.get_sync_session", return_value=session):
+            streamed = scraper.get_anime_details("foo")
+        
+        self.assertTrue(session.get.call_args.kwargs["stream"])
+        self.assertTrue(response.close.called)
+        self.assertLess(sum(read), len(DETAIL_HTML))
+        expected = scraper._parse_anime_details(BeautifulSoup(DETAIL_HTML, "lxml"), f"{scraper.base_url}/anime/foo/", "foo")
+        self.assertEqual(streamed, expected)
+        self.assertEqual(len(streamed["episode_list"]), 1200)
+    
+    def test_async_stream_matches_sync(self):
+        scraper = SamehadakuScraper()
+        
+        async def handler(request):
+            return httpx.Response(200, headers={"Content-Type": "text/html; charset=UTF-8"}, content=DETAIL_HTML)
+        
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                with mock.patch("app.services.scraper.get_async_client", return_value=client):
+                    return await scraper.aget_anime_details("foo-async")
+            finally:
+                await client.aclose()
+        
+        result = asyncio.run(run())
+        
+        self.assertEqual(result["judul"], "Foo Café")
+        self.assertEqual(len(result["episode_list"]), 1200)
+        self.assertEqual(result["recommendations"][0]["anime_slug"], "bar")
+
+
+if __name__ == '__main__':
+    unittest.main()
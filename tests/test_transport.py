@@ -0,0 +1,94 @@
+import sys
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+# Tambahkan path ke PYTHONPATH agar dapat mengimpor modul dari app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.transport import RECORD, REPLAY, AsyncRecordReplayTransport, FixtureStore, RecordReplayAdapter
+
+PAGE = "<html><body><h1>Frieren</h1></body></html>"
+
+
+def live_upstream(request):
+    if request.method == "POST":
+        return httpx.Response(200, text=f"embed for {request.content.decode()}")
+    return httpx.Response(200, text=PAGE, headers={"ETag": '"v1"', "Content-Type": "text/html; charset=UTF-8"})
+
+
+def requests_session(adapter):
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class TestRecordReplay(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = FixtureStore(self.tmp.name)
+    
+    async def record(self):
+        transport = AsyncRecordReplayTransport(self.store, RECORD, inner=httpx.MockTransport(live_upstream))
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://example.com/anime/frieren/")
+            await client.post("https://example.com/wp-admin/admin-ajax.php", data={"post": "42", "nume": "1"})
+    
+    async def test_async_replay_serves_recorded_exchanges(self):
+        await self.record()
+        
+        transport = AsyncRecordReplayTransport(self.store, REPLAY)
+        async with httpx.AsyncClient(transport=transport) as client:
+            page = await client.get("https://example.com/anime/frieren/")
+            embed = await client.post("https://example.com/wp-admin/admin-ajax.php", data={"post": "42", "nume": "1"})
+            with self.assertRaises(httpx.ConnectError):
+                await client.post("https://example.com/wp-admin/admin-ajax.php", data={"post": "42", "nume": "2"})
+        
+        self.assertEqual(page.text, PAGE)
+        self.assertEqual(page.headers["ETag"], '"v1"')
+        self.assertEqual(embed.text, "embed for post=42&nume=1")
+        self.assertEqual(self.store.stats()["replayed"], 2)
+        self.assertEqual(self.store.stats()["missing"], 1)
+    
+    async def test_sync_replay_without_network(self):
+        await self.record()
+        session = requests_session(RecordReplayAdapter(self.store, REPLAY, latency=0.05))
+        
+        with mock.patch("requests.adapters.HTTPAdapter.send", side_effect=AssertionError("network dipakai")):
+            start = time.monotonic()
+            page = session.get("https://example.com/anime/frieren/")
+            elapsed = time.monotonic() - start
+            embed = session.post("https://example.com/wp-admin/admin-ajax.php", data={"post": "42", "nume": "1"})
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                session.get("https://example.com/anime/unknown/")
+        
+        self.assertEqual(page.status_code, 200)
+        self.assertEqual(page.text, PAGE)
+        self.assertEqual(page.encoding, "UTF-8")
+        self.assertEqual(embed.text, "embed for post=42&nume=1")
+        self.assertGreaterEqual(elapsed, 0.05)
+    
+    def test_sync_record_saves_decoded_body(self):
+        live = requests.Response()
+        live.status_code = 200
+        live.headers = requests.structures.CaseInsensitiveDict({"Content-Encoding": "gzip", "ETag": '"v2"'})
+        live._content = PAGE.encode("utf-8")
+        adapter = RecordReplayAdapter(self.store, RECORD)
+        
+        with mock.patch("requests.adapters.HTTPAdapter.send", return_value=live):
+            requests_session(adapter).get("https://example.com/anime-movie/")
+        
+        fixture = self.store.load("GET", "https://example.com/anime-movie/", None)
+        self.assertEqual(fixture["body"], PAGE.encode("utf-8"))
+        self.assertEqual(fixture["headers"], {"ETag": '"v2"'})
+
+
+if __name__ == '__main__':
+    unittest.main()